@@ -0,0 +1,86 @@
+"""Disk footprint vs read latency of LINEAR16 clips stored with each cache compression.
+
+Clips are synthetic speech-like PCM (24 kHz mono, harmonics under a syllable
+envelope, low-level noise and pauses), so ratios are indicative only. Reads go
+to disk every time (memory tier disabled) and include decompression.
+
+Usage: python benchmarks/bench_cache_compression.py [clips] [seconds_per_clip]
+"""
+
+from __future__ import annotations
+
+import math
+from pathlib import Path
+import random
+import struct
+import sys
+import tempfile
+import time
+
+from routinenotifier.cache import CACHE_COMPRESSIONS, CachingSynthesizer
+
+_RATE = 24000
+
+
+def _wav(seconds: float, seed: int) -> bytes:
+    rng = random.Random(seed)
+    n = int(seconds * _RATE)
+    f0 = rng.uniform(100.0, 220.0)
+    samples = []
+    for i in range(n):
+        t = i / _RATE
+        syllable = (t * 4.0) % 1.0
+        envelope = math.sin(math.pi * syllable) if syllable < 0.7 else 0.0
+        voice = sum(math.sin(2 * math.pi * f0 * k * t) / k for k in range(1, 6))
+        s = 6000 * envelope * voice + rng.gauss(0.0, 40.0)
+        samples.append(max(-32768, min(32767, int(s))))
+    pcm = struct.pack(f"<{n}h", *samples)
+    header = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        *(b"RIFF", 36 + len(pcm), b"WAVE", b"fmt ", 16, 1, 1, _RATE, _RATE * 2, 2, 16),
+        *(b"data", len(pcm)),
+    )
+    return header + pcm
+
+
+class _Fixed:
+    def __init__(self, clips: dict[str, bytes]) -> None:
+        self.clips = clips
+
+    def synthesize(self, text: str, **kwargs: object) -> bytes:
+        return self.clips[text]
+
+
+def main(argv: list[str]) -> None:
+    count = int(argv[0]) if argv else 20
+    seconds = float(argv[1]) if len(argv) > 1 else 3.0
+    clips = {f"message {i}": _wav(seconds, i) for i in range(count)}
+    raw = sum(len(c) for c in clips.values())
+    print(f"clips={count} x {seconds:.1f}s LINEAR16, {raw / 1024 / 1024:.1f} MiB raw")
+    print(f"{'compression':<12}{'on disk':>12}{'ratio':>8}{'write ms':>10}{'read ms':>10}")
+    for compression in CACHE_COMPRESSIONS:
+        with tempfile.TemporaryDirectory() as d:
+            cache = CachingSynthesizer(
+                _Fixed(clips),  # type: ignore[arg-type]
+                cache_dir=Path(d),
+                compression=compression,
+                memory_max_entries=0,
+            )
+            t0 = time.perf_counter()
+            for text in clips:
+                cache.synthesize(text, audio_encoding="LINEAR16")
+            write = (time.perf_counter() - t0) / count
+            t0 = time.perf_counter()
+            for _ in range(5):
+                for text in clips:
+                    cache.synthesize(text, audio_encoding="LINEAR16")
+            read = (time.perf_counter() - t0) / (5 * count)
+            stats = cache.stats()
+            print(
+                f"{compression:<12}{stats.total_bytes / 1024:>9.0f} KB"
+                f"{stats.compression_ratio:>7.2f}x{write * 1000:>10.2f}{read * 1000:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
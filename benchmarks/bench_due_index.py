@@ -0,0 +1,88 @@
+"""Compare the linear due scan with the schedule table's per-minute index.
+
+The AppConfig column includes building that config's table once, on first lookup.
+
+Usage: python benchmarks/bench_due_index.py [N ...]
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import random
+import sys
+import time
+
+from routinenotifier.config import AppConfig, Schedule, Weekday
+from routinenotifier.scheduler import due_indices
+from routinenotifier.table import ScheduleTable
+
+_DAYS = list(Weekday)
+
+
+def _make_config(n: int, seed: int = 0) -> AppConfig:
+    rng = random.Random(seed)
+    schedules = [
+        Schedule(
+            name=f"s{i}",
+            time=f"{rng.randrange(24):02d}:{rng.randrange(60):02d}",
+            days=rng.sample(_DAYS, rng.randint(1, 7)),
+            message=f"message {i % 500}",
+        )
+        for i in range(n)
+    ]
+    return AppConfig(schedules=schedules)
+
+
+def _linear_due_indices(cfg: AppConfig, *, now: datetime) -> list[int]:
+    wd = _DAYS[now.weekday()]
+    due: list[int] = []
+    for i, s in enumerate(cfg.schedules):
+        if wd not in s.days:
+            continue
+        if s.time.hour == now.hour and s.time.minute == now.minute:
+            due.append(i)
+    return due
+
+
+def bench(n: int, lookups: int = 200) -> None:
+    t0 = time.perf_counter()
+    cfg = _make_config(n)
+    table = ScheduleTable.from_config(cfg)
+    build = time.perf_counter() - t0
+    start = datetime(2024, 1, 1)
+    instants = [start + timedelta(minutes=7 * k) for k in range(lookups)]
+
+    t0 = time.perf_counter()
+    for now in instants:
+        expected = _linear_due_indices(cfg, now=now)
+    linear = (time.perf_counter() - t0) / lookups
+
+    t0 = time.perf_counter()
+    for now in instants:
+        got = due_indices(table, now=now)
+    indexed = (time.perf_counter() - t0) / lookups
+
+    assert got == expected
+
+    # AppConfig callers go through the table cached for that config.
+    t0 = time.perf_counter()
+    for now in instants:
+        got = due_indices(cfg, now=now)
+    via_config = (time.perf_counter() - t0) / lookups
+
+    assert got == expected
+    print(
+        f"n={n:>7}: load+index {build:.2f}s | linear {linear * 1e6:10.1f} us/lookup"
+        f" | indexed {indexed * 1e6:6.2f} us/lookup | x{linear / indexed:,.0f}"
+        f" | AppConfig {via_config * 1e6:6.2f} us/lookup"
+    )
+
+
+def main(argv: list[str]) -> None:
+    sizes = [int(a) for a in argv] or [10_000, 100_000]
+    for n in sizes:
+        bench(n)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
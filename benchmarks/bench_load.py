@@ -0,0 +1,72 @@
+"""Load time and peak memory: load_config (pydantic), load_table (fast path) and a snapshot hit.
+
+Usage: python benchmarks/bench_load.py [N ...]
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import json
+from pathlib import Path
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from routinenotifier.config import load_config
+from routinenotifier.snapshot import load_table_cached
+from routinenotifier.table import load_table
+
+_DAYS = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+
+
+def _write(path: Path, n: int, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    entries = [
+        {
+            "name": f"s{i}",
+            "time": f"{rng.randrange(24):02d}:{rng.randrange(60):02d}",
+            "days": sorted(rng.sample(_DAYS, rng.randint(1, 7)), key=_DAYS.index),
+            "message": f"message {i % 500}",
+        }
+        for i in range(n)
+    ]
+    path.write_text(json.dumps({"schedules": entries}), encoding="utf-8")
+
+
+def _measure(load: Callable[[Path], object], path: Path) -> tuple[float, float]:
+    t0 = time.perf_counter()
+    load(path)
+    elapsed = time.perf_counter() - t0
+    tracemalloc.start()
+    result = load(path)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del result
+    return elapsed, peak / 1024 / 1024
+
+
+def bench(n: int) -> None:
+    with tempfile.TemporaryDirectory() as d:
+        path = Path(d) / "schedule.json"
+        _write(path, n)
+        slow, slow_mb = _measure(load_config, path)
+        fast, fast_mb = _measure(load_table, path)
+        cache = Path(d) / "cache"
+        load_table_cached(path, cache)  # writes the snapshot
+        snap, snap_mb = _measure(lambda p: load_table_cached(p, cache), path)
+        print(
+            f"n={n:>7}: load_config {slow:6.2f}s {slow_mb:7.1f} MiB peak"
+            f" | load_table {fast:6.2f}s {fast_mb:7.1f} MiB peak"
+            f" | snapshot {snap:6.3f}s {snap_mb:7.1f} MiB peak"
+        )
+
+
+def main(argv: list[str]) -> None:
+    for n in [int(a) for a in argv] or [10_000, 100_000]:
+        bench(n)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,71 @@
+"""Schedule reload latency: full load_config vs TableReloader after small edits.
+
+Usage: python benchmarks/bench_reload.py [N ...]
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+import random
+import sys
+import tempfile
+import time
+
+from routinenotifier.config import load_config
+from routinenotifier.table import TableReloader, load_table
+
+_DAYS = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+
+
+def _entries(n: int, seed: int = 0) -> list[dict[str, object]]:
+    rng = random.Random(seed)
+    return [
+        {
+            "name": f"s{i}",
+            "time": f"{rng.randrange(24):02d}:{rng.randrange(60):02d}",
+            "days": rng.sample(_DAYS, rng.randint(1, 7)),
+            "message": f"message {i % 500}",
+        }
+        for i in range(n)
+    ]
+
+
+def _write(path: Path, entries: list[dict[str, object]]) -> None:
+    path.write_text(json.dumps({"schedules": entries}), encoding="utf-8")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def bench(n: int) -> None:
+    with tempfile.TemporaryDirectory() as d:
+        path = Path(d) / "schedule.json"
+        entries = _entries(n)
+        _write(path, entries)
+        t0 = time.perf_counter()
+        load_config(path)
+        full = time.perf_counter() - t0
+        reloader = TableReloader(path, load_table(path))
+
+        timings = []
+        for label, edit in (
+            ("edit one", lambda e: e.__setitem__(n // 2, {**e[n // 2], "message": "edited"})),
+            ("append one", lambda e: e.append({**e[0], "name": "appended"})),
+            ("insert at top", lambda e: e.insert(0, {**e[0], "name": "inserted"})),
+        ):
+            edit(entries)
+            _write(path, entries)
+            t0 = time.perf_counter()
+            reloader.poll()
+            timings.append(f"{label} {(time.perf_counter() - t0) * 1000:7.1f} ms")
+        print(f"n={n:>7}: load_config {full * 1000:7.1f} ms | " + " | ".join(timings))
+
+
+def main(argv: list[str]) -> None:
+    for n in [int(a) for a in argv] or [10_000, 100_000]:
+        bench(n)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,69 @@
+"""CLI startup: wall clock per subcommand and where import time goes (python -X importtime).
+
+Each command runs in a fresh interpreter against a one-entry schedule and a
+temporary cache directory; `validate` is timed with its snapshot in place.
+tests/test_startup.py guards the same commands with a threshold.
+
+Usage: python benchmarks/bench_startup.py [runs] [top]
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def _wall(args: list[str], runs: int) -> float:
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], capture_output=True, check=True)
+        times.append(time.perf_counter() - start)
+    return sorted(times)[len(times) // 2]
+
+
+def _imports(args: list[str]) -> list[tuple[int, int, str]]:
+    """``(self us, cumulative us, module)`` for every import, from -X importtime."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args], capture_output=True, text=True, check=True
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if line.startswith("import time:") and not line.endswith("| imported package"):
+            own, cumulative, name = line.removeprefix("import time:").split("|")
+            if own.strip().isdigit():
+                rows.append((int(own), int(cumulative), name.strip()))
+    return rows
+
+
+def main(argv: list[str]) -> None:
+    runs = int(argv[0]) if argv else 5
+    top = int(argv[1]) if len(argv) > 1 else 5
+    with tempfile.TemporaryDirectory() as d:
+        cfg, cache = Path(d) / "cfg.json", str(Path(d) / "cache")
+        entry = {"name": "a", "time": "07:00", "days": ["mon"], "message": "hi"}
+        cfg.write_text(json.dumps({"schedules": [entry]}), encoding="utf-8")
+        cli = ["-m", "routinenotifier.cli"]
+        commands = {
+            "import typer": ["-c", "import typer"],
+            "--help": [*cli, "--help"],
+            "validate": [*cli, "validate", str(cfg), "--cache-dir", cache],
+            "cache-stats": [*cli, "cache-stats", "--cache-dir", cache, "--json"],
+            "cache-clear": [*cli, "cache-clear", "-y", "--cache-dir", cache],
+        }
+        subprocess.run([sys.executable, *commands["validate"]], capture_output=True, check=True)
+        for label, args in commands.items():
+            wall = _wall(args, runs)
+            rows = _imports(args)
+            slowest = sorted(rows, reverse=True)[:top]
+            print(f"{label:<13} {wall * 1000:6.1f} ms wall, {len(rows)} modules imported")
+            for own, cumulative, name in slowest:
+                print(f"    {own / 1000:6.1f} ms self {cumulative / 1000:6.1f} ms total  {name}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
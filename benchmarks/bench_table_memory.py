@@ -0,0 +1,58 @@
+"""Memory per schedule: AppConfig (pydantic models) vs ScheduleTable, due index included.
+
+Counts what stays allocated once the schedules are loaded (for the table, after
+the first due lookup has built its index), divided by the number of entries.
+
+Usage: python benchmarks/bench_table_memory.py [N ...]
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import gc
+from pathlib import Path
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from bench_load import _write
+
+from routinenotifier.config import AppConfig, load_config
+from routinenotifier.table import ScheduleTable, load_table
+
+
+def _retained(load: Callable[[Path], AppConfig | ScheduleTable], path: Path) -> tuple[float, int]:
+    gc.collect()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    loaded = load(path)
+    if isinstance(loaded, ScheduleTable):
+        loaded.due_at(0, 0)
+    elapsed = time.perf_counter() - t0
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del loaded
+    return elapsed, size
+
+
+def bench(n: int) -> None:
+    with tempfile.TemporaryDirectory() as d:
+        path = Path(d) / "schedule.json"
+        _write(path, n)
+        for label, load in (("AppConfig", load_config), ("ScheduleTable", load_table)):
+            elapsed, size = _retained(load, path)
+            print(
+                f"n={n:>8} {label:<13} {size / 1024 / 1024:8.1f} MiB"
+                f" {size / n:7.1f} B/schedule  (load {elapsed:5.1f}s)"
+            )
+
+
+def main(argv: list[str]) -> None:
+    for n in [int(a) for a in argv] or [1_000_000]:
+        bench(n)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,47 @@
+"""Time to first sound for a long message: one request vs sentence streaming.
+
+A fake synthesizer sleeps ``base_ms + per_char_ms * len(text)`` per request to
+model the TTS round trip; playback is not simulated. "first" is when the first
+clip is ready to hand to the player, "all" when the last one is.
+
+Usage: python benchmarks/bench_time_to_first_sound.py [base_ms] [per_char_ms] [workers]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from routinenotifier.tts import split_sentences, synthesize_stream
+
+MESSAGE = (
+    "おはようございます。今日は九時から定例会議があります。"
+    "資料は共有フォルダに置いてあります。会議室は三階の大会議室です。"
+    "遅れる場合はチャットで連絡してください。よろしくお願いします。"
+)
+
+
+def main(argv: list[str]) -> None:
+    base_sec = (float(argv[0]) if argv else 150.0) / 1000.0
+    per_char_sec = (float(argv[1]) if len(argv) > 1 else 4.0) / 1000.0
+    workers = int(argv[2]) if len(argv) > 2 else 2
+
+    def fetch(text: str) -> bytes:
+        time.sleep(base_sec + per_char_sec * len(text))
+        return text.encode()
+
+    sentences = split_sentences(MESSAGE)
+    print(f"{len(MESSAGE)} chars, {len(sentences)} sentences, {workers} workers")
+    for label, chunks in (("whole message", [MESSAGE]), ("per sentence", sentences)):
+        start = time.perf_counter()
+        first = None
+        for _ in synthesize_stream(fetch, chunks, max_workers=workers):
+            if first is None:
+                first = time.perf_counter() - start
+        total = time.perf_counter() - start
+        assert first is not None
+        print(f"{label:<14} first {first * 1000:7.1f} ms   all {total * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,52 @@
+"""Per-call overhead of GoogleTTS with a fresh client per call vs a reused client.
+
+A local fake client stands in for TextToSpeechClient; its constructor sleeps for
+``--setup-ms`` to model channel setup, auth token fetch and TLS handshake.
+
+Usage: python benchmarks/bench_tts_client.py [calls] [setup_ms]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from typing import Any
+
+from routinenotifier.tts import GoogleTTS
+
+
+class _Response:
+    audio_content = b"\x00" * 1024
+
+
+class FakeClient:
+    def __init__(self, setup_sec: float) -> None:
+        time.sleep(setup_sec)
+
+    def synthesize_speech(self, **kwargs: Any) -> _Response:
+        return _Response()
+
+
+def main(argv: list[str]) -> None:
+    calls = int(argv[0]) if argv else 200
+    setup_sec = (float(argv[1]) if len(argv) > 1 else 5.0) / 1000.0
+
+    # Previous behaviour: a new client (and request params) on every call.
+    t0 = time.perf_counter()
+    for i in range(calls):
+        GoogleTTS(client=FakeClient(setup_sec)).synthesize(f"message {i % 10}")
+    before = (time.perf_counter() - t0) / calls
+
+    tts = GoogleTTS(client_factory=lambda: FakeClient(setup_sec))
+    t0 = time.perf_counter()
+    for i in range(calls):
+        tts.synthesize(f"message {i % 10}")
+    after = (time.perf_counter() - t0) / calls
+
+    print(f"calls={calls} client setup={setup_sec * 1000:.1f} ms")
+    print(f"fresh client per call: {before * 1e6:9.1f} us/call")
+    print(f"reused client:         {after * 1e6:9.1f} us/call")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
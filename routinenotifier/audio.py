@@ -1,12 +1,21 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+import hashlib
+import io
 import os
 from pathlib import Path
 import platform
 import shutil
 import subprocess
 import tempfile
+import threading
+import time
+from typing import IO, Protocol
+import wave
 
 
 def _choose_player(candidates: Iterable[str]) -> str | None:
@@ -27,42 +36,354 @@ def _ext_for_encoding(encoding: str) -> str:
     return ".bin"
 
 
-def play_audio_bytes(audio: bytes, *, encoding: str = "MP3") -> None:
+# Clip bytes in memory, a file on disk (e.g. a cache hit), or an open binary stream.
+AudioSource = bytes | Path | IO[bytes]
+
+
+def _linux_player(ext: str) -> str | None:
+    # Prefer formats: wav->aplay/paplay, mp3->mpg123, ogg->paplay/ffplay
+    if ext == ".wav":
+        return _choose_player(["aplay", "paplay", "ffplay"])
+    if ext == ".mp3":
+        return _choose_player(["mpg123", "ffplay", "paplay"])
+    return _choose_player(["ffplay", "paplay"])
+
+
+def _linux_command(player: str, path: Path | None) -> list[str]:
+    """Command line for ``player``; with ``path`` None it reads the clip from stdin."""
+    if player == "ffplay":
+        return [player, "-nodisp", "-autoexit", str(path) if path is not None else "pipe:0"]
+    if path is not None:
+        return [player, str(path)]
+    # aplay and paplay read stdin when no file is given; mpg123 needs "-"
+    return [player, "-"] if player == "mpg123" else [player]
+
+
+def play_audio(
+    source: AudioSource,
+    *,
+    encoding: str = "MP3",
+    on_spawn: Callable[[float], None] | None = None,
+) -> None:
+    """Play a clip with a per-clip player process (blocks until it exits).
+
+    Paths are handed to the player as-is. On Linux, bytes and streams are piped to
+    the player's stdin; elsewhere they go through a temporary file, which is
+    removed once a blocking player has finished. It is kept when nothing can play
+    it (its path is printed) or the player returns before reading it (macOS
+    ``open``, Windows default handler). ``on_spawn`` receives the seconds taken
+    to start the player process.
+    """
     ext = _ext_for_encoding(encoding)
+    system = platform.system()
+    if system == "Linux":
+        player = _linux_player(ext)
+        if player is not None:
+            if isinstance(source, Path):
+                _run(_linux_command(player, source), on_spawn=on_spawn)
+            elif isinstance(source, bytes):
+                _run(_linux_command(player, None), input=source, on_spawn=on_spawn)
+            else:
+                _run_with_stdin(_linux_command(player, None), source, on_spawn=on_spawn)
+            return
+    if isinstance(source, Path):
+        _play_file(source, system=system, temporary=False, on_spawn=on_spawn)
+        return
     with tempfile.NamedTemporaryFile(delete=False, suffix=ext) as f:
-        f.write(audio)
-        tmp_path = Path(f.name)
+        if isinstance(source, bytes):
+            f.write(source)
+        else:
+            shutil.copyfileobj(source, f)
+    _play_file(Path(f.name), system=system, temporary=True, on_spawn=on_spawn)
 
-    system = platform.system()
+
+def play_audio_bytes(audio: bytes, *, encoding: str = "MP3") -> None:
+    """Play in-memory clip bytes; see ``play_audio``."""
+    play_audio(audio, encoding=encoding)
+
+
+def _run(
+    cmd: list[str],
+    *,
+    input: bytes | None = None,
+    stdin: IO[bytes] | None = None,
+    on_spawn: Callable[[float], None] | None = None,
+) -> None:
+    """Run ``cmd`` to completion like ``subprocess.run``, timing the process start."""
+    start = time.perf_counter()
+    with subprocess.Popen(cmd, stdin=subprocess.PIPE if input is not None else stdin) as proc:
+        if on_spawn is not None:
+            on_spawn(time.perf_counter() - start)
+        proc.communicate(input)
+
+
+def _run_with_stdin(
+    cmd: list[str], stream: IO[bytes], *, on_spawn: Callable[[float], None] | None = None
+) -> None:
+    try:
+        stream.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        _run(cmd, input=stream.read(), on_spawn=on_spawn)
+        return
+    # A real file descriptor is inherited by the player, so nothing is copied here.
+    _run(cmd, stdin=stream, on_spawn=on_spawn)
+
+
+def _play_file(
+    path: Path,
+    *,
+    system: str,
+    temporary: bool,
+    on_spawn: Callable[[float], None] | None = None,
+) -> None:
+    keep = True
     try:
         if system == "Darwin":  # macOS
             player = _choose_player(["afplay", "open"])  # open will use default app
             if player == "afplay":
-                subprocess.run([player, str(tmp_path)], check=False)
+                _run([player, str(path)], on_spawn=on_spawn)
+                keep = False
             elif player == "open":
-                subprocess.run([player, str(tmp_path)], check=False)
+                _run([player, str(path)], on_spawn=on_spawn)
             else:
-                print(f"No audio player found. Saved to {tmp_path}")
+                print(f"No audio player found. Saved to {path}")
         elif system == "Linux":
-            # Prefer formats: wav->aplay/paplay, mp3->mpg123, ogg->paplay/ffplay
-            if ext == ".wav":
-                player = _choose_player(["aplay", "paplay", "ffplay"])
-            elif ext == ".mp3":
-                player = _choose_player(["mpg123", "ffplay", "paplay"])
-            else:
-                player = _choose_player(["ffplay", "paplay"])
-            if player:
-                if player == "ffplay":
-                    subprocess.run([player, "-nodisp", "-autoexit", str(tmp_path)], check=False)
-                else:
-                    subprocess.run([player, str(tmp_path)], check=False)
-            else:
-                print(f"No suitable audio player found. Saved to {tmp_path}")
+            print(f"No suitable audio player found. Saved to {path}")
         elif system == "Windows":
             # Use default handler. This returns immediately.
-            os.startfile(str(tmp_path))  # type: ignore[attr-defined]
+            os.startfile(str(path))  # type: ignore[attr-defined]
         else:
-            print(f"Unsupported OS {system}. Saved to {tmp_path}")
+            print(f"Unsupported OS {system}. Saved to {path}")
     finally:
-        # Do not remove file immediately to ensure player can read it; leave temp file.
-        pass
+        if temporary and not keep:
+            path.unlink(missing_ok=True)
+
+
+class Player(Protocol):
+    """Long-lived playback backend used instead of ``play_audio``."""
+
+    def prepare(self, audio: bytes | Path, *, encoding: str) -> None:
+        """Start any decoding for a clip that is about to be played."""
+        ...
+
+    def play(self, audio: bytes | Path, *, encoding: str) -> None: ...
+
+
+@dataclass(frozen=True)
+class Pcm:
+    """Signed 16-bit little-endian interleaved samples."""
+
+    rate: int
+    channels: int
+    data: bytes
+
+
+def _sink_command(rate: int, channels: int) -> list[str] | None:
+    """Command for a raw PCM sink that reads stdin until closed."""
+    if shutil.which("pacat"):
+        return ["pacat", "--raw", "--format=s16le", f"--rate={rate}", f"--channels={channels}"]
+    if shutil.which("aplay"):
+        return ["aplay", "-q", "-t", "raw", "-f", "S16_LE", "-r", str(rate), "-c", str(channels)]
+    return None
+
+
+def decode_to_pcm(
+    audio: bytes, *, encoding: str, rate: int = 24000, channels: int = 1
+) -> Pcm | None:
+    """Decode a clip to PCM, or return None if no decoder is available.
+
+    16-bit WAV is parsed in-process and keeps its own format; other encodings are
+    decoded (and resampled to ``rate``/``channels``) by ``ffmpeg``.
+    """
+    if encoding.upper() == "LINEAR16":
+        try:
+            with wave.open(io.BytesIO(audio), "rb") as r:
+                if r.getsampwidth() == 2:
+                    return Pcm(r.getframerate(), r.getnchannels(), r.readframes(r.getnframes()))
+        except (wave.Error, EOFError):
+            pass
+    if shutil.which("ffmpeg") is None:
+        return None
+    proc = subprocess.run(
+        ["ffmpeg", "-loglevel", "error", "-i", "pipe:0"]
+        + ["-f", "s16le", "-ac", str(channels), "-ar", str(rate), "pipe:1"],
+        input=audio,
+        capture_output=True,
+        check=False,
+    )
+    if proc.returncode != 0 or not proc.stdout:
+        return None
+    return Pcm(rate, channels, proc.stdout)
+
+
+def concat_wav(clips: Iterable[bytes], *, gap_ms: int = 0) -> bytes:
+    """Join 16-bit WAV clips into one, with ``gap_ms`` of silence between them.
+
+    Raises ValueError unless every clip is 16-bit PCM with the same rate and channels.
+    """
+    params: tuple[int, int] | None = None
+    parts: list[bytes] = []
+    for clip in clips:
+        try:
+            with wave.open(io.BytesIO(clip), "rb") as r:
+                fmt = (r.getframerate(), r.getnchannels())
+                if r.getsampwidth() != 2 or (params is not None and fmt != params):
+                    raise ValueError("Clips to join must be 16-bit PCM in one format")
+                frames = r.readframes(r.getnframes())
+        except (wave.Error, EOFError) as e:
+            raise ValueError(f"Not a WAV clip: {e}") from e
+        if params is not None and gap_ms > 0:
+            parts.append(b"\x00\x00" * fmt[1] * (fmt[0] * gap_ms // 1000))
+        params = fmt
+        parts.append(frames)
+    if params is None:
+        raise ValueError("No clips to join")
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as w:
+        w.setnchannels(params[1])
+        w.setsampwidth(2)
+        w.setframerate(params[0])
+        w.writeframes(b"".join(parts))
+    return buf.getvalue()
+
+
+class StreamingPlayer:
+    """Plays clips through one long-lived raw PCM sink fed over a pipe.
+
+    The sink (``pacat`` or ``aplay`` by default) is started on first use and kept
+    open, so back-to-back clips start without process startup or temp files; it
+    is restarted only when the sample format changes or the process dies.
+    Decoding runs on a small worker pool and recently decoded clips are kept, so
+    ``prepare`` can decode the next clip while the current one plays. Clips that
+    cannot be decoded fall back to ``play_audio``. Clips may be bytes or the path
+    of a cached file; a file evicted before playback is skipped. Thread-safe:
+    concurrent ``play`` calls are serialized.
+    """
+
+    def __init__(
+        self,
+        *,
+        sink_command: Callable[[int, int], list[str] | None] = _sink_command,
+        decode_workers: int = 2,
+        rate: int = 24000,
+        channels: int = 1,
+        max_decoded: int = 32,
+    ) -> None:
+        self.sink_command = sink_command
+        self.rate = rate
+        self.channels = channels
+        self.max_decoded = max_decoded
+        self._pool = ThreadPoolExecutor(
+            max_workers=max(1, decode_workers), thread_name_prefix="rn-decode"
+        )
+        self._decoded: OrderedDict[tuple[bytes, str], Future[Pcm | None]] = OrderedDict()
+        self._decoded_lock = threading.Lock()
+        self._play_lock = threading.Lock()
+        self._sink: subprocess.Popen[bytes] | None = None
+        self._sink_format: tuple[int, int] | None = None
+        self.sink_starts = 0
+
+    @staticmethod
+    def available() -> bool:
+        return _sink_command(24000, 1) is not None
+
+    def prepare(self, audio: bytes | Path, *, encoding: str) -> None:
+        self._decode(audio, encoding)
+
+    def _decode(self, audio: bytes | Path, encoding: str) -> Future[Pcm | None]:
+        if isinstance(audio, Path):
+            try:
+                st = audio.stat()
+            except OSError:
+                gone: Future[Pcm | None] = Future()
+                gone.set_result(None)
+                return gone
+            ident = f"{audio}:{st.st_mtime_ns}:{st.st_size}".encode()
+        else:
+            ident = hashlib.blake2b(audio, digest_size=16).digest()
+        key = (ident, encoding.upper())
+        with self._decoded_lock:
+            fut = self._decoded.get(key)
+            if fut is not None:
+                self._decoded.move_to_end(key)
+                return fut
+            fut = self._pool.submit(self._decode_source, audio, encoding)
+            self._decoded[key] = fut
+            while len(self._decoded) > self.max_decoded:
+                self._decoded.popitem(last=False)
+            return fut
+
+    def _decode_source(self, audio: bytes | Path, encoding: str) -> Pcm | None:
+        data = audio.read_bytes() if isinstance(audio, Path) else audio
+        return decode_to_pcm(data, encoding=encoding, rate=self.rate, channels=self.channels)
+
+    def play(self, audio: bytes | Path, *, encoding: str) -> None:
+        try:
+            pcm = self._decode(audio, encoding).result()
+        except Exception:
+            pcm = None
+        if pcm is not None and self._write(pcm):
+            return
+        if isinstance(audio, Path) and not audio.exists():
+            # Evicted from the cache since it was looked up: no audio left to play.
+            print(f"Cached clip {audio} disappeared before playback; skipped.")
+            return
+        play_audio(audio, encoding=encoding)
+
+    def _write(self, pcm: Pcm) -> bool:
+        with self._play_lock:
+            for _ in range(2):
+                sink = self._sink_for(pcm.rate, pcm.channels)
+                if sink is None or sink.stdin is None:
+                    return False
+                try:
+                    sink.stdin.write(pcm.data)
+                    sink.stdin.flush()
+                    return True
+                except OSError:
+                    # The sink died (device unplugged, server restarted); start a new one.
+                    self._close_sink()
+            return False
+
+    def _sink_for(self, rate: int, channels: int) -> subprocess.Popen[bytes] | None:
+        if self._sink is not None and (
+            self._sink_format != (rate, channels) or self._sink.poll() is not None
+        ):
+            self._close_sink()
+        if self._sink is None:
+            cmd = self.sink_command(rate, channels)
+            if cmd is None:
+                return None
+            try:
+                self._sink = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+            except OSError:
+                return None
+            self._sink_format = (rate, channels)
+            self.sink_starts += 1
+        return self._sink
+
+    def _close_sink(self) -> None:
+        sink, self._sink = self._sink, None
+        if sink is None:
+            return
+        try:
+            if sink.stdin is not None:
+                sink.stdin.close()
+        except OSError:
+            pass
+        try:
+            sink.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            sink.kill()
+
+    def close(self) -> None:
+        """Let the sink drain, then stop it and the decode workers."""
+        with self._play_lock:
+            self._close_sink()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def __enter__(self) -> StreamingPlayer:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
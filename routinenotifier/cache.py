@@ -1,30 +1,38 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from functools import partial
 import hashlib
 import json
+import lzma
 import os
 from pathlib import Path
-import platform
 import tempfile
+import threading
+import time
+import zlib
 
-from .tts import Synthesizer
+from .cache_index import CacheIndex, CacheStats
+from .pack_store import PACK_DIRNAME, PackStore
+from .paths import _default_cache_root
+from .singleflight import LOCKS_DIRNAME, Flight, LockFile, SingleFlight
+from .tts import (
+    AsyncSynthesizer,
+    SynthesisRequest,
+    Synthesizer,
+    _synthesize_request,
+    async_synthesize_batch,
+    split_merged,
+    synthesize_batch,
+)
 
 CACHE_VERSION = "v1"
 
 
-def _default_cache_root() -> Path:
-    system = platform.system()
-    if system == "Windows":
-        win_base = os.environ.get("LOCALAPPDATA") or os.environ.get("TEMP") or str(Path.home())
-        return Path(win_base) / "routinenotifier" / "cache"
-    # POSIX/XDG
-    xdg_base = os.environ.get("XDG_CACHE_HOME")
-    if xdg_base:
-        return Path(xdg_base) / "routinenotifier"
-    return Path.home() / ".cache" / "routinenotifier"
-
-
 def _ext_for_encoding(encoding: str) -> str:
     enc = encoding.upper()
     if enc == "MP3":
@@ -46,6 +54,17 @@ class CacheKey:
     audio_encoding: str
     version: str = CACHE_VERSION
 
+    @staticmethod
+    def from_request(r: SynthesisRequest) -> CacheKey:
+        return CacheKey(
+            text=r.text,
+            language_code=r.language_code,
+            voice_name=r.voice_name,
+            speaking_rate=r.speaking_rate,
+            pitch=r.pitch,
+            audio_encoding=r.audio_encoding,
+        )
+
     def digest(self) -> str:
         payload = {
             "t": self.text,
@@ -59,6 +78,9 @@ class CacheKey:
         b = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
         return hashlib.sha256(b).hexdigest()
 
+    def filename(self) -> str:
+        return f"{self.digest()}{_ext_for_encoding(self.audio_encoding)}"
+
 
 def cache_path_for(key: CacheKey, cache_dir: Path | None = None) -> Path:
     root = cache_dir or _default_cache_root()
@@ -100,9 +122,349 @@ def prune_cache(cache_dir: Path, max_bytes: int) -> None:
                 pass
 
 
-class CachingSynthesizer:
+class FileStore:
+    """One file per clip, named ``<digest><ext>``.
+
+    Clip metadata lives in a CacheIndex so hits and evictions never scan the
+    directory. With ``use_index=False`` it falls back to mtime-based pruning.
+    """
+
+    def __init__(
+        self, cache_dir: Path, *, max_size_bytes: int | None = None, use_index: bool = True
+    ) -> None:
+        self.cache_dir = cache_dir
+        self.max_size_bytes = max_size_bytes
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.index = CacheIndex(cache_dir) if use_index else None
+
+    def path_for(self, key: CacheKey) -> Path:
+        return self.cache_dir / key.filename()
+
+    def contains(self, key: CacheKey) -> bool:
+        return self.path_for(key).exists()
+
+    def get(self, key: CacheKey) -> bytes | None:
+        path = self.path_for(key)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            # Missing or unreadable; caller regenerates
+            return None
+        if self.index is not None:
+            self.index.touch(path.name)
+        else:
+            # touch to update atime/mtime for LRU
+            try:
+                path.touch()
+            except OSError:
+                pass
+        return data
+
+    def put(self, key: CacheKey, data: bytes, *, raw_size: int | None = None) -> None:
+        path = self.path_for(key)
+        tmp = None
+        try:
+            fd, name = tempfile.mkstemp(prefix="rn-", suffix=path.suffix, dir=str(self.cache_dir))
+            os.close(fd)
+            tmp = Path(name)
+            tmp.write_bytes(data)
+            tmp.replace(path)
+        finally:
+            if tmp is not None:
+                try:
+                    tmp.unlink(missing_ok=True)
+                except OSError:
+                    pass
+        if self.index is not None:
+            self.index.record(path.name, len(data), key, raw_size=raw_size)
+
+    def prune(self) -> None:
+        if not self.max_size_bytes or self.max_size_bytes <= 0:
+            return
+        try:
+            if self.index is None:
+                prune_cache(self.cache_dir, self.max_size_bytes)
+                return
+            for name in self.index.evict_to(self.max_size_bytes):
+                (self.cache_dir / name).unlink(missing_ok=True)
+        except Exception:
+            pass
+
+    def clear(self) -> None:
+        if self.index is not None:
+            self.index.clear()
+        for p in self.cache_dir.glob("*"):
+            if p.is_file():
+                p.unlink(missing_ok=True)
+
+
+CACHE_BACKENDS = ("files", "pack")
+CACHE_COMPRESSIONS = ("none", "zlib", "lzma")
+
+# Compressed payloads start with this magic and a codec byte; WAV data starts with "RIFF".
+_COMPRESSED_MAGIC = b"RNZ"
+_CODEC_IDS = {"zlib": 1, "lzma": 2}
+
+
+def _encode_payload(data: bytes, key: CacheKey, compression: str) -> bytes:
+    """Compress LINEAR16 clips at rest; other encodings are already compressed."""
+    if compression == "none" or key.audio_encoding.upper() != "LINEAR16":
+        return data
+    if compression == "zlib":
+        body = zlib.compress(data)
+    else:
+        body = lzma.compress(data)
+    if len(body) + 4 >= len(data):
+        return data
+    return _COMPRESSED_MAGIC + bytes([_CODEC_IDS[compression]]) + body
+
+
+def _decode_payload(stored: bytes | memoryview) -> bytes:
+    """Return the clip bytes for a stored payload, decompressing if needed."""
+    if stored[:3] != _COMPRESSED_MAGIC:
+        return bytes(stored)
+    codec = stored[3]
+    if codec == _CODEC_IDS["zlib"]:
+        return zlib.decompress(stored[4:])
+    if codec == _CODEC_IDS["lzma"]:
+        return lzma.decompress(stored[4:])
+    raise ValueError(f"Unknown cache payload codec: {codec}")
+
+
+def open_store(
+    cache_dir: Path, *, backend: str = "files", max_size_bytes: int | None = None
+) -> FileStore | PackStore:
+    """Open the clip store for ``backend``: one file per clip or a single pack file."""
+    if backend == "files":
+        return FileStore(cache_dir, max_size_bytes=max_size_bytes)
+    if backend == "pack":
+        return PackStore(cache_dir, max_size_bytes=max_size_bytes)
+    raise ValueError(f"Unknown cache backend: {backend} (use {' or '.join(CACHE_BACKENDS)})")
+
+
+def cache_stats(cache_dir: Path, *, backend: str = "files") -> CacheStats:
+    """Read statistics for ``cache_dir`` from its index (rebuilt if missing)."""
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    store = open_store(cache_dir, backend=backend)
+    assert store.index is not None
+    try:
+        return store.index.stats()
+    finally:
+        store.index.close()
+
+
+def clear_cache(cache_dir: Path) -> None:
+    """Remove every cached clip in ``cache_dir`` (both layouts) and reset the indexes."""
+    if not cache_dir.exists():
+        return
+    FileStore(cache_dir).clear()
+    if (cache_dir / PACK_DIRNAME).exists():
+        PackStore(cache_dir).clear()
+
+
+class MemoryLRU:
+    """Bounded in-process LRU of audio bytes keyed by CacheKey.
+
+    Both ``max_entries`` and ``max_bytes`` are enforced; a clip larger than
+    ``max_bytes`` is never kept. Thread-safe.
+    """
+
+    def __init__(self, *, max_entries: int = 128, max_bytes: int = 16 * 1024 * 1024) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.total_bytes = 0
+        self._items: OrderedDict[CacheKey, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: CacheKey) -> bytes | None:
+        with self._lock:
+            data = self._items.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._items
+
+    def put(self, key: CacheKey, data: bytes) -> None:
+        if len(data) > self.max_bytes or self.max_entries <= 0:
+            return
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self.total_bytes -= len(old)
+            self._items[key] = data
+            self.total_bytes += len(data)
+            while len(self._items) > self.max_entries or self.total_bytes > self.max_bytes:
+                _, evicted = self._items.popitem(last=False)
+                self.total_bytes -= len(evicted)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self.total_bytes = 0
+
+
+class _TieredCache:
+    """Memory LRU in front of a clip store; shared by the sync and async wrappers.
+
+    Pack-store hits arrive as zero-copy views and are copied once here, since the
+    synthesizer API returns ``bytes``. With ``compression`` set, LINEAR16 clips are
+    stored zlib/lzma-compressed and decompressed on read; the memory tier always
+    holds playable bytes. Compressed payloads are recognised by a magic header, so
+    changing the setting never invalidates existing entries.
+    """
+
+    def __init__(
+        self,
+        *,
+        cache_dir: Path | None,
+        enabled: bool,
+        max_size_bytes: int | None,
+        memory_max_entries: int,
+        memory_max_bytes: int,
+        backend: str,
+        compression: str,
+    ) -> None:
+        if compression not in CACHE_COMPRESSIONS:
+            raise ValueError(
+                f"Unknown cache compression: {compression} (use {', '.join(CACHE_COMPRESSIONS)})"
+            )
+        self.compression = compression
+        self.cache_dir = cache_dir or _default_cache_root()
+        self.enabled = enabled
+        self.max_size_bytes = max_size_bytes
+        self.store = open_store(self.cache_dir, backend=backend, max_size_bytes=max_size_bytes)
+        self.memory: MemoryLRU | None = None
+        if memory_max_entries > 0 and memory_max_bytes > 0:
+            self.memory = MemoryLRU(max_entries=memory_max_entries, max_bytes=memory_max_bytes)
+        self.lock_dir = self.cache_dir / LOCKS_DIRNAME
+        self._flights: SingleFlight[bytes] = SingleFlight()
+
+    def _get(self, key: CacheKey) -> bytes | None:
+        data = self.memory.get(key) if self.memory is not None else None
+        if data is None:
+            stored = self.store.get(key)
+            data = _decode_payload(stored) if stored is not None else None
+            if data is not None and self.memory is not None:
+                self.memory.put(key, data)
+        if self.store.index is not None:
+            if data is None:
+                self.store.index.count(misses=1)
+            else:
+                self.store.index.count(hits=1, bytes_saved=len(data))
+        return data
+
+    def _put(self, key: CacheKey, data: bytes) -> None:
+        self.store.put(key, _encode_payload(data, key, self.compression), raw_size=len(data))
+        if self.memory is not None:
+            self.memory.put(key, data)
+
+    def _contains(self, key: CacheKey) -> bool:
+        return (self.memory is not None and key in self.memory) or self.store.contains(key)
+
+    def cached_file(self, request: SynthesisRequest) -> Path | None:
+        """Return the cache file holding ``request``'s audio as-is, counting it as a hit.
+
+        Lets callers hand a cache hit straight to a player instead of reading it.
+        Returns None for misses, clips already in the memory tier, compressed
+        clips and the pack backend; use ``synthesize`` for those.
+        """
+        if not self.enabled or not isinstance(self.store, FileStore):
+            return None
+        key = CacheKey.from_request(request)
+        if self.memory is not None and key in self.memory:
+            return None
+        path = self.store.path_for(key)
+        try:
+            with open(path, "rb") as f:
+                if f.read(len(_COMPRESSED_MAGIC)) == _COMPRESSED_MAGIC:
+                    return None
+                size = os.fstat(f.fileno()).st_size
+        except OSError:
+            return None
+        if self.store.index is not None:
+            self.store.index.touch(path.name)
+            self.store.index.count(hits=1, bytes_saved=size)
+        return path
+
+    def _lock_for(self, key: CacheKey) -> LockFile:
+        return LockFile(self.lock_dir / f"{key.digest()}.lock")
+
+    def _recheck(self, key: CacheKey) -> bytes | None:
+        """Read a clip another thread or process stored after our miss (uncounted)."""
+        stored = self.store.get(key)
+        if stored is None:
+            return None
+        data = _decode_payload(stored)
+        if self.memory is not None:
+            self.memory.put(key, data)
+        return data
+
+    def _fill(self, key: CacheKey, produce: Callable[[], bytes]) -> bytes:
+        """Produce and store the clip for a missed ``key`` once across threads and processes.
+
+        Concurrent misses in this process wait on one in-flight call; other
+        processes sharing the cache directory wait on ``.locks/<digest>.lock`` and
+        then read the stored clip instead of calling the API themselves.
+        """
+        return self._flights.do(key.digest(), lambda: self._fill_locked(key, produce))
+
+    def _fill_locked(self, key: CacheKey, produce: Callable[[], bytes]) -> bytes:
+        lock = self._lock_for(key)
+        lock.wait(lambda: self.store.contains(key))
+        try:
+            data = self._recheck(key)
+            if data is None:
+                data = produce()
+                self._put(key, data)
+                self.store.prune()
+            return data
+        finally:
+            lock.release()
+
+    def stats(self) -> CacheStats:
+        """Disk statistics from the cache index plus this process's memory tier."""
+        if self.store.index is None:
+            raise RuntimeError("cache statistics require the cache index")
+        stats = self.store.index.stats()
+        if self.memory is not None:
+            stats.memory = {
+                "entries": len(self.memory),
+                "bytes": self.memory.total_bytes,
+                "hits": self.memory.hits,
+                "misses": self.memory.misses,
+                "evictions": self.memory.evictions,
+            }
+        return stats
+
+
+class CachingSynthesizer(_TieredCache):
     """Wraps a Synthesizer and caches audio bytes to disk.
 
+    Recently used clips are also kept in a bounded in-memory LRU (disable it with
+    ``memory_max_entries=0``) so repeat fires skip the disk entirely. ``backend``
+    selects the on-disk layout: ``"files"`` (one file per clip) or ``"pack"``;
+    ``compression`` (``"none"``, ``"zlib"`` or ``"lzma"``) shrinks LINEAR16 clips
+    at rest. Concurrent misses for the same key, in this or another process
+    sharing the cache directory, result in a single call to ``inner``.
+
+    With ``derive_variants`` (requires numpy), a LINEAR16 miss whose rate and
+    pitch are close to the canonical render (rate 1.0, pitch 0.0) of the same
+    text and voice is time-stretched/pitch-shifted locally from that render
+    instead of calling the API; the variant is cached under its own key.
+    A LINEAR16 miss for messages joined by ``merge_ssml`` is stitched together
+    from the (cached) individual clips rather than requested as SSML.
     If disabled, passes through directly.
     """
 
@@ -113,12 +475,50 @@ class CachingSynthesizer:
         cache_dir: Path | None = None,
         enabled: bool = True,
         max_size_bytes: int | None = None,
+        memory_max_entries: int = 128,
+        memory_max_bytes: int = 16 * 1024 * 1024,
+        backend: str = "files",
+        compression: str = "none",
+        derive_variants: bool = False,
     ) -> None:
+        super().__init__(
+            cache_dir=cache_dir,
+            enabled=enabled,
+            max_size_bytes=max_size_bytes,
+            memory_max_entries=memory_max_entries,
+            memory_max_bytes=memory_max_bytes,
+            backend=backend,
+            compression=compression,
+        )
         self.inner = inner
-        self.cache_dir = cache_dir or _default_cache_root()
-        self.enabled = enabled
-        self.max_size_bytes = max_size_bytes
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        if derive_variants:
+            from .dsp import require_numpy
+
+            require_numpy()
+        self.derive_variants = derive_variants
+
+    def contains(
+        self,
+        text: str,
+        *,
+        language_code: str = "ja-JP",
+        voice_name: str | None = "ja-JP-Wavenet-A",
+        speaking_rate: float = 1.2,
+        pitch: float = -3.0,
+        audio_encoding: str = "OGG_OPUS",
+    ) -> bool:
+        """Return True if audio for these parameters is already on disk."""
+        if not self.enabled:
+            return False
+        key = CacheKey(
+            text=text,
+            language_code=language_code,
+            voice_name=voice_name,
+            speaking_rate=speaking_rate,
+            pitch=pitch,
+            audio_encoding=audio_encoding,
+        )
+        return self._contains(key)
 
     def synthesize(
         self,
@@ -148,21 +548,265 @@ class CachingSynthesizer:
             pitch=pitch,
             audio_encoding=audio_encoding,
         )
-        path = cache_path_for(key, self.cache_dir)
-        if path.exists():
+        cached = self._get(key)
+        if cached is not None:
+            return cached
+
+        base = _canonical_key(key) if self.derive_variants else None
+        if base is not None:
+            return self._fill(key, partial(self._derive, key, base))
+        merged = _merged_parts(key)
+        if merged is not None:
+            return self._fill(key, partial(self._merge, key, *merged))
+        return self._fill(
+            key,
+            lambda: self.inner.synthesize(
+                text,
+                language_code=language_code,
+                voice_name=voice_name,
+                speaking_rate=speaking_rate,
+                pitch=pitch,
+                audio_encoding=audio_encoding,
+            ),
+        )
+
+    def synthesize_many(
+        self, items: Sequence[SynthesisRequest], *, max_workers: int = 4
+    ) -> list[bytes]:
+        """Serve cache hits directly and synthesize distinct misses concurrently.
+
+        Misses already in flight elsewhere (another thread, or another process
+        holding the digest's lock file) are waited on rather than requested twice.
+        """
+        if not self.enabled:
+            return synthesize_batch(self.inner, items, max_workers=max_workers)
+
+        found, misses, digests = _lookup_many(self._get, items)
+        if misses and self.derive_variants:
+            self._derive_many(misses, found, max_workers=max_workers)
+        merges = {d: m for d, (_, k) in misses.items() if (m := _merged_parts(k)) is not None}
+        for digest, (texts, break_ms) in merges.items():
+            key = misses.pop(digest)[1]
+            merge = partial(self._merge, key, texts, break_ms, max_workers=max_workers)
+            found[digest] = self._fill(key, merge)
+        if misses:
+            self._fill_many(misses, found, max_workers=max_workers)
+        return [found[d] for d in digests]
+
+    def _derive(self, key: CacheKey, base: CacheKey) -> bytes:
+        from .dsp import render_variant
+
+        canonical = self.synthesize(
+            base.text,
+            language_code=base.language_code,
+            voice_name=base.voice_name,
+            speaking_rate=base.speaking_rate,
+            pitch=base.pitch,
+            audio_encoding=base.audio_encoding,
+        )
+        return render_variant(
+            canonical,
+            rate_factor=key.speaking_rate / base.speaking_rate,
+            semitones=key.pitch - base.pitch,
+        )
+
+    def _merge(
+        self, key: CacheKey, texts: list[str], break_ms: int, *, max_workers: int = 4
+    ) -> bytes:
+        from .audio import concat_wav
+
+        request = SynthesisRequest(
+            key.text,
+            language_code=key.language_code,
+            voice_name=key.voice_name,
+            speaking_rate=key.speaking_rate,
+            pitch=key.pitch,
+            audio_encoding=key.audio_encoding,
+        )
+        clips = self.synthesize_many(
+            [replace(request, text=t) for t in texts], max_workers=max_workers
+        )
+        try:
+            return concat_wav(clips, gap_ms=break_ms)
+        except ValueError:
+            # Not plain 16-bit WAV: let the API render the SSML instead.
+            return _synthesize_request(self.inner, request)
+
+    def _derive_many(
+        self,
+        misses: dict[str, tuple[SynthesisRequest, CacheKey]],
+        found: dict[str, bytes],
+        *,
+        max_workers: int,
+    ) -> None:
+        """Derive eligible misses locally, fetching their canonical renders in one batch."""
+        bases = {d: b for d, (_, k) in misses.items() if (b := _canonical_key(k)) is not None}
+        if not bases:
+            return
+        self.synthesize_many(
+            [
+                replace(misses[d][0], speaking_rate=b.speaking_rate, pitch=b.pitch)
+                for d, b in bases.items()
+            ],
+            max_workers=max_workers,
+        )
+        for digest, base in bases.items():
+            key = misses.pop(digest)[1]
+            found[digest] = self._fill(key, partial(self._derive, key, base))
+
+    def _fill_many(
+        self,
+        misses: dict[str, tuple[SynthesisRequest, CacheKey]],
+        found: dict[str, bytes],
+        *,
+        max_workers: int,
+    ) -> None:
+        followers: dict[str, Flight[bytes]] = {}
+        led: dict[str, Flight[bytes]] = {}
+        locks: dict[str, LockFile] = {}
+        contended: list[str] = []
+        for digest, (_, key) in misses.items():
+            flight, leader = self._flights.join(digest)
+            if not leader:
+                followers[digest] = flight
+                continue
+            led[digest] = flight
+            lock = self._lock_for(key)
+            if lock.try_acquire():
+                locks[digest] = lock
+            else:
+                contended.append(digest)
+        try:
+            batch: list[str] = []
+            for digest in locks:
+                data = self._recheck(misses[digest][1])
+                if data is None:
+                    batch.append(digest)
+                else:
+                    found[digest] = data
+            if batch:
+                audio = synthesize_batch(
+                    self.inner, [misses[d][0] for d in batch], max_workers=max_workers
+                )
+                for digest, data in zip(batch, audio, strict=True):
+                    self._put(misses[digest][1], data)
+                    found[digest] = data
+                self.store.prune()
+            for digest in locks:
+                self._flights.resolve(digest, led.pop(digest), found[digest])
+        except BaseException as e:
+            for digest, flight in led.items():
+                self._flights.resolve(digest, flight, error=e)
+            raise
+        finally:
+            for lock in locks.values():
+                lock.release()
+        # Held by another process: wait for its result (or take over once it is gone)
+        for digest in contended:
+            r, key = misses[digest]
             try:
-                data = path.read_bytes()
-                # touch to update atime/mtime for LRU
-                try:
-                    path.touch()
-                except OSError:
-                    pass
-                return data
-            except OSError:
-                # Fall through to regenerate
-                pass
+                found[digest] = self._fill_locked(key, partial(_synthesize_request, self.inner, r))
+            except BaseException as e:
+                for d, flight in led.items():
+                    self._flights.resolve(d, flight, error=e)
+                raise
+            self._flights.resolve(digest, led.pop(digest), found[digest])
+        for digest, flight in followers.items():
+            found[digest] = flight.wait()
+
+
+# Variants derived locally stay within this distance of the canonical render.
+_CANONICAL_RATE = 1.0
+_CANONICAL_PITCH = 0.0
+_MAX_DERIVED_RATE_RATIO = 1.25
+_MAX_DERIVED_SEMITONES = 4.0
+
+
+def _canonical_key(key: CacheKey) -> CacheKey | None:
+    """Return the canonical render ``key`` can be derived from, or None if it cannot."""
+    if key.audio_encoding.upper() != "LINEAR16":
+        return None
+    base = replace(key, speaking_rate=_CANONICAL_RATE, pitch=_CANONICAL_PITCH)
+    if base.digest() == key.digest():
+        return None
+    ratio = key.speaking_rate / _CANONICAL_RATE
+    if not 1 / _MAX_DERIVED_RATE_RATIO <= ratio <= _MAX_DERIVED_RATE_RATIO:
+        return None
+    if abs(key.pitch - _CANONICAL_PITCH) > _MAX_DERIVED_SEMITONES:
+        return None
+    return base
+
+
+def _merged_parts(key: CacheKey) -> tuple[list[str], int] | None:
+    """Messages and pause of a merged LINEAR16 key, if it can be joined locally."""
+    if key.audio_encoding.upper() != "LINEAR16":
+        return None
+    parts = split_merged(key.text)
+    return parts if parts is not None and len(parts[0]) > 1 else None
 
-        data = self.inner.synthesize(
+
+def _lookup_many(
+    get: Callable[[CacheKey], bytes | None], items: Sequence[SynthesisRequest]
+) -> tuple[dict[str, bytes], dict[str, tuple[SynthesisRequest, CacheKey]], list[str]]:
+    """Split ``items`` into cache hits and distinct misses, keyed by digest."""
+    found: dict[str, bytes] = {}
+    misses: dict[str, tuple[SynthesisRequest, CacheKey]] = {}
+    digests: list[str] = []
+    for r in items:
+        key = CacheKey.from_request(r)
+        digest = key.digest()
+        digests.append(digest)
+        if digest in found or digest in misses:
+            continue
+        cached = get(key)
+        if cached is not None:
+            found[digest] = cached
+        else:
+            misses[digest] = (r, key)
+    return found, misses, digests
+
+
+class AsyncCachingSynthesizer(_TieredCache):
+    """Asyncio counterpart of CachingSynthesizer.
+
+    Disk reads, writes and pruning run in worker threads so the event loop never
+    blocks on file I/O.
+    """
+
+    def __init__(
+        self,
+        inner: AsyncSynthesizer,
+        *,
+        cache_dir: Path | None = None,
+        enabled: bool = True,
+        max_size_bytes: int | None = None,
+        memory_max_entries: int = 128,
+        memory_max_bytes: int = 16 * 1024 * 1024,
+        backend: str = "files",
+        compression: str = "none",
+    ) -> None:
+        super().__init__(
+            cache_dir=cache_dir,
+            enabled=enabled,
+            max_size_bytes=max_size_bytes,
+            memory_max_entries=memory_max_entries,
+            memory_max_bytes=memory_max_bytes,
+            backend=backend,
+            compression=compression,
+        )
+        self.inner = inner
+
+    async def synthesize(
+        self,
+        text: str,
+        *,
+        language_code: str = "ja-JP",
+        voice_name: str | None = "ja-JP-Wavenet-A",
+        speaking_rate: float = 1.2,
+        pitch: float = -3.0,
+        audio_encoding: str = "OGG_OPUS",
+    ) -> bytes:
+        request = SynthesisRequest(
             text,
             language_code=language_code,
             voice_name=voice_name,
@@ -170,24 +814,80 @@ class CachingSynthesizer:
             pitch=pitch,
             audio_encoding=audio_encoding,
         )
+        return (await self.synthesize_many([request]))[0]
 
-        tmp = None
+    async def synthesize_many(
+        self, items: Sequence[SynthesisRequest], *, max_workers: int = 4
+    ) -> list[bytes]:
+        if not self.enabled:
+            return await async_synthesize_batch(self.inner, items, max_workers=max_workers)
+
+        found, misses, digests = await asyncio.to_thread(_lookup_many, self._get, items)
+        if misses:
+            pending = list(misses.items())
+            audio = await async_synthesize_batch(
+                self.inner, [r for _, (r, _) in pending], max_workers=max_workers
+            )
+            for (digest, (_, key)), data in zip(pending, audio, strict=True):
+                await asyncio.to_thread(self._put, key, data)
+                found[digest] = data
+            await asyncio.to_thread(self.store.prune)
+        return [found[d] for d in digests]
+
+
+@dataclass(frozen=True)
+class WarmResult:
+    text: str
+    seconds: float
+    cached: bool
+    error: str | None = None
+
+
+def warm_cache(
+    synthesizer: CachingSynthesizer,
+    texts: Iterable[str],
+    *,
+    language_code: str = "ja-JP",
+    voice_name: str | None = "ja-JP-Wavenet-A",
+    speaking_rate: float = 1.2,
+    pitch: float = -3.0,
+    audio_encoding: str = "OGG_OPUS",
+    max_workers: int = 4,
+    on_result: Callable[[WarmResult], None] | None = None,
+) -> list[WarmResult]:
+    """Synthesize every distinct text ahead of time so later calls are cache hits.
+
+    At most ``max_workers`` syntheses run concurrently. Failures are reported in
+    the result instead of aborting the whole pass. Results follow input order.
+    """
+    unique = list(dict.fromkeys(texts))
+
+    def warm_one(text: str) -> WarmResult:
+        start = time.perf_counter()
+        cached = synthesizer.contains(
+            text,
+            language_code=language_code,
+            voice_name=voice_name,
+            speaking_rate=speaking_rate,
+            pitch=pitch,
+            audio_encoding=audio_encoding,
+        )
         try:
-            tmp = Path(
-                tempfile.mkstemp(prefix="rn-", suffix=path.suffix, dir=str(self.cache_dir))[1]
+            synthesizer.synthesize(
+                text,
+                language_code=language_code,
+                voice_name=voice_name,
+                speaking_rate=speaking_rate,
+                pitch=pitch,
+                audio_encoding=audio_encoding,
             )
-            Path(tmp).write_bytes(data)
-            Path(tmp).replace(path)
-        finally:
-            if tmp is not None:
-                try:
-                    Path(tmp).unlink(missing_ok=True)
-                except OSError:
-                    pass
+        except Exception as e:
+            result = WarmResult(text, time.perf_counter() - start, cached, error=str(e))
+        else:
+            result = WarmResult(text, time.perf_counter() - start, cached)
+        if on_result is not None:
+            on_result(result)
+        return result
 
-        if self.max_size_bytes and self.max_size_bytes > 0:
-            try:
-                prune_cache(self.cache_dir, self.max_size_bytes)
-            except Exception:
-                pass
-        return data
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        return list(pool.map(warm_one, unique))
@@ -0,0 +1,411 @@
+from __future__ import annotations
+
+import atexit
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+import re
+import sqlite3
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+import weakref
+
+if TYPE_CHECKING:
+    from .cache import CacheKey
+
+INDEX_DIRNAME = ".index"
+INDEX_FILENAME = "index.sqlite3"
+
+# Clip files written by FileStore: <sha256 hex digest><ext>
+_CLIP_NAME = re.compile(r"^[0-9a-f]{64}\.(mp3|wav|ogg|bin)$")
+_ENCODING_FOR_EXT = {"mp3": "MP3", "wav": "LINEAR16", "ogg": "OGG_OPUS"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    name TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    last_access REAL NOT NULL,
+    text TEXT,
+    language_code TEXT,
+    voice_name TEXT,
+    speaking_rate REAL,
+    pitch REAL,
+    audio_encoding TEXT,
+    pack_offset INTEGER,
+    raw_size INTEGER
+);
+CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access);
+CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL);
+INSERT OR IGNORE INTO meta (name, value) VALUES
+    ('total_bytes', 0), ('hits', 0), ('misses', 0), ('evictions', 0), ('bytes_saved', 0),
+    ('pack_generation', 0);
+CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries BEGIN
+    UPDATE meta SET value = value + NEW.size WHERE name = 'total_bytes';
+END;
+CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries BEGIN
+    UPDATE meta SET value = value - OLD.size WHERE name = 'total_bytes';
+END;
+CREATE TRIGGER IF NOT EXISTS entries_resize AFTER UPDATE OF size ON entries BEGIN
+    UPDATE meta SET value = value - OLD.size + NEW.size WHERE name = 'total_bytes';
+END;
+"""
+
+
+# Age buckets for CacheStats.age, by time since last access: (label, upper bound in seconds)
+AGE_BUCKETS: tuple[tuple[str, float], ...] = (
+    ("<1h", 3600.0),
+    ("<1d", 86400.0),
+    ("<7d", 7 * 86400.0),
+    ("<30d", 30 * 86400.0),
+    (">=30d", float("inf")),
+)
+
+# Counter deltas are buffered in memory and written at most this often.
+_COUNTER_FLUSH_SEC = 5.0
+_COUNTERS = ("hits", "misses", "bytes_saved")
+
+
+@dataclass
+class CacheStats:
+    entries: int
+    total_bytes: int
+    hits: int
+    misses: int
+    evictions: int
+    bytes_saved: int
+    by_encoding: dict[str, dict[str, int]] = field(default_factory=dict)
+    by_voice: dict[str, dict[str, int]] = field(default_factory=dict)
+    age: dict[str, int] = field(default_factory=dict)
+    raw_bytes: int = 0
+    memory: dict[str, int] | None = None
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @property
+    def compression_ratio(self) -> float:
+        """Uncompressed over stored bytes (1.0 when nothing is compressed)."""
+        return self.raw_bytes / self.total_bytes if self.total_bytes else 1.0
+
+    def to_dict(self) -> dict[str, Any]:
+        d = asdict(self)
+        d["hit_ratio"] = round(self.hit_ratio, 4)
+        d["compression_ratio"] = round(self.compression_ratio, 4)
+        return d
+
+
+def is_clip_name(name: str) -> bool:
+    return _CLIP_NAME.match(name) is not None
+
+
+# Open indexes, so buffered counters are flushed at exit without keeping them alive.
+_OPEN: weakref.WeakSet[CacheIndex] = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_indexes() -> None:
+    for index in list(_OPEN):
+        index._flush_at_exit()
+
+
+class CacheIndex:
+    """Persistent metadata for the clips in a cache directory.
+
+    Stored as SQLite under ``<cache_dir>/.index/``. Tracks size, creation and
+    last access time plus the cache key of every clip, and keeps a running byte
+    total (maintained by triggers) so eviction pops least-recently-used rows via
+    the ``last_access`` index instead of scanning the directory. A missing index
+    is rebuilt from the clip files on open unless ``scan_dir`` is False, in which
+    case the owner checks ``created`` and repopulates it itself. Safe to share
+    between threads; other processes coordinate through SQLite's own locking.
+
+    Pack-file stores also keep each record's ``pack_offset`` here, together with a
+    ``pack_generation`` counter bumped whenever compaction moves records. Clips
+    compressed at rest record their uncompressed ``raw_size`` next to ``size``.
+    """
+
+    def __init__(self, cache_dir: Path, *, scan_dir: bool = True) -> None:
+        self.cache_dir = cache_dir
+        index_dir = cache_dir / INDEX_DIRNAME
+        index_dir.mkdir(parents=True, exist_ok=True)
+        self.path = index_dir / INDEX_FILENAME
+        existed = self.path.exists()
+        self._lock = threading.Lock()
+        self._pending = dict.fromkeys(_COUNTERS, 0)
+        self._last_flush = time.monotonic()
+        self._conn = sqlite3.connect(
+            str(self.path), timeout=30.0, isolation_level=None, check_same_thread=False
+        )
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+            self._migrate()
+        self.created = not existed
+        if self.created and scan_dir:
+            self.rebuild()
+        _OPEN.add(self)
+
+    def _migrate(self) -> None:
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(entries)")}
+        if "pack_offset" not in columns:
+            self._conn.execute("ALTER TABLE entries ADD COLUMN pack_offset INTEGER")
+        if "raw_size" not in columns:
+            self._conn.execute("ALTER TABLE entries ADD COLUMN raw_size INTEGER")
+
+    def close(self) -> None:
+        _OPEN.discard(self)
+        self.flush()
+        with self._lock:
+            self._conn.close()
+
+    def count(self, *, hits: int = 0, misses: int = 0, bytes_saved: int = 0) -> None:
+        """Add to the persistent hit/miss counters (buffered, see ``flush``)."""
+        with self._lock:
+            self._pending["hits"] += hits
+            self._pending["misses"] += misses
+            self._pending["bytes_saved"] += bytes_saved
+            if time.monotonic() - self._last_flush >= _COUNTER_FLUSH_SEC:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_at_exit(self) -> None:
+        try:
+            self.flush()
+        except sqlite3.Error:
+            pass
+
+    def _flush_locked(self) -> None:
+        self._last_flush = time.monotonic()
+        deltas = [(v, k) for k, v in self._pending.items() if v]
+        if not deltas:
+            return
+        self._conn.executemany("UPDATE meta SET value = value + ? WHERE name = ?", deltas)
+        self._pending = dict.fromkeys(_COUNTERS, 0)
+
+    def record(
+        self,
+        name: str,
+        size: int,
+        key: CacheKey | None = None,
+        *,
+        offset: int | None = None,
+        raw_size: int | None = None,
+    ) -> None:
+        now = time.time()
+        fields = (
+            (key.text, key.language_code, key.voice_name, key.speaking_rate, key.pitch)
+            if key is not None
+            else (None, None, None, None, None)
+        )
+        encoding = key.audio_encoding.upper() if key is not None else _encoding_for(name)
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO entries (name, size, created, last_access, text, language_code,"
+                " voice_name, speaking_rate, pitch, audio_encoding, pack_offset, raw_size)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT (name) DO UPDATE SET size = excluded.size,"
+                " last_access = excluded.last_access, pack_offset = excluded.pack_offset,"
+                " raw_size = excluded.raw_size",
+                (name, size, now, now, *fields, encoding, offset, raw_size),
+            )
+
+    def touch(self, name: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE entries SET last_access = ? WHERE name = ?", (time.time(), name)
+            )
+
+    def locate(self, name: str, *, touch: bool = True) -> tuple[int, int, int] | None:
+        """Return ``(pack_offset, size, pack_generation)``, marking the entry used."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT pack_offset, size,"
+                " (SELECT value FROM meta WHERE name = 'pack_generation')"
+                " FROM entries WHERE name = ? AND pack_offset IS NOT NULL",
+                (name,),
+            ).fetchone()
+            if row is None:
+                return None
+            if touch:
+                self._conn.execute(
+                    "UPDATE entries SET last_access = ? WHERE name = ?", (time.time(), name)
+                )
+        return int(row[0]), int(row[1]), int(row[2])
+
+    def key_fields(self, name: str) -> tuple[str | None, ...] | None:
+        """Return the stored ``CacheKey`` fields of ``name`` (None where unknown)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT text, language_code, voice_name, speaking_rate, pitch, audio_encoding"
+                " FROM entries WHERE name = ?",
+                (name,),
+            ).fetchone()
+        return tuple(row) if row is not None else None
+
+    def packed_entries(self) -> list[tuple[str, int, int]]:
+        """Return ``(name, pack_offset, size)`` of packed entries in file order."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT name, pack_offset, size FROM entries"
+                " WHERE pack_offset IS NOT NULL ORDER BY pack_offset"
+            ).fetchall()
+        return [(str(n), int(o), int(z)) for n, o, z in rows]
+
+    def relocate(self, offsets: dict[str, int]) -> int:
+        """Point entries at new pack offsets and bump the pack generation."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "UPDATE entries SET pack_offset = ? WHERE name = ?",
+                    [(o, n) for n, o in offsets.items()],
+                )
+                self._conn.execute(
+                    "UPDATE meta SET value = value + 1 WHERE name = 'pack_generation'"
+                )
+                row = self._conn.execute(
+                    "SELECT value FROM meta WHERE name = 'pack_generation'"
+                ).fetchone()
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return int(row[0])
+
+    def remove(self, name: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE name = ?", (name,))
+
+    def __len__(self) -> int:
+        with self._lock:
+            row = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()
+        return int(row[0])
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            return self._total_bytes()
+
+    def _total_bytes(self) -> int:
+        row = self._conn.execute("SELECT value FROM meta WHERE name = 'total_bytes'").fetchone()
+        return int(row[0])
+
+    def evict_to(self, max_bytes: int) -> list[str]:
+        """Drop least-recently-used rows until the total is within ``max_bytes``.
+
+        Returns the evicted names; the caller removes the files.
+        """
+        evicted: list[str] = []
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                total = self._total_bytes()
+                while total > max_bytes:
+                    rows = self._conn.execute(
+                        "SELECT name, size FROM entries ORDER BY last_access LIMIT 32"
+                    ).fetchall()
+                    if not rows:
+                        break
+                    for name, size in rows:
+                        if total <= max_bytes:
+                            break
+                        self._conn.execute("DELETE FROM entries WHERE name = ?", (name,))
+                        evicted.append(name)
+                        total -= size
+                if evicted:
+                    self._conn.execute(
+                        "UPDATE meta SET value = value + ? WHERE name = 'evictions'",
+                        (len(evicted),),
+                    )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return evicted
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+
+    def stats(self) -> CacheStats:
+        """Summarize the index; cost is proportional to rows, not files on disk."""
+        now = time.time()
+        age_case = " ".join(
+            f"WHEN ? - last_access < {bound} THEN '{label}'"
+            for label, bound in AGE_BUCKETS
+            if bound != float("inf")
+        )
+        with self._lock:
+            self._flush_locked()
+            meta = dict(self._conn.execute("SELECT name, value FROM meta").fetchall())
+            entries, total, raw = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0),"
+                " COALESCE(SUM(COALESCE(raw_size, size)), 0) FROM entries"
+            ).fetchone()
+            by_encoding = self._conn.execute(
+                "SELECT COALESCE(audio_encoding, 'unknown'), COUNT(*), SUM(size)"
+                " FROM entries GROUP BY 1 ORDER BY 1"
+            ).fetchall()
+            by_voice = self._conn.execute(
+                "SELECT COALESCE(voice_name, language_code, 'unknown'), COUNT(*), SUM(size)"
+                " FROM entries GROUP BY 1 ORDER BY 1"
+            ).fetchall()
+            ages = self._conn.execute(
+                f"SELECT CASE {age_case} ELSE '{AGE_BUCKETS[-1][0]}' END, COUNT(*)"
+                " FROM entries GROUP BY 1",
+                (now,) * (len(AGE_BUCKETS) - 1),
+            ).fetchall()
+        age = dict.fromkeys((label for label, _ in AGE_BUCKETS), 0)
+        age.update({label: int(n) for label, n in ages})
+        return CacheStats(
+            entries=int(entries),
+            total_bytes=int(total),
+            hits=int(meta.get("hits", 0)),
+            misses=int(meta.get("misses", 0)),
+            evictions=int(meta.get("evictions", 0)),
+            bytes_saved=int(meta.get("bytes_saved", 0)),
+            by_encoding={k: {"entries": int(n), "bytes": int(b)} for k, n, b in by_encoding},
+            by_voice={k: {"entries": int(n), "bytes": int(b)} for k, n, b in by_voice},
+            age=age,
+            raw_bytes=int(raw),
+        )
+
+    def rebuild(self) -> None:
+        """Replace the index contents with the clip files currently on disk."""
+        rows: list[tuple[str, int, float, int | None]] = []
+        for p in self.cache_dir.iterdir():
+            if not is_clip_name(p.name):
+                continue
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+            rows.append((p.name, st.st_size, st.st_mtime, None))
+        self.replace_all(rows)
+
+    def replace_all(self, rows: list[tuple[str, int, float, int | None]]) -> None:
+        """Replace all entries with ``(name, size, mtime, pack_offset)`` rows."""
+        values = [(n, z, t, t, _encoding_for(n), o) for n, z, t, o in rows]
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute("DELETE FROM entries")
+                self._conn.executemany(
+                    "INSERT INTO entries (name, size, created, last_access, audio_encoding,"
+                    " pack_offset) VALUES (?, ?, ?, ?, ?, ?)",
+                    values,
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+
+def _encoding_for(name: str) -> str | None:
+    return _ENCODING_FOR_EXT.get(name.rsplit(".", 1)[-1])
@@ -1,37 +1,56 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
 
-from .cache import CachingSynthesizer
-from .config import AppConfig, ConfigError, VoiceConfig, load_config, load_voice_config
-from .scheduler import run_forever
-from .tts import GoogleTTS, Synthesizer, list_voices
+from .errors import ConfigError
 
-app = typer.Typer(help="Routine Notifier: speak scheduled messages via Google TTS")
+# Each command imports what it uses, so `validate` or `cache-clear` do not pay for
+# pydantic, the scheduler or the audio stack (see tests/test_startup.py).
+if TYPE_CHECKING:
+    from .audio import StreamingPlayer
+    from .cache import CachingSynthesizer, WarmResult
+    from .config import VoiceConfig
+    from .metrics import Metrics
+    from .scheduler import PlaybackStats
+    from .table import ScheduleTable
+    from .tts import Synthesizer
 
+app = typer.Typer(help="Routine Notifier: speak scheduled messages via Google TTS")
 
-def _echo_schedules(cfg: AppConfig) -> None:
-    for s in cfg.schedules:
-        hhmm = f"{s.time.hour:02d}:{s.time.minute:02d}"
-        days = ",".join(d.value for d in s.days)
-        typer.echo(f"- {s.name} @ {hhmm} on [{days}]")
 
+def _echo_schedules(table: ScheduleTable) -> None:
+    for i, name in enumerate(table.names):
+        minute = table.minutes[i]
+        days = ",".join(table.day_names(i))
+        typer.echo(f"- {name} @ {minute // 60:02d}:{minute % 60:02d} on [{days}]")
 
-_CONFIG_ARG = typer.Argument(..., exists=True, readable=True, help="Path to JSON config")
 
+def _load_schedules(config: Path, cache_dir: Path | None) -> ScheduleTable:
+    """Load ``config`` through its snapshot in the cache directory; exit 1 if invalid."""
+    from .paths import _default_cache_root
+    from .snapshot import load_table_cached
 
-@app.command()
-def validate(config: Path = _CONFIG_ARG) -> None:
-    """Validate and summarize the config file."""
     try:
-        cfg = load_config(config)
+        return load_table_cached(config, cache_dir or _default_cache_root())
     except ConfigError as e:
         typer.secho(str(e), fg=typer.colors.RED)
         raise typer.Exit(code=1) from e
+
+
+_CONFIG_ARG = typer.Argument(..., exists=True, readable=True, help="Path to JSON config")
+_CACHE_DIR_OPT = typer.Option(None, help="Cache directory (defaults to XDG cache)")
+
+
+@app.command()
+def validate(config: Path = _CONFIG_ARG, cache_dir: Path = _CACHE_DIR_OPT) -> None:
+    """Validate and summarize the config file."""
+    table = _load_schedules(config, cache_dir)
     typer.secho("Config is valid. Schedules:", fg=typer.colors.GREEN)
-    _echo_schedules(cfg)
+    _echo_schedules(table)
 
 
 _CONFIG_OPT = typer.Option(
@@ -46,10 +65,205 @@ _RATE_OPT = typer.Option(1.2, help="Speaking rate for TTS (0.25 - 4.0)")
 _PITCH_OPT = typer.Option(-3.0, help="Pitch in semitones (-20.0..20.0)")
 _ENC_OPT = typer.Option("OGG_OPUS", help="Audio encoding: MP3, LINEAR16, OGG_OPUS")
 _INTERVAL_OPT = typer.Option(1.0, help="Polling interval in seconds")
+_EVENT_DRIVEN_OPT = typer.Option(
+    False, help="Sleep until the next due time instead of polling every interval"
+)
 _NO_CACHE_OPT = typer.Option(False, help="Disable on-disk audio cache")
-_CACHE_DIR_OPT = typer.Option(None, help="Cache directory (defaults to XDG cache)")
 _CACHE_MAX_MB_OPT = typer.Option(200, help="Cache size limit in MB (0 for unlimited)")
+_CACHE_BACKEND_OPT = typer.Option(
+    "files", help="On-disk cache layout: files (one file per clip) or pack (single pack file)"
+)
+_CACHE_COMPRESSION_OPT = typer.Option(
+    "none", help="Compress LINEAR16 clips in the cache: none, zlib or lzma"
+)
+_DERIVE_VARIANTS_OPT = typer.Option(
+    False, help="Derive LINEAR16 rate/pitch variants locally from one canonical render (numpy)"
+)
+_MEM_CACHE_MB_OPT = typer.Option(16, help="In-memory audio cache size in MB (0 disables)")
 _VOICECFG_OPT = typer.Option(None, help="Path to JSON with voice settings (overrides voice flags)")
+_PREWARM_OPT = typer.Option(False, help="Synthesize every message into the cache before starting")
+_CONCURRENCY_OPT = typer.Option(4, help="Maximum concurrent TTS requests")
+_PLAYER_OPT = typer.Option(
+    "spawn",
+    help="Playback: spawn (a player process per clip) or stream (one persistent PCM sink)",
+)
+_STREAM_OPT = typer.Option(
+    False, help="Synthesize long messages sentence by sentence and start playing the first"
+)
+_MERGE_OPT = typer.Option(
+    False,
+    "--merge-same-minute",
+    help="Render announcements due in the same minute as one clip (one request, one player)",
+)
+_POLICY_OPT = typer.Option(
+    "queue", help="When clips pile up: queue (FIFO), drop-stale or priority (by schedule)"
+)
+_MAX_QUEUE_OPT = typer.Option(32, help="Most announcements waiting to play; extras are dropped")
+_STALE_OPT = typer.Option(
+    60.0, help="With drop-stale, skip announcements this many seconds past due"
+)
+_WATCH_OPT = typer.Option(
+    False,
+    help="Reload the schedule file when it changes. It is checked every 2s, so with"
+    " --event-driven the scheduler wakes that often instead of once per announcement",
+)
+_METRICS_FILE_OPT = typer.Option(
+    None, help="Dump latency histograms here every 15s and on exit (.json, else Prometheus text)"
+)
+_METRICS_PORT_OPT = typer.Option(
+    None, help="Serve latency histograms at http://127.0.0.1:PORT/metrics (and /metrics.json)"
+)
+_PREFETCH_OPT = typer.Option(
+    5, help="Synthesize messages due within this many minutes in the background (0 disables)"
+)
+
+
+def _resolve_voice(
+    voice_config: Path | None,
+    *,
+    language_code: str,
+    voice_name: str | None,
+    speaking_rate: float,
+    pitch: float,
+    audio_encoding: str,
+) -> VoiceConfig:
+    """Return the effective voice: the JSON file if given, otherwise the flags."""
+    from .config import VoiceConfig, load_voice_config
+
+    if voice_config is not None:
+        try:
+            return load_voice_config(voice_config)
+        except ConfigError as e:
+            typer.secho(str(e), fg=typer.colors.RED)
+            raise typer.Exit(code=1) from e
+    # Flags are passed through as-is, like before voice files existed.
+    return VoiceConfig.model_construct(
+        language_code=language_code,
+        voice_name=voice_name,
+        speaking_rate=speaking_rate,
+        pitch=pitch,
+        audio_encoding=audio_encoding,
+    )
+
+
+def _make_cache(
+    base_tts: Synthesizer,
+    cache_dir: Path | None,
+    cache_max_mb: int,
+    memory_cache_mb: int = 0,
+    backend: str = "files",
+    compression: str = "none",
+    derive_variants: bool = False,
+) -> CachingSynthesizer:
+    from .cache import CachingSynthesizer
+
+    max_bytes = 0 if cache_max_mb <= 0 else int(cache_max_mb * 1024 * 1024)
+    return CachingSynthesizer(
+        base_tts,
+        cache_dir=cache_dir,
+        enabled=True,
+        max_size_bytes=max_bytes,
+        memory_max_bytes=max(0, int(memory_cache_mb * 1024 * 1024)),
+        backend=backend,
+        compression=compression,
+        derive_variants=derive_variants,
+    )
+
+
+def _open_player(kind: str) -> StreamingPlayer | None:
+    """Return the persistent player for ``--player stream``, or None to spawn per clip."""
+    from .audio import StreamingPlayer
+
+    if kind == "spawn":
+        return None
+    if kind != "stream":
+        typer.secho(f"Unknown player: {kind} (use spawn or stream)", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+    if not StreamingPlayer.available():
+        typer.secho(
+            "No raw PCM sink (pacat or aplay) found; spawning a player per clip.",
+            fg=typer.colors.YELLOW,
+        )
+        return None
+    return StreamingPlayer()
+
+
+def _start_metrics(
+    metrics_file: Path | None, metrics_port: int | None
+) -> tuple[Metrics | None, Callable[[], None]]:
+    """Create the metrics registry and its exporters; returns it and a stop function."""
+    if metrics_file is None and metrics_port is None:
+        return None, lambda: None
+    from .metrics import Metrics, serve_metrics, write_periodically
+
+    metrics = Metrics()
+    stops: list[Callable[[], None]] = []
+    if metrics_file is not None:
+        stops.append(write_periodically(metrics, metrics_file))
+    if metrics_port is not None:
+        server = serve_metrics(metrics, metrics_port)
+        stops += [server.shutdown, server.server_close]
+        typer.echo(f"Serving metrics on http://127.0.0.1:{server.server_address[1]}/metrics")
+
+    def stop() -> None:
+        for fn in stops:
+            fn()
+
+    return metrics, stop
+
+
+def _report_playback(stats: PlaybackStats) -> None:
+    if not stats.submitted:
+        return
+    dropped = stats.dropped_stale + stats.dropped_full
+    typer.echo(
+        f"Played {stats.played} of {stats.submitted} announcements"
+        f" ({dropped} dropped, {stats.failed} failed); max queue depth {stats.max_depth},"
+        f" lag mean {stats.mean_lag_sec:.2f}s max {stats.max_lag_sec:.2f}s"
+    )
+
+
+def _warm(
+    table: ScheduleTable,
+    tts: CachingSynthesizer,
+    voice: VoiceConfig,
+    concurrency: int,
+    *,
+    stream_sentences: bool = False,
+    merge_same_minute: bool = False,
+) -> list[WarmResult]:
+    """Fill the cache with what ``run`` will synthesize: sentences or merged clips."""
+    from .cache import warm_cache
+    from .scheduler import announcement_texts
+
+    def report(r: WarmResult) -> None:
+        if r.error is not None:
+            typer.secho(f"  [fail] {r.seconds:7.3f}s {r.text} ({r.error})", fg=typer.colors.RED)
+        else:
+            status = "hit " if r.cached else "miss"
+            typer.echo(f"  [{status}] {r.seconds:7.3f}s {r.text}")
+
+    typer.echo("Warming audio cache...")
+    results = warm_cache(
+        tts,
+        announcement_texts(
+            table, stream_sentences=stream_sentences, merge_same_minute=merge_same_minute
+        ),
+        language_code=voice.language_code,
+        voice_name=voice.voice_name,
+        speaking_rate=voice.speaking_rate,
+        pitch=voice.pitch,
+        audio_encoding=voice.audio_encoding,
+        max_workers=concurrency,
+        on_result=report,
+    )
+    hits = sum(1 for r in results if r.cached and r.error is None)
+    failed = sum(1 for r in results if r.error is not None)
+    typer.echo(
+        f"Warmed {len(results)} messages: {hits} cached, "
+        f"{len(results) - hits - failed} synthesized, {failed} failed."
+    )
+    return results
 
 
 @app.command()
@@ -61,21 +275,49 @@ def run(
     pitch: float = _PITCH_OPT,
     audio_encoding: str = _ENC_OPT,
     check_interval: float = _INTERVAL_OPT,
+    event_driven: bool = _EVENT_DRIVEN_OPT,
     no_cache: bool = _NO_CACHE_OPT,
     cache_dir: Path = _CACHE_DIR_OPT,
     cache_max_mb: int = _CACHE_MAX_MB_OPT,
+    cache_backend: str = _CACHE_BACKEND_OPT,
+    cache_compression: str = _CACHE_COMPRESSION_OPT,
+    derive_variants: bool = _DERIVE_VARIANTS_OPT,
+    memory_cache_mb: int = _MEM_CACHE_MB_OPT,
     voice_config: Path = _VOICECFG_OPT,
+    prewarm: bool = _PREWARM_OPT,
+    concurrency: int = _CONCURRENCY_OPT,
+    prefetch_minutes: int = _PREFETCH_OPT,
+    player: str = _PLAYER_OPT,
+    stream_sentences: bool = _STREAM_OPT,
+    merge_same_minute: bool = _MERGE_OPT,
+    playback_policy: str = _POLICY_OPT,
+    max_queue: int = _MAX_QUEUE_OPT,
+    stale_after: float = _STALE_OPT,
+    metrics_file: Path | None = _METRICS_FILE_OPT,
+    metrics_port: int | None = _METRICS_PORT_OPT,
+    watch: bool = _WATCH_OPT,
 ) -> None:
     """Run the scheduler to speak messages at scheduled times."""
-    try:
-        cfg = load_config(config)
-    except ConfigError as e:
-        typer.secho(str(e), fg=typer.colors.RED)
-        raise typer.Exit(code=1) from e
+    from .cache import CachingSynthesizer
+    from .scheduler import run_forever
+    from .table import TableReloader
+    from .tts import GoogleTTS
+
+    table = _load_schedules(config, cache_dir)
+    # Stamp the file now, so edits made while prewarming are reloaded too.
+    reloader = TableReloader(config, table) if watch else None
 
     typer.secho("Loaded schedules:", fg=typer.colors.BLUE)
-    _echo_schedules(cfg)
-    typer.echo("Starting scheduler. Press Ctrl+C to stop.")
+    _echo_schedules(table)
+
+    voice = _resolve_voice(
+        voice_config,
+        language_code=language_code,
+        voice_name=voice_name,
+        speaking_rate=speaking_rate,
+        pitch=pitch,
+        audio_encoding=audio_encoding,
+    )
 
     try:
         base_tts = GoogleTTS()
@@ -83,40 +325,68 @@ def run(
         if no_cache:
             tts = base_tts
         else:
-            max_bytes = 0 if cache_max_mb <= 0 else int(cache_max_mb * 1024 * 1024)
-            tts = CachingSynthesizer(
-                base_tts, cache_dir=cache_dir, enabled=True, max_size_bytes=max_bytes
+            tts = _make_cache(
+                base_tts,
+                cache_dir,
+                cache_max_mb,
+                memory_cache_mb,
+                backend=cache_backend,
+                compression=cache_compression,
+                derive_variants=derive_variants,
             )
     except Exception as e:  # pragma: no cover - import path
         typer.secho(str(e), fg=typer.colors.RED)
         raise typer.Exit(code=2) from e
 
-    # Load voice settings from file if provided
-    if voice_config is not None:
-        try:
-            vcfg: VoiceConfig = load_voice_config(voice_config)
-        except ConfigError as e:
-            typer.secho(str(e), fg=typer.colors.RED)
-            raise typer.Exit(code=1) from e
-        language_code = vcfg.language_code
-        voice_name = vcfg.voice_name
-        speaking_rate = vcfg.speaking_rate
-        pitch = vcfg.pitch
-        audio_encoding = vcfg.audio_encoding
+    if prewarm:
+        if isinstance(tts, CachingSynthesizer):
+            _warm(
+                table,
+                tts,
+                voice,
+                concurrency,
+                stream_sentences=stream_sentences,
+                merge_same_minute=merge_same_minute,
+            )
+        else:
+            typer.secho("--prewarm has no effect with --no-cache.", fg=typer.colors.YELLOW)
+
+    typer.echo("Starting scheduler. Press Ctrl+C to stop.")
 
+    sink = _open_player(player)
+    metrics, stop_metrics = _start_metrics(metrics_file, metrics_port)
     try:
         run_forever(
-            cfg,
+            table,
             tts,
-            language_code=language_code,
-            voice_name=voice_name,
-            speaking_rate=speaking_rate,
-            pitch=pitch,
-            audio_encoding=audio_encoding,
+            language_code=voice.language_code,
+            voice_name=voice.voice_name,
+            speaking_rate=voice.speaking_rate,
+            pitch=voice.pitch,
+            audio_encoding=voice.audio_encoding,
             check_interval_sec=check_interval,
+            event_driven=event_driven,
+            prefetch_minutes=prefetch_minutes,
+            max_concurrency=concurrency,
+            player=sink,
+            stream_sentences=stream_sentences,
+            merge_same_minute=merge_same_minute,
+            playback_policy=playback_policy,
+            max_queue=max_queue,
+            stale_sec=stale_after,
+            on_stop=_report_playback,
+            metrics=metrics,
+            reloader=reloader,
         )
+    except ValueError as e:
+        typer.secho(str(e), fg=typer.colors.RED)
+        raise typer.Exit(code=1) from e
     except KeyboardInterrupt:
         typer.echo("Stopped.")
+    finally:
+        stop_metrics()
+        if sink is not None:
+            sink.close()
 
 
 @app.command()
@@ -127,6 +397,8 @@ def voices(
     json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
 ) -> None:
     """List available Google TTS voices."""
+    from .tts import list_voices
+
     try:
         voices_list = list_voices(language_code or None)
     except Exception as e:  # pragma: no cover - network/credentials
@@ -170,21 +442,26 @@ def speak(
     no_cache: bool = _NO_CACHE_OPT,
     cache_dir: Path = _CACHE_DIR_OPT,
     cache_max_mb: int = _CACHE_MAX_MB_OPT,
+    cache_backend: str = _CACHE_BACKEND_OPT,
+    cache_compression: str = _CACHE_COMPRESSION_OPT,
+    derive_variants: bool = _DERIVE_VARIANTS_OPT,
     voice_config: Path = _VOICECFG_OPT,
+    player: str = _PLAYER_OPT,
+    stream_sentences: bool = _STREAM_OPT,
 ) -> None:
     """Synthesize and play a single line of text."""
-    # Apply voice config if provided
-    if voice_config is not None:
-        try:
-            vcfg = load_voice_config(voice_config)
-        except ConfigError as e:
-            typer.secho(str(e), fg=typer.colors.RED)
-            raise typer.Exit(code=1) from e
-        language_code = vcfg.language_code
-        voice_name = vcfg.voice_name
-        speaking_rate = vcfg.speaking_rate
-        pitch = vcfg.pitch
-        audio_encoding = vcfg.audio_encoding
+    from .audio import play_audio
+    from .cache import CachingSynthesizer
+    from .tts import GoogleTTS, SynthesisRequest, split_sentences, synthesize_stream
+
+    voice = _resolve_voice(
+        voice_config,
+        language_code=language_code,
+        voice_name=voice_name,
+        speaking_rate=speaking_rate,
+        pitch=pitch,
+        audio_encoding=audio_encoding,
+    )
 
     try:
         base_tts = GoogleTTS()
@@ -192,25 +469,102 @@ def speak(
         if no_cache:
             tts = base_tts
         else:
-            max_bytes = 0 if cache_max_mb <= 0 else int(cache_max_mb * 1024 * 1024)
-            tts = CachingSynthesizer(
-                base_tts, cache_dir=cache_dir, enabled=True, max_size_bytes=max_bytes
+            tts = _make_cache(
+                base_tts,
+                cache_dir,
+                cache_max_mb,
+                backend=cache_backend,
+                compression=cache_compression,
+                derive_variants=derive_variants,
             )
     except Exception as e:  # pragma: no cover - import path
         typer.secho(str(e), fg=typer.colors.RED)
         raise typer.Exit(code=2) from e
 
-    from .audio import play_audio_bytes
+    def fetch(chunk: str) -> bytes | Path:
+        request = SynthesisRequest(
+            chunk,
+            language_code=voice.language_code,
+            voice_name=voice.voice_name,
+            speaking_rate=voice.speaking_rate,
+            pitch=voice.pitch,
+            audio_encoding=voice.audio_encoding,
+        )
+        # A cache hit is played straight from its file; anything else from memory.
+        if isinstance(tts, CachingSynthesizer):
+            path = tts.cached_file(request)
+            if path is not None:
+                return path
+        return tts.synthesize_many([request])[0]
+
+    chunks = (split_sentences(text) or [text]) if stream_sentences else [text]
+    sink = _open_player(player)
+    try:
+        for clip in synthesize_stream(fetch, chunks):
+            if sink is None:
+                play_audio(clip, encoding=voice.audio_encoding)
+            else:
+                sink.play(clip, encoding=voice.audio_encoding)
+    finally:
+        if sink is not None:
+            sink.close()
+
+
+@app.command()
+def warm(
+    config: Path = _CONFIG_OPT,
+    language_code: str = _LANG_OPT,
+    voice_name: str = _VOICE_OPT,
+    speaking_rate: float = _RATE_OPT,
+    pitch: float = _PITCH_OPT,
+    audio_encoding: str = _ENC_OPT,
+    cache_dir: Path = _CACHE_DIR_OPT,
+    cache_max_mb: int = _CACHE_MAX_MB_OPT,
+    cache_backend: str = _CACHE_BACKEND_OPT,
+    cache_compression: str = _CACHE_COMPRESSION_OPT,
+    derive_variants: bool = _DERIVE_VARIANTS_OPT,
+    voice_config: Path = _VOICECFG_OPT,
+    concurrency: int = _CONCURRENCY_OPT,
+    stream_sentences: bool = _STREAM_OPT,
+    merge_same_minute: bool = _MERGE_OPT,
+) -> None:
+    """Pre-synthesize every scheduled message into the audio cache."""
+    from .tts import GoogleTTS
 
-    audio = tts.synthesize(
-        text,
+    table = _load_schedules(config, cache_dir)
+
+    voice = _resolve_voice(
+        voice_config,
         language_code=language_code,
         voice_name=voice_name,
         speaking_rate=speaking_rate,
         pitch=pitch,
         audio_encoding=audio_encoding,
     )
-    play_audio_bytes(audio, encoding=audio_encoding)
+
+    try:
+        tts = _make_cache(
+            GoogleTTS(),
+            cache_dir,
+            cache_max_mb,
+            backend=cache_backend,
+            compression=cache_compression,
+            derive_variants=derive_variants,
+        )
+    except Exception as e:  # pragma: no cover - import path
+        typer.secho(str(e), fg=typer.colors.RED)
+        raise typer.Exit(code=2) from e
+
+    results = _warm(
+        table,
+        tts,
+        voice,
+        concurrency,
+        stream_sentences=stream_sentences,
+        merge_same_minute=merge_same_minute,
+    )
+    if any(r.error is not None for r in results):
+        raise typer.Exit(code=2)
 
 
 @app.command()
@@ -219,7 +573,8 @@ def cache_clear(
     yes: bool = typer.Option(False, "--yes", "-y", help="Confirm deletion without prompt"),
 ) -> None:
     """Clear all cached audio files."""
-    from .cache import _default_cache_root
+    from .cache import clear_cache
+    from .paths import _default_cache_root
 
     target = cache_dir or _default_cache_root()
     if not yes:
@@ -229,11 +584,90 @@ def cache_clear(
             typer.echo("Aborted.")
             return
     try:
-        if target.exists():
-            for p in target.glob("*"):
-                if p.is_file():
-                    p.unlink(missing_ok=True)
+        clear_cache(target)
         typer.secho("Cache cleared.", fg=typer.colors.GREEN)
     except Exception as e:
         typer.secho(f"Failed to clear cache: {e}", fg=typer.colors.RED)
         raise typer.Exit(code=1) from e
+
+
+def _fmt_bytes(n: float) -> str:
+    if n < 1024:
+        return f"{n:.0f} B"
+    for unit in ("KB", "MB"):
+        n /= 1024
+        if n < 1024:
+            return f"{n:.1f} {unit}"
+    return f"{n / 1024:.1f} GB"
+
+
+@app.command()
+def cache_stats(
+    cache_dir: Path = _CACHE_DIR_OPT,
+    cache_backend: str = _CACHE_BACKEND_OPT,
+    json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
+) -> None:
+    """Show cache size, hit/miss counters and breakdowns."""
+    from .cache import cache_stats as read_cache_stats
+    from .paths import _default_cache_root
+
+    target = cache_dir or _default_cache_root()
+    try:
+        stats = read_cache_stats(target, backend=cache_backend)
+    except Exception as e:
+        typer.secho(f"Failed to read cache stats: {e}", fg=typer.colors.RED)
+        raise typer.Exit(code=1) from e
+
+    if json_output:
+        import json as _json
+
+        payload = {"cache_dir": str(target), **stats.to_dict()}
+        typer.echo(_json.dumps(payload, ensure_ascii=False, indent=2))
+        return
+
+    typer.secho(f"Cache: {target}", fg=typer.colors.BLUE)
+    typer.echo(f"Entries: {stats.entries} ({_fmt_bytes(stats.total_bytes)})")
+    if stats.raw_bytes != stats.total_bytes:
+        typer.echo(
+            f"Compression: {stats.compression_ratio:.2f}x"
+            f" ({_fmt_bytes(stats.raw_bytes)} uncompressed)"
+        )
+    typer.echo(
+        f"Hits: {stats.hits}  Misses: {stats.misses}  Hit ratio: {stats.hit_ratio:.1%}"
+        f"  Evictions: {stats.evictions}"
+    )
+    typer.echo(f"Saved from API calls: {_fmt_bytes(stats.bytes_saved)}")
+    for title, groups in (("By encoding", stats.by_encoding), ("By voice", stats.by_voice)):
+        typer.echo(f"{title}:")
+        for name, g in groups.items():
+            typer.echo(f"- {name}: {g['entries']} ({_fmt_bytes(g['bytes'])})")
+    typer.echo("Last access:")
+    for label, n in stats.age.items():
+        typer.echo(f"- {label}: {n}")
+
+
+@app.command()
+def cache_pack(
+    cache_dir: Path = _CACHE_DIR_OPT,
+    keep_files: bool = typer.Option(False, help="Keep per-file clips after importing them"),
+) -> None:
+    """Move per-file clips into the pack store and compact it."""
+    from .pack_store import PackStore
+    from .paths import _default_cache_root
+
+    target = cache_dir or _default_cache_root()
+    try:
+        store = PackStore(target)
+        imported = store.import_files(target, remove=not keep_files)
+        reclaimed = store.compact()
+    except Exception as e:
+        typer.secho(f"Failed to pack cache: {e}", fg=typer.colors.RED)
+        raise typer.Exit(code=1) from e
+    typer.secho(
+        f"Imported {imported} clips; compaction reclaimed {_fmt_bytes(reclaimed)}.",
+        fg=typer.colors.GREEN,
+    )
+
+
+if __name__ == "__main__":
+    app()
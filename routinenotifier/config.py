@@ -10,6 +10,8 @@ from typing import Any
 
 from pydantic import BaseModel, Field, ValidationError, field_validator
 
+from .errors import ConfigError
+
 
 class Weekday(str, Enum):
     mon = "mon"
@@ -21,6 +23,10 @@ class Weekday(str, Enum):
     sun = "sun"
 
 
+# Weekday -> datetime.weekday() number (mon=0 .. sun=6)
+WEEKDAY_INDEX: dict[Weekday, int] = {d: i for i, d in enumerate(Weekday)}
+
+
 def _parse_time(value: str) -> dt.time:
     parts = value.split(":")
     if len(parts) != 2:
@@ -38,6 +44,12 @@ class Schedule(BaseModel):
     time: dt.time = Field(..., description="Time in HH:MM (24h)")
     days: list[Weekday] = Field(..., description="Days to run: mon..sun")
     message: str = Field(..., description="Message to speak")
+    priority: int = Field(
+        default=0,
+        ge=-(2**63),
+        le=2**63 - 1,
+        description="Higher plays first when clips queue up",
+    )
 
     @field_validator("time", mode="before")
     @classmethod
@@ -69,25 +81,32 @@ class AppConfig(BaseModel):
     schedules: list[Schedule]
 
 
-class ConfigError(Exception):
-    pass
-
-
-def load_config(path: Path) -> AppConfig:
+def _read_json(path: Path) -> Any:
     try:
         raw = path.read_text(encoding="utf-8")
     except FileNotFoundError as e:
         raise ConfigError(f"Config file not found: {path}") from e
+    return _parse_json(raw)
+
+
+def _parse_json(raw: str) -> Any:
     try:
-        data = json.loads(raw)
+        return json.loads(raw)
     except json.JSONDecodeError as e:
         raise ConfigError(f"Invalid JSON: {e}") from e
+
+
+def _validate_config(data: Any) -> AppConfig:
     try:
         return AppConfig.model_validate(data)
     except ValidationError as e:
         raise ConfigError(f"Config validation error: {e}") from e
 
 
+def load_config(path: Path) -> AppConfig:
+    return _validate_config(_read_json(path))
+
+
 class VoiceConfig(BaseModel):
     language_code: str = Field(
         default="ja-JP", description="BCP-47 language code like ja-JP or en-US"
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import io
+from typing import Any
+import wave
+
+# WSOLA analysis frame, and how far a frame may slide to line up with the previous one.
+_FRAME_SEC = 0.030
+_TOLERANCE_SEC = 0.010
+
+
+def _numpy() -> Any:
+    try:
+        import numpy
+    except Exception as e:  # pragma: no cover - import-time path
+        raise RuntimeError(
+            "numpy is required to derive rate/pitch variants locally. "
+            "Install it with: pip install 'routinenotifier[dsp]'"
+        ) from e
+    return numpy
+
+
+def require_numpy() -> None:
+    """Raise RuntimeError now if local variant rendering is unavailable."""
+    _numpy()
+
+
+def time_stretch(samples: Any, factor: float, rate: int) -> Any:
+    """Play ``samples`` ``factor`` times faster without changing pitch (WSOLA).
+
+    Overlap-adds Hann-windowed frames taken every ``factor`` output hops, each
+    nudged within a small tolerance to the position that best continues the
+    previous frame, which avoids the phasing of plain overlap-add.
+    """
+    np = _numpy()
+    x = np.asarray(samples, dtype=np.float64)
+    if factor == 1.0 or len(x) == 0:
+        return x
+    frame = max(16, int(_FRAME_SEC * rate)) & ~1
+    hop_out = frame // 2
+    hop_in = hop_out * factor
+    tol = int(_TOLERANCE_SEC * rate)
+    out_len = int(len(x) / factor)
+    n_frames = out_len // hop_out + 1
+    # Pad so every candidate window, including the search margin, is in range.
+    xp = np.concatenate([np.zeros(tol), x, np.zeros(2 * frame + 2 * tol + int(hop_in) + 1)])
+    window = np.hanning(frame)
+    out = np.zeros(n_frames * hop_out + frame)
+    norm = np.zeros_like(out)
+    prev = tol
+    for k in range(n_frames):
+        nominal = tol + int(k * hop_in)
+        if k == 0:
+            pos = nominal
+        else:
+            natural = xp[prev + hop_out : prev + hop_out + frame]
+            region = xp[nominal - tol : nominal + tol + frame]
+            pos = nominal - tol + int(np.argmax(np.correlate(region, natural, mode="valid")))
+        start = k * hop_out
+        out[start : start + frame] += window * xp[pos : pos + frame]
+        norm[start : start + frame] += window
+        prev = pos
+    out /= np.maximum(norm, 1e-3)
+    return out[:out_len]
+
+
+def resample(samples: Any, ratio: float) -> Any:
+    """Linear-interpolation resample reading ``ratio`` input samples per output sample."""
+    np = _numpy()
+    x = np.asarray(samples, dtype=np.float64)
+    if ratio == 1.0 or len(x) == 0:
+        return x
+    positions = np.arange(0.0, len(x) - 1, ratio)
+    return np.interp(positions, np.arange(len(x)), x)
+
+
+def render_variant(wav: bytes, *, rate_factor: float, semitones: float) -> bytes:
+    """Derive a LINEAR16 WAV at ``rate_factor`` x speed and ``semitones`` higher pitch.
+
+    Pitch is shifted by resampling and the duration change that causes is folded
+    into a single time stretch. Only 16-bit PCM is supported; anything else
+    raises ValueError.
+    """
+    np = _numpy()
+    with wave.open(io.BytesIO(wav), "rb") as r:
+        params = r.getparams()
+        frames = r.readframes(params.nframes)
+    if params.sampwidth != 2:
+        raise ValueError(f"Only 16-bit PCM can be post-processed (got {params.sampwidth * 8}-bit)")
+    channels = np.frombuffer(frames, dtype="<i2").reshape(-1, params.nchannels).T
+    pitch_ratio = 2.0 ** (semitones / 12.0)
+    processed = [
+        time_stretch(resample(ch, pitch_ratio), rate_factor / pitch_ratio, params.framerate)
+        for ch in channels
+    ]
+    n = min(len(p) for p in processed)
+    out = np.stack([p[:n] for p in processed], axis=1)
+    pcm = np.clip(np.rint(out), -32768, 32767).astype("<i2").tobytes()
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as w:
+        w.setnchannels(params.nchannels)
+        w.setsampwidth(2)
+        w.setframerate(params.framerate)
+        w.writeframes(pcm)
+    return buf.getvalue()
@@ -0,0 +1,5 @@
+from __future__ import annotations
+
+
+class ConfigError(Exception):
+    """A schedule or voice file that cannot be read or does not validate."""
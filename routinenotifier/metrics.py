@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import math
+import os
+from pathlib import Path
+import tempfile
+import threading
+from typing import Any
+
+# Seconds; spans a sub-millisecond cache hit to a fire that is a minute late.
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+FIRE_LAG = "routinenotifier_fire_lag_seconds"
+SYNTHESIS = "routinenotifier_synthesis_seconds"
+PLAYER_SPAWN = "routinenotifier_player_spawn_seconds"
+PLAYBACK = "routinenotifier_playback_seconds"
+QUEUE_LAG = "routinenotifier_queue_lag_seconds"
+
+_HELP = {
+    FIRE_LAG: "Delay from the scheduled minute to the scheduler noticing it is due",
+    SYNTHESIS: "Time to get an announcement's audio, by source (hit, miss, prefetch)",
+    PLAYER_SPAWN: "Time to start a per-clip player process",
+    PLAYBACK: "Time spent playing one clip, including the player start",
+    QUEUE_LAG: "Delay from the scheduled minute to the start of playback",
+}
+
+
+@dataclass
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus model."""
+
+    buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    counts: list[int] = field(default_factory=list)
+    count: int = 0
+    sum: float = 0.0
+    max: float = 0.0
+
+    def __post_init__(self) -> None:
+        if not self.counts:
+            self.counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def cumulative(self) -> list[tuple[float, int]]:
+        """``(upper bound, observations <= bound)`` pairs ending with ``+Inf``."""
+        out: list[tuple[float, int]] = []
+        total = 0
+        for bound, n in zip((*self.buckets, math.inf), self.counts, strict=True):
+            total += n
+            out.append((bound, total))
+        return out
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the ``q`` quantile (``max`` past the last bound)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        for bound, total in self.cumulative():
+            if total >= rank:
+                return bound if bound != math.inf else self.max
+        return self.max
+
+
+class Metrics:
+    """In-process histograms keyed by metric name and labels. Thread-safe."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._series: dict[tuple[str, tuple[tuple[str, str], ...]], Histogram] = {}
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            hist = self._series.get(key)
+            if hist is None:
+                hist = self._series[key] = Histogram(self.buckets)
+            hist.observe(value)
+
+    def get(self, name: str, **labels: str) -> Histogram | None:
+        with self._lock:
+            return self._series.get((name, tuple(sorted(labels.items()))))
+
+    def to_dict(self) -> dict[str, list[dict[str, Any]]]:
+        out: dict[str, list[dict[str, Any]]] = {}
+        with self._lock:
+            for (name, labels), h in sorted(self._series.items()):
+                out.setdefault(name, []).append(
+                    {
+                        "labels": dict(labels),
+                        "count": h.count,
+                        "sum": h.sum,
+                        "mean": h.sum / h.count if h.count else 0.0,
+                        "max": h.max,
+                        "p50": h.quantile(0.5),
+                        "p95": h.quantile(0.95),
+                        "buckets": {_le(b): n for b, n in h.cumulative()},
+                    }
+                )
+        return out
+
+    def to_prometheus(self) -> str:
+        """Render every series in the Prometheus text exposition format."""
+        lines: list[str] = []
+        seen: set[str] = set()
+        with self._lock:
+            for (name, labels), h in sorted(self._series.items()):
+                if name not in seen:
+                    seen.add(name)
+                    if name in _HELP:
+                        lines.append(f"# HELP {name} {_HELP[name]}")
+                    lines.append(f"# TYPE {name} histogram")
+                for bound, n in h.cumulative():
+                    lines.append(f"{name}_bucket{_labels(labels, le=_le(bound))} {n}")
+                lines.append(f"{name}_sum{_labels(labels)} {h.sum}")
+                lines.append(f"{name}_count{_labels(labels)} {h.count}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: Path) -> None:
+        """Atomically write a snapshot: JSON for ``*.json``, Prometheus text otherwise."""
+        if path.suffix == ".json":
+            text = json.dumps(self.to_dict(), indent=2) + "\n"
+        else:
+            text = self.to_prometheus()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".metrics-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+
+def _le(bound: float) -> str:
+    return "+Inf" if bound == math.inf else repr(bound)
+
+
+def _labels(labels: tuple[tuple[str, str], ...], **extra: str) -> str:
+    pairs = [*labels, *extra.items()]
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{v}"' for k, v in pairs) + "}"
+
+
+def write_periodically(
+    metrics: Metrics, path: Path, *, interval_sec: float = 15.0
+) -> Callable[[], None]:
+    """Dump ``metrics`` to ``path`` every ``interval_sec`` on a daemon thread.
+
+    Returns a function that stops the thread and writes a final snapshot.
+    """
+    stop = threading.Event()
+
+    def loop() -> None:
+        while not stop.wait(interval_sec):
+            try:
+                metrics.write(path)
+            except OSError as e:
+                print(f"Could not write metrics to {path}: {e}")
+
+    thread = threading.Thread(target=loop, name="rn-metrics", daemon=True)
+    thread.start()
+
+    def close() -> None:
+        stop.set()
+        thread.join()
+        metrics.write(path)
+
+    return close
+
+
+def serve_metrics(metrics: Metrics, port: int, *, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """Serve ``/metrics`` (Prometheus text) and ``/metrics.json`` on a daemon thread.
+
+    Call ``shutdown()`` on the returned server to stop it; ``server_address``
+    holds the bound port when ``port`` is 0.
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.path == "/metrics":
+                body, ctype = metrics.to_prometheus(), "text/plain; version=0.0.4"
+            elif self.path == "/metrics.json":
+                body, ctype = json.dumps(metrics.to_dict()), "application/json"
+            else:
+                self.send_error(404)
+                return
+            data = body.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", ctype)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="rn-metrics-http", daemon=True).start()
+    return server
@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+import mmap
+import os
+from pathlib import Path
+import struct
+import threading
+from typing import IO, TYPE_CHECKING
+
+from .cache_index import CacheIndex, is_clip_name
+
+if TYPE_CHECKING:
+    from .cache import CacheKey
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+PACK_DIRNAME = "pack"
+PACK_FILENAME = "audio.pack"
+
+# Record layout: magic, name length, data length, then the clip name and the audio bytes.
+_MAGIC = b"RNPK"
+_HEADER = struct.Struct("<4sHI")
+
+# Compact automatically once dead records take more space than live ones (and at least this).
+_MIN_COMPACT_BYTES = 1024 * 1024
+
+
+class PackStore:
+    """Append-only pack file with an offset index, as an alternative to FileStore.
+
+    All clips live in ``<cache_dir>/pack/audio.pack``; their offsets, sizes and keys
+    are kept in a CacheIndex next to it, so there is one data file regardless of
+    the number of clips. Hits are read through ``mmap`` and returned as zero-copy
+    ``memoryview`` slices. Eviction only drops index rows; ``compact`` rewrites the
+    live records into a fresh file and runs automatically from ``prune`` once dead
+    space outweighs live data. Appends and compaction take an exclusive ``flock``
+    so processes sharing a cache directory do not interleave writes; the file is
+    always replaced, never truncated, so existing maps stay valid.
+    """
+
+    def __init__(self, cache_dir: Path, *, max_size_bytes: int | None = None) -> None:
+        self.cache_dir = cache_dir
+        self.max_size_bytes = max_size_bytes
+        self.root = cache_dir / PACK_DIRNAME
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.path = self.root / PACK_FILENAME
+        self.path.touch(exist_ok=True)
+        self.index = CacheIndex(self.root, scan_dir=False)
+        self._lock = threading.RLock()
+        self._map: mmap.mmap | None = None
+        self._map_generation = -1
+        if self.index.created:
+            self.rebuild_index()
+
+    def contains(self, key: CacheKey) -> bool:
+        return self.index.locate(key.filename(), touch=False) is not None
+
+    def get(self, key: CacheKey) -> memoryview | None:
+        name = key.filename()
+        loc = self.index.locate(name)
+        if loc is None:
+            return None
+        offset, size, generation = loc
+        end = offset + _HEADER.size + len(name) + size
+        with self._lock:
+            m = self._mapped(end, generation)
+        if m is None:
+            return None
+        return _record_data(m, offset, name, size)
+
+    def put(self, key: CacheKey, data: bytes, *, raw_size: int | None = None) -> None:
+        self._append(key.filename(), data, key, raw_size=raw_size)
+
+    def prune(self) -> None:
+        try:
+            if self.max_size_bytes and self.max_size_bytes > 0:
+                self.index.evict_to(self.max_size_bytes)
+            if self.dead_bytes() > max(_MIN_COMPACT_BYTES, self.index.total_bytes()):
+                self.compact()
+        except Exception:
+            pass
+
+    def dead_bytes(self) -> int:
+        """Approximate bytes in the pack file not referenced by the index."""
+        live = self.index.total_bytes() + len(self.index) * (_HEADER.size + 68)
+        try:
+            return max(0, self.path.stat().st_size - live)
+        except OSError:
+            return 0
+
+    def compact(self) -> int:
+        """Rewrite live records into a fresh pack file; returns bytes reclaimed."""
+        with self._lock, self._locked_pack("rb") as f:
+            old_size = os.fstat(f.fileno()).st_size
+            tmp = self.root / f"{PACK_FILENAME}.tmp"
+            offsets: dict[str, int] = {}
+            lost: list[str] = []
+            with open(tmp, "wb") as out:
+                for name, offset, size in self.index.packed_entries():
+                    f.seek(offset)
+                    record = f.read(_HEADER.size + len(name) + size)
+                    if _record_data(record, 0, name, size) is None:
+                        lost.append(name)
+                        continue
+                    offsets[name] = out.tell()
+                    out.write(record)
+                out.flush()
+                os.fsync(out.fileno())
+                new_size = out.tell()
+            os.replace(tmp, self.path)
+            self.index.relocate(offsets)
+            for name in lost:
+                self.index.remove(name)
+            self._map = None
+        return old_size - new_size
+
+    def clear(self) -> None:
+        with self._lock, self._locked_pack("rb"):
+            tmp = self.root / f"{PACK_FILENAME}.tmp"
+            tmp.write_bytes(b"")
+            os.replace(tmp, self.path)
+            self.index.clear()
+            self.index.relocate({})
+            self._map = None
+
+    def import_files(self, source_dir: Path | None = None, *, remove: bool = True) -> int:
+        """Append clips from the per-file layout in ``source_dir``; returns the count.
+
+        Keys recorded in the per-file index are carried over. With ``remove`` the
+        imported files and their index rows are deleted afterwards.
+        """
+        from .cache import CacheKey
+
+        source_dir = source_dir or self.cache_dir
+        files_index = CacheIndex(source_dir)
+        imported = 0
+        try:
+            for p in sorted(source_dir.iterdir()):
+                if not is_clip_name(p.name):
+                    continue
+                try:
+                    data = p.read_bytes()
+                except OSError:
+                    continue
+                fields = files_index.key_fields(p.name)
+                key = None
+                if fields is not None and fields[0] is not None:
+                    key = CacheKey(*fields)  # type: ignore[arg-type]
+                self._append(p.name, data, key)
+                imported += 1
+                if remove:
+                    p.unlink(missing_ok=True)
+                    files_index.remove(p.name)
+        finally:
+            files_index.close()
+        return imported
+
+    def rebuild_index(self) -> None:
+        """Recreate the index by scanning the records in the pack file."""
+        rows: dict[str, tuple[str, int, float, int | None]] = {}
+        with self._lock, open(self.path, "rb") as f:
+            mtime = os.fstat(f.fileno()).st_mtime
+            offset = 0
+            while True:
+                header = f.read(_HEADER.size)
+                if len(header) < _HEADER.size:
+                    break
+                magic, nlen, dlen = _HEADER.unpack(header)
+                if magic != _MAGIC:
+                    break
+                name = f.read(nlen).decode("ascii", errors="replace")
+                f.seek(dlen, os.SEEK_CUR)
+                # Later records for the same name supersede earlier ones.
+                rows[name] = (name, dlen, mtime, offset)
+                offset += _HEADER.size + nlen + dlen
+        self.index.replace_all(list(rows.values()))
+
+    def _append(
+        self, name: str, data: bytes, key: CacheKey | None, *, raw_size: int | None = None
+    ) -> None:
+        encoded = name.encode("ascii")
+        record = _HEADER.pack(_MAGIC, len(encoded), len(data)) + encoded + data
+        with self._lock, self._locked_pack("ab") as f:
+            offset = f.seek(0, os.SEEK_END)
+            f.write(record)
+            f.flush()
+            # Under the same lock, or another process's compaction could move the
+            # record before its offset is indexed.
+            self.index.record(name, len(data), key, offset=offset, raw_size=raw_size)
+
+    def _mapped(self, end: int, generation: int) -> mmap.mmap | None:
+        m = self._map
+        if m is None or generation != self._map_generation or end > len(m):
+            with open(self.path, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return None
+                m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            # Older maps are not closed: views handed out earlier may still use them.
+            self._map = m
+            self._map_generation = generation
+        return m if end <= len(m) else None
+
+    @contextmanager
+    def _locked_pack(self, mode: str) -> Iterator[IO[bytes]]:
+        """Open the current pack file holding an exclusive cross-process lock."""
+        while True:
+            f = open(self.path, mode)
+            if fcntl is None:
+                break
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            # Another process may have replaced the file while we waited.
+            if os.fstat(f.fileno()).st_ino == os.stat(self.path).st_ino:
+                break
+            f.close()
+        try:
+            yield f
+        finally:
+            f.close()
+
+
+def _record_data(buf: bytes | mmap.mmap, offset: int, name: str, size: int) -> memoryview | None:
+    """Return the data of the record at ``offset`` if it is intact and named ``name``."""
+    try:
+        magic, nlen, dlen = _HEADER.unpack_from(buf, offset)
+    except struct.error:
+        return None
+    start = offset + _HEADER.size
+    if magic != _MAGIC or dlen != size or buf[start : start + nlen] != name.encode("ascii"):
+        return None
+    if start + nlen + dlen > len(buf):
+        return None
+    return memoryview(buf)[start + nlen : start + nlen + dlen]
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import platform
+
+
+def _default_cache_root() -> Path:
+    system = platform.system()
+    if system == "Windows":
+        win_base = os.environ.get("LOCALAPPDATA") or os.environ.get("TEMP") or str(Path.home())
+        return Path(win_base) / "routinenotifier" / "cache"
+    # POSIX/XDG
+    xdg_base = os.environ.get("XDG_CACHE_HOME")
+    if xdg_base:
+        return Path(xdg_base) / "routinenotifier"
+    return Path.home() / ".cache" / "routinenotifier"
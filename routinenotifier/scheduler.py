@@ -1,12 +1,32 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import date, datetime
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, replace
+from datetime import date, datetime, timedelta
+from functools import partial
+import heapq
+from pathlib import Path
+import threading
 import time as time_module
+import weakref
 
-from .audio import play_audio_bytes
-from .config import AppConfig, Schedule, Weekday
-from .tts import Synthesizer
+from .audio import Player, play_audio, play_audio_bytes
+from .cache import CachingSynthesizer
+from .config import WEEKDAY_INDEX, AppConfig, ConfigError, Schedule, Weekday
+from .metrics import FIRE_LAG, PLAYBACK, PLAYER_SPAWN, QUEUE_LAG, SYNTHESIS, Metrics
+from .table import ScheduleTable, TableReloader
+from .tts import (
+    AsyncSynthesizer,
+    SynthesisRequest,
+    Synthesizer,
+    async_synthesize_batch,
+    merge_ssml,
+    split_sentences,
+    synthesize_batch,
+    synthesize_stream,
+)
 
 _WEEKDAY_MAP = {
     0: Weekday.mon,
@@ -18,6 +38,10 @@ _WEEKDAY_MAP = {
     6: Weekday.sun,
 }
 
+# Upper bound for a single event-driven sleep so wall-clock adjustments (NTP, DST)
+# are noticed within the hour even when the next fire is days away.
+_MAX_SLEEP_SEC = 3600.0
+
 
 def _today_weekday(now: datetime) -> Weekday:
     return _WEEKDAY_MAP[now.weekday()]
@@ -29,21 +53,392 @@ class _Entry:
     schedule: Schedule
 
 
-def due_indices(cfg: AppConfig, *, now: datetime) -> list[int]:
-    wd = _today_weekday(now)
-    hh = now.hour
-    mm = now.minute
-    due: list[int] = []
-    for i, s in enumerate(cfg.schedules):
-        if wd not in s.days:
+# Tables built for AppConfig arguments: id -> (schedules list, its length, table).
+# Entries go with their config; a replaced or resized ``schedules`` list is rebuilt.
+_CONFIG_TABLES: dict[int, tuple[list[Schedule], int, ScheduleTable]] = {}
+
+
+def _table(cfg: AppConfig | ScheduleTable) -> ScheduleTable:
+    if isinstance(cfg, ScheduleTable):
+        return cfg
+    key = id(cfg)
+    cached = _CONFIG_TABLES.get(key)
+    if cached is None:
+        weakref.finalize(cfg, _CONFIG_TABLES.pop, key, None)
+    elif cached[0] is cfg.schedules and cached[1] == len(cfg.schedules):
+        return cached[2]
+    table = ScheduleTable.from_config(cfg)
+    _CONFIG_TABLES[key] = (cfg.schedules, len(cfg.schedules), table)
+    return table
+
+
+def due_indices(cfg: AppConfig | ScheduleTable, *, now: datetime) -> list[int]:
+    return _table(cfg).due_at(now.weekday(), now.hour * 60 + now.minute)
+
+
+def next_occurrence(s: Schedule, *, after: datetime) -> datetime | None:
+    """Return the first fire instant of ``s`` at or after the minute of ``after``.
+
+    Returns None when the schedule has no days and therefore never fires.
+    """
+    mask = 0
+    for d in s.days:
+        mask |= 1 << WEEKDAY_INDEX[d]
+    return _next_fire(s.time.hour * 60 + s.time.minute, mask, after)
+
+
+def _next_fire(minute: int, mask: int, after: datetime) -> datetime | None:
+    """``next_occurrence`` for a table row: ``minute`` of the day on the days in ``mask``."""
+    base = after.replace(second=0, microsecond=0)
+    for offset in range(8):
+        day = base.date() + timedelta(days=offset)
+        if not mask >> day.weekday() & 1:
             continue
-        if s.time.hour == hh and s.time.minute == mm:
-            due.append(i)
-    return due
+        candidate = datetime.combine(day, datetime.min.time()) + timedelta(minutes=minute)
+        if candidate >= base:
+            return candidate
+    return None
+
+
+class FireQueue:
+    """Min-heap of upcoming fire instants keyed by ``(next_datetime, index)``."""
+
+    def __init__(self, cfg: AppConfig | ScheduleTable, *, now: datetime) -> None:
+        self.table = _table(cfg)
+        self._heap: list[tuple[datetime, int]] = []
+        for i in range(len(self.table)):
+            when = self._next(i, now)
+            if when is not None:
+                self._heap.append((when, i))
+        heapq.heapify(self._heap)
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def _next(self, i: int, after: datetime) -> datetime | None:
+        return _next_fire(self.table.minutes[i], self.table.masks[i], after)
+
+    def next_time(self) -> datetime | None:
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: datetime) -> list[tuple[datetime, int]]:
+        """Pop every entry scheduled at or before ``now``.
+
+        Each popped entry is reinserted with its following occurrence. Returns
+        ``(scheduled_at, index)`` pairs in fire order.
+        """
+        fired: list[tuple[datetime, int]] = []
+        while self._heap and self._heap[0][0] <= now:
+            when, idx = heapq.heappop(self._heap)
+            fired.append((when, idx))
+            following = self._next(idx, when + timedelta(minutes=1))
+            if following is not None:
+                heapq.heappush(self._heap, (following, idx))
+        return fired
+
+    def update(self, remap: dict[int, int], unchanged: set[int], *, now: datetime) -> None:
+        """Follow a reload of the table (see ``ScheduleTable.update``).
+
+        Pending fires of ``unchanged`` entries are kept. Every other entry is
+        rescheduled from ``now``, except that an edited entry (mapped by
+        ``remap``) that already fired this minute does not fire again.
+        """
+        minute = now.replace(second=0, microsecond=0)
+        old_when = {i: when for when, i in self._heap}
+        carried = {j: i for i, j in remap.items()}
+        heap = [(when, remap[i]) for when, i in self._heap if remap.get(i) in unchanged]
+        kept = {j for _, j in heap}
+        for j in range(len(self.table)):
+            if j in kept:
+                continue
+            when = self._next(j, now)
+            if when == minute and j in carried and old_when.get(carried[j]) != minute:
+                when = self._next(j, minute + timedelta(minutes=1))
+            if when is not None:
+                heap.append((when, j))
+        heapq.heapify(heap)
+        self._heap = heap
+
+
+def upcoming_groups(
+    cfg: AppConfig | ScheduleTable, *, now: datetime, minutes: int
+) -> list[list[int]]:
+    """Return the non-empty groups of indices due together in each upcoming minute."""
+    table = _table(cfg)
+    base = now.replace(second=0, microsecond=0)
+    groups: list[list[int]] = []
+    for m in range(minutes + 1):
+        t = base + timedelta(minutes=m)
+        due = table.due_at(t.weekday(), t.hour * 60 + t.minute)
+        if due:
+            groups.append(sorted(due))
+    return groups
+
+
+def upcoming_indices(cfg: AppConfig | ScheduleTable, *, now: datetime, minutes: int) -> list[int]:
+    """Return indices due from the minute of ``now`` through ``minutes`` minutes later."""
+    return [i for group in upcoming_groups(cfg, now=now, minutes=minutes) for i in group]
+
+
+def _units(message: str, stream_sentences: bool) -> list[str]:
+    """The texts ``message`` is synthesized as: its sentences when streaming."""
+    return (split_sentences(message) or [message]) if stream_sentences else [message]
+
+
+def _merged(table: ScheduleTable, idxs: list[int]) -> str:
+    """The single clip text for schedules ``idxs`` due in the same minute."""
+    return merge_ssml([table.message(i) for i in sorted(idxs)])
+
+
+def _minute_groups(table: ScheduleTable) -> list[list[int]]:
+    """Distinct groups of indices due together in some minute of the week."""
+    slots: dict[tuple[int, int], list[int]] = {}
+    for i, (minute, mask) in enumerate(zip(table.minutes, table.masks, strict=True)):
+        for weekday in range(7):
+            if mask >> weekday & 1:
+                slots.setdefault((weekday, minute), []).append(i)
+    return [list(g) for g in dict.fromkeys(tuple(g) for g in slots.values())]
+
+
+def announcement_texts(
+    cfg: AppConfig | ScheduleTable,
+    *,
+    stream_sentences: bool = False,
+    merge_same_minute: bool = False,
+) -> list[str]:
+    """Every distinct text ``run_forever`` synthesizes for ``cfg`` with these options.
+
+    Warming the cache with these makes every announcement a hit.
+    """
+    table = _table(cfg)
+    if merge_same_minute and not stream_sentences:
+        groups = _minute_groups(table)
+        texts = (_merged(table, g) if len(g) > 1 else table.message(g[0]) for g in groups)
+        return list(dict.fromkeys(texts))
+    units = (u for i in range(len(table)) for u in _units(table.message(i), stream_sentences))
+    return list(dict.fromkeys(units))
+
+
+class Prefetcher:
+    """Synthesizes upcoming messages in the background.
+
+    Each ``prefetch`` call hands its new texts to ``synthesize_many`` as one batch
+    on a worker thread. ``get_many`` claims prefetched results (waiting for them
+    if still in flight) and synthesizes the rest inline as a single batch.
+    Results that are not claimed within ``expire_sec`` are dropped. Results may
+    be audio bytes or the cache file holding the audio.
+
+    With ``metrics``, each ``get_many`` records its time under ``source``
+    ``"prefetch"`` when prefetched results were ready, ``"hit"`` when the rest was
+    in the cache (``cached``) and ``"miss"`` when it waited on synthesis.
+    """
+
+    def __init__(
+        self,
+        synthesize_many: Callable[[Sequence[str]], Sequence[bytes | Path]],
+        *,
+        expire_sec: float = 600.0,
+        metrics: Metrics | None = None,
+        cached: Callable[[Sequence[str]], bool] = lambda texts: not texts,
+    ) -> None:
+        self._synthesize_many = synthesize_many
+        self._metrics = metrics
+        self._cached = cached
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rn-pf")
+        self._pending: dict[str, tuple[Future[Sequence[bytes | Path]], int, float]] = {}
+        self._lock = threading.Lock()
+        self.expire_sec = expire_sec
+
+    def prefetch(self, texts: Iterable[str]) -> None:
+        now = time_module.monotonic()
+        with self._lock:
+            for text, (_, _, submitted) in list(self._pending.items()):
+                if now - submitted > self.expire_sec:
+                    del self._pending[text]
+            new = [t for t in dict.fromkeys(texts) if t not in self._pending]
+            if not new:
+                return
+            future = self._pool.submit(self._synthesize_many, new)
+            for i, text in enumerate(new):
+                self._pending[text] = (future, i, now)
+
+    def get_many(self, texts: Sequence[str]) -> list[bytes | Path]:
+        start = time_module.perf_counter()
+        with self._lock:
+            claimed = {t: self._pending.pop(t) for t in texts if t in self._pending}
+        ready = {t for t, (future, _, _) in claimed.items() if future.done()}
+        # Judged before waiting: a prefetch still in flight is a wait on synthesis.
+        rest_cached = self._metrics is not None and self._cached(
+            [t for t in dict.fromkeys(texts) if t not in ready]
+        )
+        results: dict[str, bytes | Path] = {}
+        for text, (future, i, _) in claimed.items():
+            try:
+                results[text] = future.result()[i]
+            except Exception:
+                # Retried inline below; a transient prefetch failure should not drop the fire.
+                ready.discard(text)
+        missing = [t for t in dict.fromkeys(texts) if t not in results]
+        if missing:
+            results.update(zip(missing, self._synthesize_many(missing), strict=True))
+        if self._metrics is not None:
+            source = "miss" if not rest_cached else "prefetch" if ready else "hit"
+            self._metrics.observe(SYNTHESIS, time_module.perf_counter() - start, source=source)
+        return [results[t] for t in texts]
+
+    def get(self, text: str) -> bytes | Path:
+        return self.get_many([text])[0]
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+PLAYBACK_POLICIES = ("queue", "drop-stale", "priority")
+
+
+@dataclass(frozen=True)
+class PlaybackJob:
+    """One announcement waiting for the speaker.
+
+    ``clips`` is called on the playback worker and yields the audio to play, so
+    synthesis that is still running never holds up the timing loop.
+    """
+
+    name: str
+    due: float  # epoch seconds the announcement was scheduled for
+    clips: Callable[[], Iterable[bytes | Path]]
+    priority: int = 0
+
+
+@dataclass
+class PlaybackStats:
+    depth: int = 0
+    max_depth: int = 0
+    submitted: int = 0
+    played: int = 0
+    failed: int = 0
+    dropped_stale: int = 0
+    dropped_full: int = 0
+    last_lag_sec: float = 0.0
+    max_lag_sec: float = 0.0
+    total_lag_sec: float = 0.0
+
+    @property
+    def mean_lag_sec(self) -> float:
+        return self.total_lag_sec / self.played if self.played else 0.0
+
+
+class PlaybackQueue:
+    """Bounded queue of announcements played by a dedicated worker thread.
+
+    ``submit`` never blocks, so firing stays on time however long clips are.
+    ``policy`` picks the order and what is dropped:
+
+    - ``"queue"``: first in, first out.
+    - ``"drop-stale"``: first in, first out, but a job that has waited more than
+      ``stale_sec`` past its due time when it reaches the front is skipped.
+    - ``"priority"``: highest ``PlaybackJob.priority`` first, FIFO within a priority.
+
+    When ``max_size`` jobs are waiting, the job that would play last is dropped.
+    Lag is measured from a job's due time to the start of its playback.
+    """
+
+    def __init__(
+        self,
+        play: Callable[[bytes | Path], None],
+        *,
+        policy: str = "queue",
+        max_size: int = 32,
+        stale_sec: float = 60.0,
+        clock: Callable[[], float] = time_module.time,
+        metrics: Metrics | None = None,
+    ) -> None:
+        if policy not in PLAYBACK_POLICIES:
+            raise ValueError(
+                f"Unknown playback policy: {policy} (use {', '.join(PLAYBACK_POLICIES)})"
+            )
+        self.policy = policy
+        self.max_size = max(1, max_size)
+        self.stale_sec = stale_sec
+        self._play = play
+        self._clock = clock
+        self._metrics = metrics
+        self._heap: list[tuple[tuple[int, int], PlaybackJob]] = []
+        self._seq = 0
+        self._busy = False
+        self._closed = False
+        self._stats = PlaybackStats()
+        self._cond = threading.Condition()
+        self._worker = threading.Thread(target=self._run, name="rn-playback", daemon=True)
+        self._worker.start()
+
+    def submit(self, job: PlaybackJob) -> None:
+        with self._cond:
+            self._seq += 1
+            rank = -job.priority if self.policy == "priority" else 0
+            heapq.heappush(self._heap, ((rank, self._seq), job))
+            self._stats.submitted += 1
+            if len(self._heap) > self.max_size:
+                self._heap.remove(max(self._heap, key=lambda entry: entry[0]))
+                heapq.heapify(self._heap)
+                self._stats.dropped_full += 1
+            self._stats.depth = len(self._heap)
+            self._stats.max_depth = max(self._stats.max_depth, self._stats.depth)
+            self._cond.notify()
+
+    def stats(self) -> PlaybackStats:
+        with self._cond:
+            return replace(self._stats)
+
+    def join(self, timeout: float | None = None) -> bool:
+        """Wait until nothing is queued or playing; returns False on timeout."""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._heap and not self._busy, timeout)
+
+    def close(self) -> None:
+        """Drop queued jobs and stop the worker after the clip that is playing."""
+        with self._cond:
+            self._closed = True
+            self._heap.clear()
+            self._stats.depth = 0
+            self._cond.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._busy = False
+                self._cond.notify_all()
+                self._cond.wait_for(lambda: self._heap or self._closed)
+                if self._closed:
+                    return
+                _, job = heapq.heappop(self._heap)
+                self._stats.depth = len(self._heap)
+                lag = self._clock() - job.due
+                if self.policy == "drop-stale" and lag > self.stale_sec:
+                    self._stats.dropped_stale += 1
+                    continue
+                self._busy = True
+                self._stats.played += 1
+                self._stats.last_lag_sec = lag
+                self._stats.max_lag_sec = max(self._stats.max_lag_sec, lag)
+                self._stats.total_lag_sec += lag
+            if self._metrics is not None:
+                self._metrics.observe(QUEUE_LAG, lag)
+            try:
+                for clip in job.clips():
+                    start = time_module.perf_counter()
+                    self._play(clip)
+                    if self._metrics is not None:
+                        self._metrics.observe(PLAYBACK, time_module.perf_counter() - start)
+            except Exception as e:
+                # A failed synthesis or player must not stop later announcements.
+                print(f"Announcement {job.name!r} failed: {e}")
+                with self._cond:
+                    self._stats.failed += 1
 
 
 def run_forever(
-    cfg: AppConfig,
+    cfg: AppConfig | ScheduleTable,
     synthesizer: Synthesizer,
     *,
     language_code: str = "ja-JP",
@@ -52,33 +447,442 @@ def run_forever(
     pitch: float = 0.0,
     audio_encoding: str = "MP3",
     check_interval_sec: float = 1.0,
+    event_driven: bool = False,
+    prefetch_minutes: int = 0,
+    max_concurrency: int = 4,
+    player: Player | None = None,
+    stream_sentences: bool = False,
+    merge_same_minute: bool = False,
+    playback_policy: str = "queue",
+    max_queue: int = 32,
+    stale_sec: float = 60.0,
+    on_stop: Callable[[PlaybackStats], None] | None = None,
+    metrics: Metrics | None = None,
+    config_path: Path | None = None,
+    reload_interval_sec: float = 2.0,
+    reloader: TableReloader | None = None,
+    clock: Callable[[], datetime] = datetime.now,
+    sleep: Callable[[float], None] = time_module.sleep,
 ) -> None:
     """Run the scheduler loop forever.
 
     Triggers tasks at exact minute matches; avoids re-triggering within the same day.
+    With ``event_driven`` the loop sleeps until the next fire instant instead of
+    polling every ``check_interval_sec``. A positive ``prefetch_minutes`` synthesizes
+    messages due within that window in the background so playback does not wait
+    on the TTS round trip. Schedules due in the same minute are synthesized as one
+    batch with up to ``max_concurrency`` parallel requests. Clips are played with
+    ``player`` (e.g. a StreamingPlayer) if given, else one process per clip.
+    With ``stream_sentences`` each message is synthesized (and cached) sentence by
+    sentence and playback starts as soon as the first sentence is ready.
+    Otherwise ``merge_same_minute`` renders all messages due in one minute as a
+    single clip (see ``merge_ssml``), cached under the combined text.
+
+    Synthesis and playback run off the timing loop: due announcements go to a
+    PlaybackQueue (``playback_policy``, ``max_queue``, ``stale_sec``) whose final
+    statistics are passed to ``on_stop``. With ``metrics``, fire lag, synthesis
+    time (by cache hit, miss or prefetch), player start, playback time and queue
+    lag are recorded as histograms.
+
+    The loop works off a ScheduleTable (``cfg`` itself, or one built from it).
+    With ``config_path``, the file ``cfg`` was loaded from is checked every
+    ``reload_interval_sec`` and re-applied to that table in place when it
+    changes; schedules that survive keep their fired-today state. Event-driven
+    sleeps are then capped at ``reload_interval_sec`` so edits are noticed.
+    Pass a ``reloader`` over ``cfg`` instead to compare against the file as it
+    was when ``cfg`` was loaded, so edits made before the loop starts (e.g.
+    during a prewarm) are picked up too.
+
+    ``clock`` and ``sleep`` stand in for ``datetime.now`` and ``time.sleep``.
     """
+    # Our own table, not the one cached for ``cfg``: reloads patch it in place.
+    table = cfg if isinstance(cfg, ScheduleTable) else ScheduleTable.from_config(cfg)
+    if reloader is None and config_path is not None:
+        reloader = TableReloader(config_path, table)
+    elif reloader is not None and reloader.table is not table:
+        raise ValueError("reloader must watch the table passed as cfg")
+
+    def request(text: str) -> SynthesisRequest:
+        return SynthesisRequest(
+            text,
+            language_code=language_code,
+            voice_name=voice_name,
+            speaking_rate=speaking_rate,
+            pitch=pitch,
+            audio_encoding=audio_encoding,
+        )
+
+    def synthesize_many(texts: Sequence[str]) -> list[bytes]:
+        requests = [request(text) for text in texts]
+        return synthesize_batch(synthesizer, requests, max_workers=max_concurrency)
+
+    def fetch_many(texts: Sequence[str]) -> list[bytes | Path]:
+        # Cache hits on disk go to the player as files, without reading them here.
+        files: dict[str, Path] = {}
+        if isinstance(synthesizer, CachingSynthesizer):
+            for text in dict.fromkeys(texts):
+                path = synthesizer.cached_file(request(text))
+                if path is not None:
+                    files[text] = path
+        missing = [t for t in dict.fromkeys(texts) if t not in files]
+        audio = dict(zip(missing, synthesize_many(missing), strict=True)) if missing else {}
+        return [files[t] if t in files else audio[t] for t in texts]
+
+    def cached(texts: Sequence[str]) -> bool:
+        if not isinstance(synthesizer, CachingSynthesizer):
+            return not texts
+        return all(synthesizer.contains(**asdict(request(t))) for t in texts)
+
+    prefetcher: Prefetcher | None = None
+    if prefetch_minutes > 0:
+        prefetcher = Prefetcher(
+            fetch_many,
+            expire_sec=(prefetch_minutes + 2) * 60.0,
+            metrics=metrics,
+            cached=cached,
+        )
+
+    merging = merge_same_minute and not stream_sentences
+
+    def units(message: str) -> list[str]:
+        return _units(message, stream_sentences)
+
+    def merged(idxs: list[int]) -> str:
+        return _merged(table, idxs)
+
+    def prefetch(now: datetime) -> None:
+        if prefetcher is None:
+            return
+        if merging:
+            groups = upcoming_groups(table, now=now, minutes=prefetch_minutes)
+            prefetcher.prefetch(merged(g) if len(g) > 1 else table.message(g[0]) for g in groups)
+            return
+        idxs = upcoming_indices(table, now=now, minutes=prefetch_minutes)
+        prefetcher.prefetch(u for i in idxs for u in units(table.message(i)))
+
+    def clips_for(texts: list[str]) -> list[bytes | Path]:
+        start = time_module.perf_counter()
+        if prefetcher is not None:
+            return prefetcher.get_many(texts)  # records its own hit/miss/prefetch timing
+        source = "hit" if metrics is not None and cached(texts) else "miss"
+        clips = fetch_many(texts)
+        if metrics is not None:
+            metrics.observe(SYNTHESIS, time_module.perf_counter() - start, source=source)
+        return clips
+
+    def playable(text: str, clip: bytes | Path) -> bytes | Path:
+        # A cache file can be evicted between its lookup (or prefetch) and playback.
+        if isinstance(clip, Path) and not clip.exists():
+            return fetch_many([text])[0]
+        return clip
+
+    def batch_clip(batch: Future[list[bytes | Path]], text: str, k: int) -> list[bytes | Path]:
+        return [playable(text, batch.result()[k])]
+
+    def fetch(text: str) -> bytes | Path:
+        return playable(text, clips_for([text])[0])
+
+    def play(clip: bytes | Path) -> None:
+        if player is not None:
+            player.play(clip, encoding=audio_encoding)
+        elif metrics is not None:
+            play_audio(
+                clip, encoding=audio_encoding, on_spawn=partial(metrics.observe, PLAYER_SPAWN)
+            )
+        else:
+            play_audio(clip, encoding=audio_encoding)
+
+    def prepare(batch: Future[list[bytes | Path]]) -> None:
+        if player is not None and batch.exception() is None:
+            for clip in batch.result():
+                player.prepare(clip, encoding=audio_encoding)
+
+    def stream(message: str) -> Iterable[bytes | Path]:
+        return synthesize_stream(fetch, units(message), max_workers=max_concurrency)
+
+    playback = PlaybackQueue(
+        play,
+        policy=playback_policy,
+        max_size=max_queue,
+        stale_sec=stale_sec,
+        clock=lambda: clock().timestamp(),
+        metrics=metrics,
+    )
+    synth_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="rn-synth")
+
+    def fire(idxs: list[int]) -> None:
+        now = clock()
+        due = now.replace(second=0, microsecond=0).timestamp()
+        if metrics is not None:
+            metrics.observe(FIRE_LAG, now.timestamp() - due)
+        names, priorities = table.names, table.priorities
+        if stream_sentences:
+            for i in idxs:
+                job = partial(stream, table.message(i))
+                playback.submit(PlaybackJob(names[i], due, job, priorities[i]))
+            return
+        if merging and len(idxs) > 1:
+            text = merged(idxs)
+            batch = synth_pool.submit(clips_for, [text])
+            batch.add_done_callback(prepare)
+            name = " + ".join(names[i] for i in sorted(idxs))
+            priority = max(priorities[i] for i in idxs)
+            playback.submit(PlaybackJob(name, due, partial(batch_clip, batch, text, 0), priority))
+            return
+        # One synthesis batch per minute; each job waits for its own clip on the worker.
+        texts = [table.message(i) for i in idxs]
+        batch = synth_pool.submit(clips_for, texts)
+        batch.add_done_callback(prepare)
+        for k, i in enumerate(idxs):
+            clips = partial(batch_clip, batch, texts[k], k)
+            playback.submit(PlaybackJob(names[i], due, clips, priorities[i]))
+
+    checked_at = clock()
+
+    def reload() -> tuple[dict[int, int], set[int]] | None:
+        nonlocal checked_at
+        if reloader is None:
+            return None
+        now = clock()
+        # A clock that jumped backwards counts as due rather than stalling reloads.
+        if 0 <= (now - checked_at).total_seconds() < reload_interval_sec:
+            return None
+        checked_at = now
+        try:
+            update = reloader.poll()
+        except ConfigError as e:
+            print(f"Schedule reload failed; keeping the current schedules. {e}")
+            return None
+        if update is None:
+            return None
+        print(f"Reloaded {len(table)} schedules from {reloader.path}")
+        return update.remap, update.unchanged
+
+    watch_sec = reload_interval_sec if reloader is not None else None
+    try:
+        if event_driven:
+            lookahead = timedelta(minutes=prefetch_minutes) if prefetcher is not None else None
+            _run_event_driven(
+                table, fire, prefetch, lookahead, reload, watch_sec, clock=clock, sleep=sleep
+            )
+        else:
+            _run_polling(
+                table, fire, prefetch, check_interval_sec, reload, clock=clock, sleep=sleep
+            )
+    finally:
+        playback.close()
+        synth_pool.shutdown(wait=False, cancel_futures=True)
+        if prefetcher is not None:
+            prefetcher.shutdown()
+        if on_stop is not None:
+            on_stop(playback.stats())
+
+
+def _run_polling(
+    table: ScheduleTable,
+    fire: Callable[[list[int]], None],
+    prefetch: Callable[[datetime], None],
+    check_interval_sec: float,
+    reload: Callable[[], tuple[dict[int, int], set[int]] | None] = lambda: None,
+    *,
+    clock: Callable[[], datetime] = datetime.now,
+    sleep: Callable[[float], None] = time_module.sleep,
+) -> None:
     triggered: set[tuple[int, date]] = set()
-    current_day = datetime.now().date()
+    current_day = clock().date()
+    prefetched_minute: datetime | None = None
     while True:
-        now = datetime.now()
+        now = clock()
         if now.date() != current_day:
             triggered.clear()
             current_day = now.date()
 
-        for idx in due_indices(cfg, now=now):
-            key = (idx, now.date())
-            if key in triggered:
-                continue
-            msg = cfg.schedules[idx].message
-            audio = synthesizer.synthesize(
-                msg,
+        minute = now.replace(second=0, microsecond=0)
+        if minute != prefetched_minute:
+            prefetch(now)
+            prefetched_minute = minute
+
+        due = [i for i in due_indices(table, now=now) if (i, now.date()) not in triggered]
+        if due:
+            fire(due)
+            triggered.update((i, now.date()) for i in due)
+
+        sleep(check_interval_sec)
+        reloaded = reload()
+        if reloaded is not None:
+            remap = reloaded[0]
+            triggered = {(remap[i], day) for i, day in triggered if i in remap}
+            prefetched_minute = None
+
+
+def _run_event_driven(
+    table: ScheduleTable,
+    fire: Callable[[list[int]], None],
+    prefetch: Callable[[datetime], None],
+    lookahead: timedelta | None,
+    reload: Callable[[], tuple[dict[int, int], set[int]] | None] = lambda: None,
+    watch_sec: float | None = None,
+    *,
+    clock: Callable[[], datetime] = datetime.now,
+    sleep: Callable[[float], None] = time_module.sleep,
+) -> None:
+    queue = FireQueue(table, now=clock())
+    prefetched_through = datetime.min
+    max_sleep = min(_MAX_SLEEP_SEC, watch_sec) if watch_sec is not None else _MAX_SLEEP_SEC
+    while True:
+        reloaded = reload()
+        if reloaded is not None:
+            queue.update(*reloaded, now=clock())
+            prefetched_through = datetime.min
+        next_at = queue.next_time()
+        if next_at is None:
+            sleep(max_sleep)
+            continue
+        now = clock()
+        wake = next_at
+        if lookahead is not None and next_at > prefetched_through:
+            if next_at - now <= lookahead:
+                prefetch(now)
+                prefetched_through = now + lookahead
+            else:
+                wake = next_at - lookahead
+        delay = (wake - now).total_seconds()
+        if delay > 0:
+            sleep(min(delay, max_sleep))
+            continue
+        # Fires whose minute has already passed (e.g. after a suspend) are skipped,
+        # matching the polling loop which only fires on an exact minute match.
+        due = [idx for when, idx in queue.pop_due(now) if now - when < timedelta(minutes=1)]
+        if due:
+            fire(due)
+
+
+async def run_forever_async(
+    cfg: AppConfig | ScheduleTable,
+    synthesizer: AsyncSynthesizer,
+    *,
+    language_code: str = "ja-JP",
+    voice_name: str | None = None,
+    speaking_rate: float = 1.0,
+    pitch: float = 0.0,
+    audio_encoding: str = "MP3",
+    prefetch_minutes: int = 0,
+    max_concurrency: int = 4,
+    player: Player | None = None,
+    clock: Callable[[], datetime] | None = None,
+    sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+) -> None:
+    """Asyncio version of ``run_forever`` for embedding in an event loop.
+
+    Always event-driven: the coroutine sleeps until the next fire instant. Synthesis
+    is awaited on the loop so other tasks keep running. A worker task plays the
+    announcements in order, in a thread, so a long clip or a failed synthesis never
+    holds up the timing loop.
+
+    ``clock`` and ``sleep`` stand in for ``datetime.now`` and ``asyncio.sleep``.
+    """
+    table = _table(cfg)
+    now_fn = clock or datetime.now
+
+    def requests(texts: Iterable[str]) -> list[SynthesisRequest]:
+        return [
+            SynthesisRequest(
+                text,
                 language_code=language_code,
                 voice_name=voice_name,
                 speaking_rate=speaking_rate,
                 pitch=pitch,
                 audio_encoding=audio_encoding,
             )
-            play_audio_bytes(audio, encoding=audio_encoding)
-            triggered.add(key)
+            for text in texts
+        ]
+
+    pending: dict[str, tuple[asyncio.Task[list[bytes]], int, datetime]] = {}
+
+    def prefetch(now: datetime) -> None:
+        for text, (_, _, submitted) in list(pending.items()):
+            if now - submitted > lookahead + timedelta(minutes=2):
+                del pending[text]
+        idxs = upcoming_indices(table, now=now, minutes=prefetch_minutes)
+        new = [t for t in dict.fromkeys(table.message(i) for i in idxs) if t not in pending]
+        if new:
+            task = asyncio.create_task(
+                async_synthesize_batch(synthesizer, requests(new), max_workers=max_concurrency)
+            )
+            for i, text in enumerate(new):
+                pending[text] = (task, i, now)
 
-        time_module.sleep(check_interval_sec)
+    async def fetch(texts: list[str]) -> dict[str, bytes]:
+        results: dict[str, bytes] = {}
+        for text in texts:
+            entry = pending.pop(text, None)
+            if entry is None:
+                continue
+            try:
+                results[text] = (await entry[0])[entry[1]]
+            except Exception:
+                pass
+        missing = [t for t in texts if t not in results]
+        if missing:
+            clips = await async_synthesize_batch(
+                synthesizer, requests(missing), max_workers=max_concurrency
+            )
+            results.update(zip(missing, clips, strict=True))
+        if player is not None:
+            for text in texts:
+                player.prepare(results[text], encoding=audio_encoding)
+        return results
+
+    # (name, text, synthesis of its batch) in fire order.
+    jobs: asyncio.Queue[tuple[str, str, asyncio.Task[dict[str, bytes]]]] = asyncio.Queue()
+    fetching: set[asyncio.Task[dict[str, bytes]]] = set()
+
+    def fire(idxs: list[int]) -> None:
+        task = asyncio.create_task(fetch(list(dict.fromkeys(table.message(i) for i in idxs))))
+        fetching.add(task)
+        task.add_done_callback(fetching.discard)
+        for i in idxs:
+            jobs.put_nowait((table.names[i], table.message(i), task))
+
+    async def playback() -> None:
+        play = player.play if player is not None else play_audio_bytes
+        while True:
+            name, text, task = await jobs.get()
+            try:
+                audio = (await task)[text]
+                await asyncio.to_thread(play, audio, encoding=audio_encoding)
+            except Exception as e:
+                # A failed synthesis or player must not stop later announcements.
+                print(f"Announcement {name!r} failed: {e}")
+
+    lookahead = timedelta(minutes=prefetch_minutes)
+    queue = FireQueue(table, now=now_fn())
+    prefetched_through = datetime.min
+    worker = asyncio.create_task(playback())
+    try:
+        while True:
+            next_at = queue.next_time()
+            if next_at is None:
+                await sleep(_MAX_SLEEP_SEC)
+                continue
+            now = now_fn()
+            wake = next_at
+            if prefetch_minutes > 0 and next_at > prefetched_through:
+                if next_at - now <= lookahead:
+                    prefetch(now)
+                    prefetched_through = now + lookahead
+                else:
+                    wake = next_at - lookahead
+            delay = (wake - now).total_seconds()
+            if delay > 0:
+                await sleep(min(delay, _MAX_SLEEP_SEC))
+                continue
+            due = [idx for when, idx in queue.pop_due(now) if now - when < timedelta(minutes=1)]
+            if due:
+                fire(due)
+    finally:
+        worker.cancel()
+        for fetch_task in fetching:
+            fetch_task.cancel()
+        for task, _, _ in pending.values():
+            task.cancel()
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+LOCKS_DIRNAME = ".locks"
+
+
+class Flight(Generic[T]):
+    """One in-flight computation that any number of threads can wait on."""
+
+    def __init__(self) -> None:
+        self._done = threading.Event()
+        self._value: T | None = None
+        self._error: BaseException | None = None
+
+    def wait(self) -> T:
+        self._done.wait()
+        if self._error is not None:
+            raise self._error
+        return self._value  # type: ignore[return-value]
+
+
+class SingleFlight(Generic[T]):
+    """Coalesce concurrent calls for the same key into one.
+
+    The first caller for a key becomes the leader and computes the value; callers
+    arriving while it runs wait and receive the same value (or exception). Nothing
+    is remembered once the flight lands. Thread-safe.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._flights: dict[str, Flight[T]] = {}
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    def join(self, key: str) -> tuple[Flight[T], bool]:
+        """Return the flight for ``key`` and whether the caller leads it.
+
+        A leader must call ``resolve`` exactly once, or its followers wait forever.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None:
+                return flight, False
+            flight = self._flights[key] = Flight()
+            return flight, True
+
+    def resolve(
+        self,
+        key: str,
+        flight: Flight[T],
+        value: T | None = None,
+        *,
+        error: BaseException | None = None,
+    ) -> None:
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+        flight._value = value
+        flight._error = error
+        flight._done.set()
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        flight, leader = self.join(key)
+        if not leader:
+            return flight.wait()
+        try:
+            value = fn()
+        except BaseException as e:
+            self.resolve(key, flight, error=e)
+            raise
+        self.resolve(key, flight, value)
+        return value
+
+
+class LockFile:
+    """Cross-process advisory lock held by creating ``path`` with ``O_CREAT | O_EXCL``.
+
+    Portable to any platform and filesystem that honours ``O_EXCL``. A lock file
+    older than ``stale_sec`` is assumed to belong to a crashed process and is
+    broken. Breaking is best-effort: losing that race costs a duplicate
+    computation, never a corrupt cache, since stores write atomically.
+    """
+
+    def __init__(self, path: Path, *, stale_sec: float = 120.0) -> None:
+        self.path = path
+        self.stale_sec = stale_sec
+        self._token = f"{os.getpid()}:{threading.get_ident()}:{time.time_ns()}".encode()
+        self.owned = False
+
+    def try_acquire(self) -> bool:
+        """Take the lock if it is free (or stale); never blocks."""
+        for _ in range(2):
+            try:
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+            except FileExistsError:
+                if not self._break_stale():
+                    return False
+                continue
+            except FileNotFoundError:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                continue
+            try:
+                os.write(fd, self._token)
+            finally:
+                os.close(fd)
+            self.owned = True
+            return True
+        return False
+
+    def wait(
+        self,
+        ready: Callable[[], bool],
+        *,
+        poll_sec: float = 0.05,
+        timeout_sec: float | None = None,
+    ) -> bool:
+        """Block until the lock is taken (True) or ``ready()`` reports the work done (False).
+
+        ``ready`` is polled while another process holds the lock. After
+        ``timeout_sec`` the wait gives up and returns False without the lock.
+        """
+        deadline = None if timeout_sec is None else time.monotonic() + timeout_sec
+        while not self.try_acquire():
+            if ready():
+                return False
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(poll_sec)
+        return True
+
+    def release(self) -> None:
+        if not self.owned:
+            return
+        self.owned = False
+        try:
+            if self.path.read_bytes() == self._token:
+                self.path.unlink()
+        except OSError:
+            pass
+
+    def _break_stale(self) -> bool:
+        try:
+            age = time.time() - self.path.stat().st_mtime
+        except FileNotFoundError:
+            return True
+        except OSError:
+            return False
+        if age < self.stale_sec:
+            return False
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError:
+            return False
+        return True
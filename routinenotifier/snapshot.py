@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from array import array
+import hashlib
+import marshal
+import mmap
+import os
+from pathlib import Path
+import struct
+import sys
+import tempfile
+
+from . import __version__
+from .table import _MINUTES_PER_DAY, ScheduleTable, load_table, parse_table
+
+SNAPSHOT_DIRNAME = ".snapshots"
+
+# Layout: magic, key, row count, then the byte sizes of the marshalled names and
+# message pool. The columns follow as raw arrays (minutes, masks, message ids,
+# priorities), then the two marshalled string lists.
+_MAGIC = b"RNST"
+_HEADER = struct.Struct("<4s32sQQQ")
+# Anything that changes what the bytes mean goes into the key.
+_FORMAT = f"routinenotifier {__version__} snapshot 1 {sys.byteorder} marshal {marshal.version}"
+_COLUMNS = ("H", "B", "I", "q")
+
+
+def snapshot_key(content: bytes) -> bytes:
+    """sha256 of the schedule file's bytes together with the package and format version."""
+    h = hashlib.sha256(_FORMAT.encode() + b"\0")
+    h.update(content)
+    return h.digest()
+
+
+def snapshot_path(config: Path, cache_dir: Path) -> Path:
+    """Where the snapshot of ``config`` lives; one file per config path."""
+    name = hashlib.sha256(os.fsencode(config.resolve())).hexdigest()[:32]
+    return cache_dir / SNAPSHOT_DIRNAME / f"{name}.snap"
+
+
+def load_table_cached(config: Path, cache_dir: Path) -> ScheduleTable:
+    """``load_table`` that keeps a binary snapshot of the result under ``cache_dir``.
+
+    When the snapshot's key matches the file's current content, the table is
+    read straight from it: one mmap, no JSON parsing and no validation. Otherwise
+    (first run, edited file, new package version, unreadable snapshot) the file
+    is loaded as usual and the snapshot rewritten. Errors are load_table's.
+    """
+    try:
+        content = config.read_bytes()
+    except OSError:
+        return load_table(config)
+    key = snapshot_key(content)
+    path = snapshot_path(config, cache_dir)
+    table = read_snapshot(path, key)
+    if table is None:
+        try:
+            text = content.decode("utf-8")
+        except ValueError:
+            return load_table(config)
+        table = parse_table(text)
+        try:
+            write_snapshot(path, key, table)
+        except OSError:
+            pass  # read-only cache: still works, just without the shortcut
+    return table
+
+
+def write_snapshot(path: Path, key: bytes, table: ScheduleTable) -> None:
+    """Atomically write ``table`` to ``path`` under ``key``."""
+    names, pool = marshal.dumps(table.names), marshal.dumps(table.pool)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".snapshot-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, key, len(table), len(names), len(pool)))
+            for column in (table.minutes, table.masks, table.message_ids, table.priorities):
+                f.write(column.tobytes())
+            f.write(names)
+            f.write(pool)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def read_snapshot(path: Path, key: bytes) -> ScheduleTable | None:
+    """The table stored at ``path`` if it was written under ``key``, else None."""
+    try:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            with memoryview(m) as view:
+                return _decode(view, key)
+    except (OSError, ValueError, EOFError, TypeError, struct.error):
+        return None
+
+
+def _decode(view: memoryview, key: bytes) -> ScheduleTable | None:
+    magic, stored, n, names_size, pool_size = _HEADER.unpack_from(view)
+    if magic != _MAGIC or stored != key:
+        return None
+    offset = _HEADER.size
+    columns: list[array[int]] = []
+    for code in _COLUMNS:
+        column = array(code)
+        end = offset + n * column.itemsize
+        column.frombytes(view[offset:end])
+        columns.append(column)
+        offset = end
+    names = marshal.loads(view[offset : offset + names_size])
+    pool = marshal.loads(view[offset + names_size : offset + names_size + pool_size])
+    minutes, masks, message_ids, priorities = columns
+    # A truncated or mangled file must not turn into a table that fails later.
+    if type(names) is not list or type(pool) is not list or len(names) != n:
+        return None
+    if any(len(c) != n for c in columns) or offset + names_size + pool_size != len(view):
+        return None
+    if n and (
+        max(minutes) >= _MINUTES_PER_DAY or max(masks) > 0x7F or max(message_ids) >= len(pool)
+    ):
+        return None
+    return ScheduleTable.from_columns(names, minutes, masks, message_ids, priorities, pool)
@@ -0,0 +1,383 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+import datetime as dt
+import json
+from pathlib import Path
+import re
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .config import AppConfig, Schedule, Weekday
+
+# config.Weekday values in weekday order (mon=0). The table itself does not need
+# pydantic, so .config is only imported where models are built or validated.
+_DAY_NAMES = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+_DAY_BIT = {d: 1 << i for i, d in enumerate(_DAY_NAMES)}
+_MINUTES_PER_DAY = 24 * 60
+# "HH:MM" -> minute of day for every canonical spelling; other spellings go to the regex.
+_MINUTE_OF = {f"{m // 60:02d}:{m % 60:02d}": m for m in range(_MINUTES_PER_DAY)}
+_TIME = re.compile(r"\s*([0-9]{1,2}):([0-9]{1,2})\s*")
+_INT64 = 1 << 63
+
+
+class ScheduleTable:
+    """Validated schedules stored column-wise, one row per entry.
+
+    Times are minutes of the day (``array('H')``), days a 7-bit mask with
+    Monday as bit 0 (``array('B')``) and messages ids into ``pool``, which holds
+    each distinct message once. Only the fields the scheduler uses are kept, so
+    ``to_config`` gives ``days`` in weekday order without duplicates.
+    """
+
+    __slots__ = ("names", "message_ids", "minutes", "masks", "priorities", "pool", "_ids", "_index")
+
+    def __init__(self) -> None:
+        self.names: list[str] = []
+        self.message_ids = array("I")
+        self.minutes = array("H")
+        self.masks = array("B")
+        self.priorities = array("q")
+        self.pool: list[str] = []
+        self._ids: dict[str, int] = {}
+        # minute of day -> ascending row numbers, built on the first due_at.
+        self._index: list[array[int]] | None = None
+
+    def __len__(self) -> int:
+        return len(self.minutes)
+
+    def intern(self, message: str) -> int:
+        """Pool id of ``message``, adding it on first use."""
+        mid = self._ids.get(message)
+        if mid is None:
+            mid = self._ids[message] = len(self.pool)
+            self.pool.append(message)
+        return mid
+
+    def append(self, name: str, minute: int, mask: int, message: str, priority: int = 0) -> None:
+        self.names.append(name)
+        self.message_ids.append(self.intern(message))
+        self.minutes.append(minute)
+        self.masks.append(mask)
+        self.priorities.append(priority)
+        if self._index is not None:
+            self._index[minute].append(len(self) - 1)
+
+    def message(self, i: int) -> str:
+        return self.pool[self.message_ids[i]]
+
+    def row(self, i: int) -> tuple[str, int, int, str, int]:
+        """``(name, minute, mask, message, priority)`` of row ``i``."""
+        return (
+            self.names[i],
+            self.minutes[i],
+            self.masks[i],
+            self.pool[self.message_ids[i]],
+            self.priorities[i],
+        )
+
+    def rows(self) -> list[tuple[str, int, int, str, int]]:
+        """Every ``row``, in order."""
+        messages = map(self.pool.__getitem__, self.message_ids)
+        columns = (self.names, self.minutes, self.masks, messages, self.priorities)
+        return list(zip(*columns, strict=True))
+
+    def set_row(
+        self, i: int, name: str, minute: int, mask: int, message: str, priority: int = 0
+    ) -> None:
+        if self._index is not None and minute != self.minutes[i]:
+            self._index[self.minutes[i]].remove(i)
+            insort(self._index[minute], i)
+        self.names[i] = name
+        self.message_ids[i] = self.intern(message)
+        self.minutes[i] = minute
+        self.masks[i] = mask
+        self.priorities[i] = priority
+
+    def due_at(self, weekday: int, minute_of_day: int) -> list[int]:
+        """Return rows firing on ``weekday`` (mon=0) at ``minute_of_day``, ascending."""
+        if self._index is None:
+            index: list[array[int]] = [array("I") for _ in range(_MINUTES_PER_DAY)]
+            for i, minute in enumerate(self.minutes):
+                index[minute].append(i)
+            self._index = index
+        bit, masks = 1 << weekday, self.masks
+        return [i for i in self._index[minute_of_day] if masks[i] & bit]
+
+    def day_names(self, i: int) -> list[str]:
+        mask = self.masks[i]
+        return [d for b, d in enumerate(_DAY_NAMES) if mask >> b & 1]
+
+    def days(self, i: int) -> list[Weekday]:
+        from .config import Weekday
+
+        return [Weekday(d) for d in self.day_names(i)]
+
+    def schedule(self, i: int) -> Schedule:
+        """Row ``i`` as a ``Schedule`` (built without re-validation)."""
+        from .config import Schedule
+
+        minute = self.minutes[i]
+        return Schedule.model_construct(
+            name=self.names[i],
+            time=dt.time(minute // 60, minute % 60),
+            days=self.days(i),
+            message=self.message(i),
+            priority=self.priorities[i],
+        )
+
+    def to_config(self) -> AppConfig:
+        from .config import AppConfig
+
+        return AppConfig.model_construct(schedules=[self.schedule(i) for i in range(len(self))])
+
+    @classmethod
+    def from_columns(
+        cls,
+        names: list[str],
+        minutes: array[int],
+        masks: array[int],
+        message_ids: array[int],
+        priorities: array[int],
+        pool: list[str],
+    ) -> ScheduleTable:
+        """Wrap existing columns (same length, ids indexing ``pool``) without copying."""
+        table = cls()
+        table.names, table.minutes, table.masks = names, minutes, masks
+        table.message_ids, table.priorities, table.pool = message_ids, priorities, pool
+        table._ids = {m: i for i, m in enumerate(pool)}
+        return table
+
+    @classmethod
+    def from_config(cls, cfg: AppConfig) -> ScheduleTable:
+        from .config import WEEKDAY_INDEX
+
+        table = cls()
+        for s in cfg.schedules:
+            mask = 0
+            for d in s.days:
+                mask |= 1 << WEEKDAY_INDEX[d]
+            table.append(s.name, s.time.hour * 60 + s.time.minute, mask, s.message, s.priority)
+        return table
+
+    def update(self, new: ScheduleTable) -> TableUpdate:
+        """Make this table equal to ``new`` in place, keeping what did not change.
+
+        A few edits are patched row by row; anything larger takes over ``new``'s
+        columns, so ``new`` must not be used after. The due index is patched
+        either way, in the minute slots of the rows from the first change on.
+        Rows are followed to their new position by content, and an edited row
+        by its unchanged name and time.
+        """
+        n, m = len(new), len(self)
+        old_rows, new_rows = self.rows(), new.rows()
+        common = min(n, m)
+        lo = 0
+        while lo < common and new_rows[lo] == old_rows[lo]:
+            lo += 1
+        hi = 0
+        while hi < common - lo and new_rows[n - 1 - hi] == old_rows[m - 1 - hi]:
+            hi += 1
+        remap = {i: i for i in range(lo)}
+        remap.update({m - 1 - k: n - 1 - k for k in range(hi)})
+        if n == m:
+            remap.update({i: i for i in range(lo, n - hi) if new_rows[i] == old_rows[i]})
+        unchanged = set(remap.values())
+        if len(unchanged) < n:
+            # Rows that moved keep their identity; leftovers pair up by name and time.
+            free: dict[tuple[str, int, int, str, int], list[int]] = {}
+            for j in range(n - 1 - hi, lo - 1, -1):
+                if j not in unchanged:
+                    free.setdefault(new_rows[j], []).append(j)
+            edited: list[int] = []
+            for i in range(lo, m - hi):
+                if i in remap:
+                    continue
+                same = free.get(old_rows[i])
+                if same:
+                    remap[i] = same.pop()
+                    unchanged.add(remap[i])
+                else:
+                    edited.append(i)
+            by_key: dict[tuple[str, int], list[int]] = {}
+            for j in range(n - 1 - hi, lo - 1, -1):
+                if j not in unchanged:
+                    by_key.setdefault(new_rows[j][:2], []).append(j)
+            for i in edited:
+                candidates = by_key.get(old_rows[i][:2])
+                if candidates:
+                    remap[i] = candidates.pop()
+        changed = [i for i in range(n) if i >= m or new_rows[i] != old_rows[i]]
+        if n == m and len(changed) * 4 <= n:
+            for i in changed:
+                self.set_row(i, *new_rows[i])
+        elif changed or n != m:
+            start = changed[0] if changed else n
+            if self._index is not None:
+                # Rows before ``start`` keep their numbers; only slots holding later rows change.
+                for minute in {*self.minutes[start:], *new.minutes[start:]}:
+                    slot = self._index[minute]
+                    del slot[bisect_left(slot, start) :]
+                for j in range(start, n):
+                    self._index[new.minutes[j]].append(j)
+            self.names, self.message_ids, self.pool, self._ids = (
+                new.names,
+                new.message_ids,
+                new.pool,
+                new._ids,
+            )
+            self.minutes, self.masks, self.priorities = new.minutes, new.masks, new.priorities
+        return TableUpdate(remap, unchanged)
+
+
+@dataclass(frozen=True)
+class TableUpdate:
+    """Result of ``ScheduleTable.update``.
+
+    ``remap`` maps old row -> new row for every row still present or edited in
+    place (same name and time); ``unchanged`` holds the new rows whose content
+    is exactly what it was.
+    """
+
+    remap: dict[int, int]
+    unchanged: set[int]
+
+
+class TableReloader:
+    """Re-reads a schedule file into ``table`` when its modification time or size changes.
+
+    The file goes through ``load_table``, so a broken file raises the same
+    ConfigError as ``load_config`` and leaves ``table`` as it was.
+    """
+
+    def __init__(self, path: Path, table: ScheduleTable) -> None:
+        self.path = path
+        self.table = table
+        self._stamp = self._stat()
+
+    def _stat(self) -> tuple[int, int] | None:
+        try:
+            st = self.path.stat()
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def poll(self) -> TableUpdate | None:
+        """Reload if the file changed since the last look; see ``reload``."""
+        stamp = self._stat()
+        if stamp is None or stamp == self._stamp:
+            return None
+        self._stamp = stamp
+        return self.reload()
+
+    def reload(self) -> TableUpdate:
+        return self.table.update(load_table(self.path))
+
+
+def load_table(path: Path) -> ScheduleTable:
+    """Load a schedule file straight into a ScheduleTable, skipping pydantic.
+
+    Each entry is checked and appended column by column as the JSON decoder
+    produces it, so the per-entry dicts never pile up. The checks use lookup
+    tables (canonical ``HH:MM`` strings, day lists already seen). A file the
+    fast path does not accept outright, valid or not, goes through
+    ``load_config``'s pydantic path instead, so results and ConfigError messages
+    are exactly the same.
+    """
+    try:
+        text = path.read_text(encoding="utf-8")
+    except (OSError, ValueError):
+        from .config import _read_json, _validate_config
+
+        return ScheduleTable.from_config(_validate_config(_read_json(path)))
+    return parse_table(text)
+
+
+def parse_table(text: str) -> ScheduleTable:
+    """``load_table`` for the contents of a schedule file."""
+    try:
+        table = _fast_load(text)
+    except ValueError:
+        table = None
+    if table is None:
+        from .config import _parse_json, _validate_config
+
+        table = ScheduleTable.from_config(_validate_config(_parse_json(text)))
+    return table
+
+
+def _fast_load(text: str) -> ScheduleTable | None:
+    """Build the table for plainly valid ``text``; None defers to pydantic."""
+    table = ScheduleTable()
+    # Bind the hot methods once; generated configs have hundreds of thousands of rows.
+    names, message_ids = table.names.append, table.message_ids.append
+    minutes, masks, priorities = table.minutes.append, table.masks.append, table.priorities.append
+    minute_of, intern = _MINUTE_OF.get, table.intern
+    mask_cache: dict[tuple[str, ...], int] = {}
+    row = object()
+
+    def entry(item: dict[str, Any]) -> Any:
+        # Called for every JSON object, innermost first; the top level passes through.
+        if "schedules" in item:
+            return item
+        name = item.get("name")
+        message = item.get("message")
+        time = item.get("time")
+        days = item.get("days")
+        priority = item.get("priority", 0)
+        if type(name) is not str or type(message) is not str or type(time) is not str:
+            return item
+        if type(priority) is not int or not -_INT64 <= priority < _INT64:
+            return item
+        minute = minute_of(time)
+        if minute is None:
+            minute = _parse_minute(time)
+            if minute is None:
+                return item
+        if type(days) is not list:
+            return item
+        try:
+            key = tuple(days)
+            mask = mask_cache.get(key)
+        except TypeError:  # unhashable entries: not weekday names anyway
+            return item
+        if mask is None:
+            mask = _parse_mask(days)
+            if mask is None:
+                return item
+            mask_cache[key] = mask
+        names(name)
+        message_ids(intern(message))
+        minutes(minute)
+        masks(mask)
+        priorities(priority)
+        return row
+
+    data = json.loads(text, object_hook=entry)
+    if type(data) is not dict:
+        return None
+    items = data.get("schedules")
+    # Every row appended must be one of the top-level entries, and nothing else.
+    if type(items) is not list or len(items) != len(table) or items.count(row) != len(items):
+        return None
+    return table
+
+
+def _parse_minute(value: str) -> int | None:
+    m = _TIME.fullmatch(value)
+    if m is None:
+        return None
+    h, mi = int(m.group(1)), int(m.group(2))
+    return h * 60 + mi if h <= 23 and mi <= 59 else None
+
+
+def _parse_mask(days: list[Any]) -> int | None:
+    mask = 0
+    for d in days:
+        bit = _DAY_BIT.get(d.lower()) if type(d) is str else None
+        if bit is None:
+            return None
+        mask |= bit
+    return mask
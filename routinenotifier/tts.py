@@ -1,7 +1,134 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Protocol
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from functools import partial
+from itertools import islice
+import re
+import threading
+from typing import Any, Protocol, TypeVar
+from xml.sax.saxutils import escape, unescape
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class SynthesisRequest:
+    """One text plus voice parameters, as accepted by ``synthesize_many``."""
+
+    text: str
+    language_code: str = "ja-JP"
+    voice_name: str | None = "ja-JP-Wavenet-A"
+    speaking_rate: float = 1.2
+    pitch: float = -3.0
+    audio_encoding: str = "OGG_OPUS"
+
+    def normalized(self) -> SynthesisRequest:
+        """Return the request with the same normalization the cache key applies."""
+        return replace(
+            self,
+            speaking_rate=round(self.speaking_rate, 6),
+            pitch=round(self.pitch, 6),
+            audio_encoding=self.audio_encoding.upper(),
+        )
+
+
+def synthesize_concurrently(
+    synthesize: Callable[[SynthesisRequest], bytes],
+    items: Sequence[SynthesisRequest],
+    *,
+    max_workers: int = 4,
+) -> list[bytes]:
+    """Run ``synthesize`` once per distinct request with bounded parallelism.
+
+    Identical requests (after normalization) are synthesized once. Results are
+    returned in input order.
+    """
+    unique = list(dict.fromkeys(r.normalized() for r in items))
+    if len(unique) <= 1 or max_workers <= 1:
+        done = [synthesize(r) for r in unique]
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(unique))) as pool:
+            done = list(pool.map(synthesize, unique))
+    by_request = dict(zip(unique, done, strict=True))
+    return [by_request[r.normalized()] for r in items]
+
+
+# Sentence ends: Japanese full stop and full-width ?/!, or ASCII .?! followed by whitespace
+# (so decimals such as "3.5" stay whole).
+_SENTENCE_END = re.compile(r"(?<=[。！？])|(?<=[.?!])(?=\s)")
+
+
+def split_sentences(text: str) -> list[str]:
+    """Split ``text`` after each sentence end, dropping empty pieces."""
+    return [part.strip() for part in _SENTENCE_END.split(text) if part.strip()]
+
+
+# Pause between announcements merged into one clip.
+MERGE_BREAK_MS = 600
+_MERGED = re.compile(r"<speak>(.*)</speak>", re.DOTALL)
+_MERGE_BREAK = re.compile(r'<break time="(\d+)ms"/>')
+
+
+def merge_ssml(texts: Sequence[str], *, break_ms: int = MERGE_BREAK_MS) -> str:
+    """Join plain-text messages into one SSML document with a pause between them."""
+    return "<speak>" + f'<break time="{break_ms}ms"/>'.join(escape(t) for t in texts) + "</speak>"
+
+
+def split_merged(text: str) -> tuple[list[str], int] | None:
+    """Invert ``merge_ssml``: return the messages and pause, or None for other text."""
+    m = _MERGED.fullmatch(text)
+    if m is None:
+        return None
+    pieces = _MERGE_BREAK.split(m.group(1))
+    messages, pauses = pieces[::2], set(pieces[1::2])
+    if len(pauses) > 1 or any("<" in p for p in messages):
+        return None
+    break_ms = int(pauses.pop()) if pauses else MERGE_BREAK_MS
+    return [unescape(p) for p in messages], break_ms
+
+
+def synthesize_stream(
+    fetch: Callable[[str], T], chunks: Sequence[str], *, max_workers: int = 2
+) -> Iterator[T]:
+    """Yield ``fetch(chunk)`` for each chunk in order as soon as it is ready.
+
+    Up to ``max_workers`` chunks are fetched ahead in the background, so the first
+    chunk can be played while the following ones are still being synthesized.
+    """
+    if len(chunks) <= 1 or max_workers <= 1:
+        for chunk in chunks:
+            yield fetch(chunk)
+        return
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="rn-stream") as pool:
+        rest = iter(chunks)
+        ahead: deque[Future[T]] = deque(
+            pool.submit(fetch, chunk) for chunk in islice(rest, max_workers)
+        )
+        try:
+            while ahead:
+                current = ahead.popleft()
+                nxt = next(rest, None)
+                if nxt is not None:
+                    ahead.append(pool.submit(fetch, nxt))
+                yield current.result()
+        finally:
+            for f in ahead:
+                f.cancel()
+
+
+def _synthesize_request(synth: Synthesizer, r: SynthesisRequest) -> bytes:
+    return synth.synthesize(
+        r.text,
+        language_code=r.language_code,
+        voice_name=r.voice_name,
+        speaking_rate=r.speaking_rate,
+        pitch=r.pitch,
+        audio_encoding=r.audio_encoding,
+    )
 
 
 class Synthesizer(Protocol):
@@ -17,9 +144,39 @@ class Synthesizer(Protocol):
     ) -> bytes:  # pragma: no cover - protocol
         ...
 
+    def synthesize_many(
+        self, items: Sequence[SynthesisRequest], *, max_workers: int = 4
+    ) -> list[bytes]:
+        """Synthesize several requests; results follow input order.
 
-class GoogleTTS:
-    def synthesize(
+        Default for explicit subclasses: fan ``synthesize`` out over a thread pool.
+        """
+        return synthesize_concurrently(
+            lambda r: _synthesize_request(self, r), items, max_workers=max_workers
+        )
+
+
+async def async_synthesize_concurrently(
+    synthesize: Callable[[SynthesisRequest], Awaitable[bytes]],
+    items: Sequence[SynthesisRequest],
+    *,
+    max_workers: int = 4,
+) -> list[bytes]:
+    """Asyncio counterpart of ``synthesize_concurrently`` using a semaphore."""
+    unique = list(dict.fromkeys(r.normalized() for r in items))
+    sem = asyncio.Semaphore(max(1, max_workers))
+
+    async def one(r: SynthesisRequest) -> bytes:
+        async with sem:
+            return await synthesize(r)
+
+    done = await asyncio.gather(*(one(r) for r in unique))
+    by_request = dict(zip(unique, done, strict=True))
+    return [by_request[r.normalized()] for r in items]
+
+
+class AsyncSynthesizer(Protocol):
+    async def synthesize(
         self,
         text: str,
         *,
@@ -28,47 +185,253 @@ class GoogleTTS:
         speaking_rate: float = 1.2,
         pitch: float = -3.0,
         audio_encoding: str = "OGG_OPUS",
-    ) -> bytes:
-        try:
-            from google.cloud import texttospeech
-        except Exception as e:  # pragma: no cover - import-time path
-            raise RuntimeError(
-                "google-cloud-texttospeech is required. Install the package "
-                "and configure GCP credentials."
-            ) from e
-
-        audio_enc_map = {
-            "MP3": texttospeech.AudioEncoding.MP3,
-            "LINEAR16": texttospeech.AudioEncoding.LINEAR16,
-            "OGG_OPUS": texttospeech.AudioEncoding.OGG_OPUS,
-        }
-        enc = audio_enc_map.get(audio_encoding.upper())
-        if enc is None:
-            raise ValueError("Unsupported audio encoding. Use MP3, LINEAR16, or OGG_OPUS.")
+    ) -> bytes:  # pragma: no cover - protocol
+        ...
+
+    async def synthesize_many(
+        self, items: Sequence[SynthesisRequest], *, max_workers: int = 4
+    ) -> list[bytes]:
+        """Synthesize several requests concurrently on the running event loop."""
+        return await async_synthesize_concurrently(
+            partial(_async_synthesize_request, self), items, max_workers=max_workers
+        )
+
+
+async def _async_synthesize_request(synth: AsyncSynthesizer, r: SynthesisRequest) -> bytes:
+    return await synth.synthesize(
+        r.text,
+        language_code=r.language_code,
+        voice_name=r.voice_name,
+        speaking_rate=r.speaking_rate,
+        pitch=r.pitch,
+        audio_encoding=r.audio_encoding,
+    )
+
+
+def synthesize_batch(
+    synth: Synthesizer, items: Sequence[SynthesisRequest], *, max_workers: int = 4
+) -> list[bytes]:
+    """Call ``synth.synthesize_many``, or fan ``synthesize`` out if it has none.
+
+    The protocol's default ``synthesize_many`` only reaches explicit subclasses;
+    a structural synthesizer may define ``synthesize`` alone.
+    """
+    many = getattr(synth, "synthesize_many", None)
+    if many is None:
+        return synthesize_concurrently(
+            partial(_synthesize_request, synth), items, max_workers=max_workers
+        )
+    return list(many(items, max_workers=max_workers))
+
+
+async def async_synthesize_batch(
+    synth: AsyncSynthesizer, items: Sequence[SynthesisRequest], *, max_workers: int = 4
+) -> list[bytes]:
+    """Asyncio counterpart of ``synthesize_batch``."""
+    many = getattr(synth, "synthesize_many", None)
+    if many is None:
+        return await async_synthesize_concurrently(
+            partial(_async_synthesize_request, synth), items, max_workers=max_workers
+        )
+    return list(await many(items, max_workers=max_workers))
+
+
+def _texttospeech() -> Any:
+    try:
+        from google.cloud import texttospeech
+    except Exception as e:  # pragma: no cover - import-time path
+        raise RuntimeError(
+            "google-cloud-texttospeech is required. Install the package "
+            "and configure GCP credentials."
+        ) from e
+    return texttospeech
 
-        client = texttospeech.TextToSpeechClient()
 
-        synthesis_input = texttospeech.SynthesisInput(text=text)
+_default_client: Any | None = None
+_default_client_lock = threading.Lock()
 
-        voice_params = {
-            "language_code": language_code,
+
+def _shared_client() -> Any:
+    """Return the process-wide TextToSpeechClient, creating it on first use.
+
+    The client owns a gRPC channel that is safe to share across threads, so
+    channel setup, auth and TLS are paid once per process instead of per call.
+    """
+    global _default_client
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = _texttospeech().TextToSpeechClient()
+    return _default_client
+
+
+class _GoogleRequestParams:
+    """Builds and memoizes TTS request objects per parameter set."""
+
+    def __init__(self) -> None:
+        # Request parameter objects are immutable once built; a racing duplicate
+        # build is harmless, so these caches are filled without locking.
+        self._voices: dict[tuple[str, str | None], Any] = {}
+        self._audio_configs: dict[tuple[str, float, float], Any] = {}
+
+    def _voice_params(self, language_code: str, voice_name: str | None) -> Any:
+        key = (language_code, voice_name)
+        voice = self._voices.get(key)
+        if voice is None:
+            voice_params = {
+                "language_code": language_code,
+            }
+            if voice_name:
+                voice_params["name"] = voice_name
+            voice = _texttospeech().VoiceSelectionParams(**voice_params)
+            self._voices[key] = voice
+        return voice
+
+    def _audio_config(self, audio_encoding: str, speaking_rate: float, pitch: float) -> Any:
+        key = (audio_encoding.upper(), speaking_rate, pitch)
+        audio_config = self._audio_configs.get(key)
+        if audio_config is None:
+            texttospeech = _texttospeech()
+            audio_enc_map = {
+                "MP3": texttospeech.AudioEncoding.MP3,
+                "LINEAR16": texttospeech.AudioEncoding.LINEAR16,
+                "OGG_OPUS": texttospeech.AudioEncoding.OGG_OPUS,
+            }
+            enc = audio_enc_map.get(key[0])
+            if enc is None:
+                raise ValueError("Unsupported audio encoding. Use MP3, LINEAR16, or OGG_OPUS.")
+            audio_config = texttospeech.AudioConfig(
+                audio_encoding=enc,
+                speaking_rate=speaking_rate,
+                pitch=pitch,
+            )
+            self._audio_configs[key] = audio_config
+        return audio_config
+
+    def _request(self, r: SynthesisRequest) -> dict[str, Any]:
+        texttospeech = _texttospeech()
+        if r.text.startswith("<speak>"):
+            synthesis_input = texttospeech.SynthesisInput(ssml=r.text)
+        else:
+            synthesis_input = texttospeech.SynthesisInput(text=r.text)
+        return {
+            "input": synthesis_input,
+            "voice": self._voice_params(r.language_code, r.voice_name),
+            "audio_config": self._audio_config(r.audio_encoding, r.speaking_rate, r.pitch),
         }
-        if voice_name:
-            voice_params["name"] = voice_name
 
-        voice = texttospeech.VoiceSelectionParams(**voice_params)
 
-        audio_config = texttospeech.AudioConfig(
-            audio_encoding=enc,
+class GoogleTTS(_GoogleRequestParams):
+    """Google Cloud TTS synthesizer reusing one client across calls.
+
+    ``client`` or ``client_factory`` can be given to inject a specific client; by
+    default the process-wide shared client is used.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: Any | None = None,
+        client_factory: Callable[[], Any] | None = None,
+    ) -> None:
+        super().__init__()
+        self._client = client
+        self._client_factory = client_factory or _shared_client
+        self._lock = threading.Lock()
+
+    @property
+    def client(self) -> Any:
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = self._client_factory()
+        return self._client
+
+    def synthesize(
+        self,
+        text: str,
+        *,
+        language_code: str = "ja-JP",
+        voice_name: str | None = "ja-JP-Wavenet-A",
+        speaking_rate: float = 1.2,
+        pitch: float = -3.0,
+        audio_encoding: str = "OGG_OPUS",
+    ) -> bytes:
+        request = SynthesisRequest(
+            text,
+            language_code=language_code,
+            voice_name=voice_name,
             speaking_rate=speaking_rate,
             pitch=pitch,
+            audio_encoding=audio_encoding,
         )
+        response = self.client.synthesize_speech(**self._request(request))
+        return bytes(response.audio_content)
+
+    def synthesize_many(
+        self, items: Sequence[SynthesisRequest], *, max_workers: int = 4
+    ) -> list[bytes]:
+        return synthesize_concurrently(
+            lambda r: _synthesize_request(self, r), items, max_workers=max_workers
+        )
+
+    def list_voices(self, language_code: str | None = None) -> list[VoiceInfo]:
+        return list_voices(language_code, client=self.client)
 
-        response = client.synthesize_speech(
-            input=synthesis_input, voice=voice, audio_config=audio_config
+
+class AsyncGoogleTTS(_GoogleRequestParams):
+    """Google Cloud TTS on ``TextToSpeechAsyncClient`` for use inside asyncio services.
+
+    The client is created on first use, inside the running event loop it binds to.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: Any | None = None,
+        client_factory: Callable[[], Any] | None = None,
+    ) -> None:
+        super().__init__()
+        self._client = client
+        self._client_factory = client_factory or (lambda: _texttospeech().TextToSpeechAsyncClient())
+
+    @property
+    def client(self) -> Any:
+        # No lock needed: nothing awaits between the check and the assignment.
+        if self._client is None:
+            self._client = self._client_factory()
+        return self._client
+
+    async def synthesize(
+        self,
+        text: str,
+        *,
+        language_code: str = "ja-JP",
+        voice_name: str | None = "ja-JP-Wavenet-A",
+        speaking_rate: float = 1.2,
+        pitch: float = -3.0,
+        audio_encoding: str = "OGG_OPUS",
+    ) -> bytes:
+        request = SynthesisRequest(
+            text,
+            language_code=language_code,
+            voice_name=voice_name,
+            speaking_rate=speaking_rate,
+            pitch=pitch,
+            audio_encoding=audio_encoding,
         )
+        response = await self.client.synthesize_speech(**self._request(request))
         return bytes(response.audio_content)
 
+    async def synthesize_many(
+        self, items: Sequence[SynthesisRequest], *, max_workers: int = 4
+    ) -> list[bytes]:
+        async def one(r: SynthesisRequest) -> bytes:
+            response = await self.client.synthesize_speech(**self._request(r))
+            return bytes(response.audio_content)
+
+        return await async_synthesize_concurrently(one, items, max_workers=max_workers)
+
 
 class DummyTTS:
     """A dummy synthesizer used for tests; returns silence WAV bytes."""
@@ -99,6 +462,13 @@ class DummyTTS:
             wf.writeframes(b"\x00\x00" * nframes)
         return buf.getvalue()
 
+    def synthesize_many(
+        self, items: Sequence[SynthesisRequest], *, max_workers: int = 4
+    ) -> list[bytes]:
+        return synthesize_concurrently(
+            lambda r: _synthesize_request(self, r), items, max_workers=max_workers
+        )
+
 
 @dataclass(frozen=True)
 class VoiceInfo:
@@ -108,20 +478,13 @@ class VoiceInfo:
     natural_sample_rate_hz: int
 
 
-def list_voices(language_code: str | None = None) -> list[VoiceInfo]:
+def list_voices(language_code: str | None = None, *, client: Any | None = None) -> list[VoiceInfo]:
     """List available Google TTS voices; optionally filter by language code.
 
     Example language codes: "ja-JP", "en-US".
     """
-    try:
-        from google.cloud import texttospeech
-    except Exception as e:  # pragma: no cover - import-time path
-        raise RuntimeError(
-            "google-cloud-texttospeech is required. Install the package "
-            "and configure GCP credentials."
-        ) from e
-
-    client = texttospeech.TextToSpeechClient()
+    if client is None:
+        client = _shared_client()
     lang = language_code or ""
     response = client.list_voices(language_code=lang)
     out: list[VoiceInfo] = []
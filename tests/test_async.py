@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+from pathlib import Path
+import threading
+
+import pytest
+
+from routinenotifier import scheduler
+from routinenotifier.cache import AsyncCachingSynthesizer
+from routinenotifier.config import AppConfig, Schedule, Weekday
+from routinenotifier.tts import AsyncGoogleTTS, AsyncSynthesizer, SynthesisRequest
+
+
+class FakeAsyncSynth(AsyncSynthesizer):  # type: ignore[misc]
+    def __init__(self) -> None:
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+
+    async def synthesize(
+        self,
+        text: str,
+        *,
+        language_code: str = "ja-JP",
+        voice_name: str | None = None,
+        speaking_rate: float = 1.0,
+        pitch: float = 0.0,
+        audio_encoding: str = "MP3",
+    ) -> bytes:
+        self.calls += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return f"{text}|{audio_encoding}".encode()
+
+
+def test_async_cache_overlaps_misses_and_serves_hits(tmp_path: Path) -> None:
+    inner = FakeAsyncSynth()
+    cache = AsyncCachingSynthesizer(inner, cache_dir=tmp_path)
+
+    async def go() -> tuple[list[bytes], bytes]:
+        items = [SynthesisRequest(t, audio_encoding="MP3") for t in ["a", "b", "c", "a"]]
+        out = await cache.synthesize_many(items, max_workers=3)
+        again = await cache.synthesize("b", audio_encoding="MP3")
+        return out, again
+
+    out, again = asyncio.run(go())
+    assert out == [b"a|MP3", b"b|MP3", b"c|MP3", b"a|MP3"]
+    assert again == b"b|MP3"
+    assert inner.calls == 3
+    assert inner.max_active > 1
+
+
+def test_async_google_tts_uses_async_client() -> None:
+    pytest.importorskip("google.cloud.texttospeech")
+
+    class Response:
+        def __init__(self, audio: bytes) -> None:
+            self.audio_content = audio
+
+    class FakeAsyncClient:
+        async def synthesize_speech(self, **kwargs: object) -> Response:
+            await asyncio.sleep(0)
+            return Response(kwargs["input"].text.encode())  # type: ignore[attr-defined]
+
+    tts = AsyncGoogleTTS(client=FakeAsyncClient())
+    items = [SynthesisRequest(t, audio_encoding="MP3") for t in ["x", "y", "x"]]
+    assert asyncio.run(tts.synthesize_many(items)) == [b"x", b"y", b"x"]
+
+
+def test_run_forever_async_fires_due_batch(monkeypatch: pytest.MonkeyPatch) -> None:
+    fixed = datetime(2024, 1, 1, 7, 0, 10)  # Monday
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz: object = None) -> FrozenDatetime:  # type: ignore[override]
+            return cls.fromtimestamp(fixed.timestamp())
+
+    played: list[bytes] = []
+    monkeypatch.setattr(scheduler, "datetime", FrozenDatetime)
+    monkeypatch.setattr(scheduler, "play_audio_bytes", lambda a, encoding: played.append(a))
+
+    cfg = AppConfig(
+        schedules=[
+            Schedule(name="A", time="07:00", days=[Weekday.mon], message="a"),
+            Schedule(name="B", time="07:00", days=[Weekday.mon], message="b"),
+            Schedule(name="C", time="08:00", days=[Weekday.mon], message="c"),
+        ]
+    )
+    inner = FakeAsyncSynth()
+
+    async def go() -> None:
+        task = asyncio.create_task(
+            scheduler.run_forever_async(cfg, inner, audio_encoding="MP3", prefetch_minutes=5)
+        )
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            if len(played) == 2:
+                break
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(go())
+    assert played == [b"a|MP3", b"b|MP3"]
+
+
+def test_run_forever_async_keeps_time_past_slow_and_failed_announcements(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    now = [datetime(2024, 1, 1, 6, 59, 50)]  # Monday
+    gate = threading.Event()
+    played: list[bytes] = []
+    stalled: list[bool] = []
+
+    class Boom(FakeAsyncSynth):
+        async def synthesize(self, text: str, **kwargs: object) -> bytes:  # type: ignore[override]
+            if text == "boom":
+                raise RuntimeError("tts down")
+            return await super().synthesize(text, **kwargs)  # type: ignore[arg-type]
+
+    class SlowPlayer:
+        def prepare(self, audio: bytes, *, encoding: str) -> None:
+            pass
+
+        def play(self, audio: bytes, *, encoding: str) -> None:
+            if audio.startswith(b"slow"):
+                gate.wait(5)
+            played.append(audio)
+
+    class Stop(Exception):
+        pass
+
+    async def sleep(sec: float) -> None:
+        if now[0] >= datetime(2024, 1, 1, 7, 2):
+            # Every entry has fired while the first clip is still playing.
+            stalled.append(bool(played))
+            gate.set()
+            for _ in range(200):
+                if len(played) == 2:
+                    break
+                await asyncio.sleep(0.01)
+            raise Stop
+        now[0] += timedelta(seconds=sec)
+        await asyncio.sleep(0)
+
+    cfg = AppConfig(
+        schedules=[
+            Schedule(name="A", time="07:00", days=[Weekday.mon], message="slow"),
+            Schedule(name="B", time="07:01", days=[Weekday.mon], message="boom"),
+            Schedule(name="C", time="07:02", days=[Weekday.mon], message="c"),
+        ]
+    )
+    with pytest.raises(Stop):
+        asyncio.run(
+            scheduler.run_forever_async(
+                cfg, Boom(), player=SlowPlayer(), clock=lambda: now[0], sleep=sleep
+            )
+        )
+    assert stalled == [False]
+    assert played == [b"slow|MP3", b"c|MP3"]
+    assert "Announcement 'B' failed: tts down" in capsys.readouterr().out
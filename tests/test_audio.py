@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import io
+from pathlib import Path
+import sys
+from typing import Any
+import wave
+
+import pytest
+
+from routinenotifier import audio
+from routinenotifier.audio import (
+    StreamingPlayer,
+    concat_wav,
+    decode_to_pcm,
+    play_audio,
+    play_audio_bytes,
+)
+
+
+def _wav(pcm: bytes, rate: int = 24000) -> bytes:
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        w.writeframes(pcm)
+    return buf.getvalue()
+
+
+def _file_sink(path: Path) -> Any:
+    def command(rate: int, channels: int) -> list[str]:
+        script = (
+            "import shutil, sys\n"
+            f"with open({str(path)!r}, 'ab') as f:\n"
+            f"    f.write(b'[{rate}]')\n"
+            "    shutil.copyfileobj(sys.stdin.buffer, f)\n"
+        )
+        return [sys.executable, "-c", script]
+
+    return command
+
+
+def test_streaming_player_reuses_one_sink(tmp_path: Path) -> None:
+    out = tmp_path / "sink.raw"
+    with StreamingPlayer(sink_command=_file_sink(out)) as player:
+        player.prepare(_wav(b"\x01\x00" * 100), encoding="LINEAR16")
+        player.play(_wav(b"\x01\x00" * 100), encoding="LINEAR16")
+        player.play(_wav(b"\x02\x00" * 50), encoding="LINEAR16")
+        assert player.sink_starts == 1
+        # A different sample format restarts the sink
+        player.play(_wav(b"\x03\x00" * 10, rate=16000), encoding="LINEAR16")
+        assert player.sink_starts == 2
+    expected = b"[24000]" + b"\x01\x00" * 100 + b"\x02\x00" * 50 + b"[16000]" + b"\x03\x00" * 10
+    assert out.read_bytes() == expected
+
+
+def test_undecodable_clip_falls_back_to_spawning(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(audio.shutil, "which", lambda name: None)
+    played: list[bytes] = []
+    monkeypatch.setattr(audio, "play_audio", lambda a, encoding: played.append(a))
+    assert decode_to_pcm(b"ID3...", encoding="MP3") is None
+    with StreamingPlayer(sink_command=_file_sink(tmp_path / "sink.raw")) as player:
+        player.play(b"ID3...", encoding="MP3")
+        assert player.sink_starts == 0
+    assert played == [b"ID3..."]
+
+
+def test_evicted_clip_file_is_skipped(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    played: list[object] = []
+    monkeypatch.setattr(audio, "play_audio", lambda a, encoding: played.append(a))
+    gone = tmp_path / "evicted.wav"
+    with StreamingPlayer(sink_command=_file_sink(tmp_path / "sink.raw")) as player:
+        player.prepare(gone, encoding="LINEAR16")
+        player.play(gone, encoding="LINEAR16")
+        assert player.sink_starts == 0
+    assert played == []
+
+
+def test_play_audio_pipes_bytes_and_passes_paths(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[tuple[list[str], Any]] = []
+    monkeypatch.setattr(audio.platform, "system", lambda: "Linux")
+    monkeypatch.setattr(audio, "_choose_player", lambda candidates: "mpg123")
+    monkeypatch.setattr(
+        audio,
+        "_run",
+        lambda cmd, input=None, stdin=None, on_spawn=None: calls.append((cmd, input or stdin)),
+    )
+    clip = tmp_path / "clip.mp3"
+    clip.write_bytes(b"ID3")
+    play_audio(b"ID3", encoding="MP3")
+    play_audio(clip, encoding="MP3")
+    with open(clip, "rb") as f:
+        play_audio(f, encoding="MP3")
+        assert calls == [
+            (["mpg123", "-"], b"ID3"),
+            (["mpg123", str(clip)], None),
+            (["mpg123", "-"], f),
+        ]
+    play_audio(io.BytesIO(b"ID3"), encoding="MP3")
+    assert calls[-1] == (["mpg123", "-"], b"ID3")
+
+
+def test_play_audio_bytes_removes_temp_file(monkeypatch: pytest.MonkeyPatch) -> None:
+    seen: list[Path] = []
+
+    def fake_run(cmd: list[str], on_spawn: object = None) -> None:
+        path = Path(cmd[-1])
+        assert path.read_bytes() == b"RIFF"
+        seen.append(path)
+
+    monkeypatch.setattr(audio.platform, "system", lambda: "Darwin")
+    monkeypatch.setattr(audio, "_choose_player", lambda candidates: "afplay")
+    monkeypatch.setattr(audio, "_run", fake_run)
+    play_audio_bytes(b"RIFF", encoding="LINEAR16")
+    assert len(seen) == 1 and not seen[0].exists()
+
+
+def test_concat_wav_inserts_gap_and_rejects_mixed_formats() -> None:
+    joined = concat_wav([_wav(b"\x01\x00" * 10, 1000), _wav(b"\x02\x00" * 5, 1000)], gap_ms=20)
+    pcm = decode_to_pcm(joined, encoding="LINEAR16")
+    assert pcm is not None and pcm.rate == 1000
+    assert pcm.data == b"\x01\x00" * 10 + b"\x00\x00" * 20 + b"\x02\x00" * 5
+    with pytest.raises(ValueError):
+        concat_wav([_wav(b"\x00\x00", 1000), _wav(b"\x00\x00", 2000)])
+    with pytest.raises(ValueError):
+        concat_wav([b"ID3 not a wav"])
@@ -2,8 +2,10 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from routinenotifier.cache import CachingSynthesizer
-from routinenotifier.tts import Synthesizer
+import pytest
+
+from routinenotifier.cache import CacheKey, CachingSynthesizer, MemoryLRU, WarmResult, warm_cache
+from routinenotifier.tts import SynthesisRequest, Synthesizer, merge_ssml
 
 
 class FakeSynth(Synthesizer):  # type: ignore[misc]
@@ -61,3 +63,146 @@ def test_prune_cache_respects_size(tmp_path: Path) -> None:
     # Prune executed internally; total directory size should be <= 100KB
     total = sum(p.stat().st_size for p in tmp_path.glob("*") if p.is_file())
     assert total <= 100_000
+
+
+def test_warm_cache_dedupes_and_reports(tmp_path: Path) -> None:
+    inner = FakeSynth()
+    cache = CachingSynthesizer(inner, cache_dir=tmp_path, enabled=True)
+    cache.synthesize("a", audio_encoding="MP3")
+    seen: list[WarmResult] = []
+    results = warm_cache(
+        cache, ["a", "b", "a", "c"], audio_encoding="MP3", max_workers=2, on_result=seen.append
+    )
+    assert [r.text for r in results] == ["a", "b", "c"]
+    assert [r.cached for r in results] == [True, False, False]
+    assert len(seen) == 3
+    assert inner.calls == 3
+    assert all(cache.contains(t, audio_encoding="MP3") for t in "abc")
+
+
+def test_warm_cache_reports_failures(tmp_path: Path) -> None:
+    class Failing(FakeSynth):
+        def synthesize(self, text: str, **kwargs: object) -> bytes:  # type: ignore[override]
+            raise RuntimeError("boom")
+
+    cache = CachingSynthesizer(Failing(), cache_dir=tmp_path, enabled=True)
+    (r,) = warm_cache(cache, ["x"])
+    assert r.error == "boom"
+    assert not r.cached
+
+
+def test_synthesize_many_dedupes_and_serves_hits(tmp_path: Path) -> None:
+    inner = FakeSynth()
+    cache = CachingSynthesizer(inner, cache_dir=tmp_path, enabled=True)
+    cache.synthesize("a", audio_encoding="MP3")
+    items = [
+        SynthesisRequest("b", audio_encoding="MP3"),
+        SynthesisRequest("a", audio_encoding="MP3"),
+        SynthesisRequest("b", audio_encoding="mp3"),  # same CacheKey as the first
+        SynthesisRequest("c", audio_encoding="MP3"),
+    ]
+    out = cache.synthesize_many(items, max_workers=3)
+    assert inner.calls == 3  # "a" once up front, then "b" and "c"
+    assert out[0] == out[2]
+    assert out == [cache.synthesize(r.text, audio_encoding="MP3") for r in items]
+    assert inner.calls == 3
+
+
+def test_memory_lru_limits_and_counters() -> None:
+    lru = MemoryLRU(max_entries=2, max_bytes=10)
+    k = [CacheKey(t, "ja-JP", None, 1.0, 0.0, "MP3") for t in "abcd"]
+    lru.put(k[0], b"1234")
+    lru.put(k[1], b"1234")
+    assert lru.get(k[0]) == b"1234"  # a is now most recent
+    lru.put(k[2], b"1234")  # entry limit evicts b
+    assert lru.get(k[1]) is None
+    lru.put(k[3], b"123456")  # byte limit evicts a
+    assert len(lru) == 2 and lru.total_bytes == 10
+    lru.put(k[0], b"x" * 11)  # larger than the whole tier: not kept
+    assert lru.get(k[0]) is None
+    assert (lru.hits, lru.misses, lru.evictions) == (1, 2, 2)
+
+
+def test_memory_tier_serves_repeat_hits(tmp_path: Path) -> None:
+    inner = FakeSynth()
+    cache = CachingSynthesizer(inner, cache_dir=tmp_path, enabled=True)
+    b1 = cache.synthesize("hello", audio_encoding="MP3")
+    for p in tmp_path.glob("*.mp3"):
+        p.unlink()
+    assert cache.synthesize("hello", audio_encoding="MP3") == b1
+    assert inner.calls == 1
+    assert cache.memory is not None and cache.memory.hits == 1
+
+
+class PcmSynth(FakeSynth):
+    def synthesize(self, text: str, **kwargs: object) -> bytes:  # type: ignore[override]
+        self.calls += 1
+        return b"RIFF" + text.encode() + b"\x00\x01" * 4096
+
+
+def test_compression_at_rest_round_trips(tmp_path: Path) -> None:
+    inner = PcmSynth()
+    cache = CachingSynthesizer(inner, cache_dir=tmp_path, compression="zlib", memory_max_entries=0)
+    pcm = cache.synthesize("a", audio_encoding="LINEAR16")
+    mp3 = cache.synthesize("b", audio_encoding="MP3")
+    (stored,) = tmp_path.glob("*.wav")
+    assert stored.read_bytes()[:3] == b"RNZ" and stored.stat().st_size < len(pcm) // 10
+    assert (next(tmp_path.glob("*.mp3"))).read_bytes() == mp3
+    assert cache.synthesize("a", audio_encoding="LINEAR16") == pcm
+    assert inner.calls == 2
+    stats = cache.stats()
+    assert stats.raw_bytes == len(pcm) + len(mp3)
+    assert stats.compression_ratio > 1.5  # the MP3 clip is stored as-is
+    # Turning compression off still reads entries written compressed
+    plain = CachingSynthesizer(inner, cache_dir=tmp_path, memory_max_entries=0)
+    assert plain.synthesize("a", audio_encoding="LINEAR16") == pcm
+    assert inner.calls == 2
+
+
+def test_unknown_compression_rejected(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="compression"):
+        CachingSynthesizer(FakeSynth(), cache_dir=tmp_path, compression="brotli")
+
+
+def test_cached_file_serves_plain_disk_hits(tmp_path: Path) -> None:
+    request = SynthesisRequest("a", audio_encoding="LINEAR16")
+    cache = CachingSynthesizer(PcmSynth(), cache_dir=tmp_path, memory_max_entries=0)
+    assert cache.cached_file(request) is None
+    cache.synthesize_many([request])
+    path = cache.cached_file(request)
+    assert path is not None and path.read_bytes()[:4] == b"RIFF"
+    assert cache.stats().hits == 1
+    packed = CachingSynthesizer(
+        PcmSynth(), cache_dir=tmp_path, compression="zlib", memory_max_entries=0
+    )
+    packed.synthesize("b", audio_encoding="LINEAR16")
+    assert packed.cached_file(SynthesisRequest("b", audio_encoding="LINEAR16")) is None
+
+
+class WavSynth(FakeSynth):
+    def synthesize(self, text: str, **kwargs: object) -> bytes:  # type: ignore[override]
+        import io
+        import wave
+
+        self.calls += 1
+        buf = io.BytesIO()
+        with wave.open(buf, "wb") as w:
+            w.setnchannels(1)
+            w.setsampwidth(2)
+            w.setframerate(1000)
+            w.writeframes(text.encode()[:1] * 2 * 10)
+        return buf.getvalue()
+
+
+def test_merged_linear16_joins_cached_parts(tmp_path: Path) -> None:
+    inner = WavSynth()
+    cache = CachingSynthesizer(inner, cache_dir=tmp_path, memory_max_entries=0)
+    cache.synthesize("a", audio_encoding="LINEAR16")
+    merged = merge_ssml(["a", "b"], break_ms=100)
+    [clip] = cache.synthesize_many([SynthesisRequest(merged, audio_encoding="LINEAR16")])
+    # Only "b" needed the API; the merged clip is then cached under its own key.
+    assert inner.calls == 2
+    assert len(clip) == 44 + 2 * (10 + 100 + 10)
+    assert cache.synthesize(merged, audio_encoding="LINEAR16") == clip
+    assert inner.calls == 2
+    assert cache.contains(merged, audio_encoding="LINEAR16")
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import gc
+from pathlib import Path
+import time
+import weakref
+
+from routinenotifier import cache_index
+from routinenotifier.cache import CacheKey, CachingSynthesizer, clear_cache
+from routinenotifier.cache_index import CacheIndex
+from routinenotifier.tts import DummyTTS
+
+
+def _name(c: str, ext: str = "mp3") -> str:
+    return f"{c * 64}.{ext}"
+
+
+def test_running_total_and_lru_eviction(tmp_path: Path) -> None:
+    idx = CacheIndex(tmp_path)
+    key = CacheKey("hi", "ja-JP", "v", 1.0, 0.0, "mp3")
+    idx.record(_name("a"), 100, key)
+    time.sleep(0.01)
+    idx.record(_name("b"), 50)
+    time.sleep(0.01)
+    idx.record(_name("c"), 30)
+    idx.record(_name("b"), 60)  # rewrite: total follows the new size
+    assert idx.total_bytes() == 190
+    time.sleep(0.01)
+    idx.touch(_name("a"))  # a becomes most recent
+    assert idx.evict_to(100) == [_name("c"), _name("b")]  # rewriting b refreshed it
+    assert idx.total_bytes() == 100
+    assert len(idx) == 1
+
+
+def test_rebuild_from_directory_when_missing(tmp_path: Path) -> None:
+    (tmp_path / _name("a", "wav")).write_bytes(b"x" * 10)
+    (tmp_path / _name("b", "ogg")).write_bytes(b"x" * 20)
+    (tmp_path / "rn-tmp.ogg").write_bytes(b"x" * 99)  # not a clip
+    idx = CacheIndex(tmp_path)
+    assert len(idx) == 2
+    assert idx.total_bytes() == 30
+    idx.close()
+    # An existing index is reused as-is
+    (tmp_path / _name("c")).write_bytes(b"x")
+    assert CacheIndex(tmp_path).total_bytes() == 30
+
+
+def test_caching_synth_prunes_via_index_and_clear_resets(tmp_path: Path) -> None:
+    cache = CachingSynthesizer(DummyTTS(), cache_dir=tmp_path, max_size_bytes=15_000)
+    for text in ["a", "b", "c"]:  # ~6.4 KB each
+        cache.synthesize(text, audio_encoding="LINEAR16")
+    index = cache.store.index
+    assert index is not None
+    assert index.total_bytes() <= 15_000
+    assert len(list(tmp_path.glob("*.wav"))) == len(index) == 2
+    clear_cache(tmp_path)
+    assert not list(tmp_path.glob("*.wav"))
+    assert index.total_bytes() == 0
+
+
+def test_stats_breakdown_and_counters(tmp_path: Path) -> None:
+    cache = CachingSynthesizer(
+        DummyTTS(), cache_dir=tmp_path, memory_max_entries=0, max_size_bytes=15_000
+    )
+    cache.synthesize("a", voice_name="v1", audio_encoding="LINEAR16")
+    cache.synthesize("a", voice_name="v1", audio_encoding="LINEAR16")  # hit
+    cache.synthesize("b", voice_name="v2", audio_encoding="LINEAR16")
+    cache.synthesize("c", voice_name="v2", audio_encoding="MP3")  # evicts "a"
+    stats = cache.stats()
+    assert stats.entries == 2
+    assert (stats.hits, stats.misses, stats.evictions) == (1, 3, 1)
+    assert stats.bytes_saved == stats.total_bytes // 2
+    assert set(stats.by_encoding) == {"LINEAR16", "MP3"}
+    assert stats.by_voice == {"v2": {"entries": 2, "bytes": stats.total_bytes}}
+    assert stats.age["<1h"] == 2
+    assert stats.memory is None
+    assert stats.to_dict()["hit_ratio"] == 0.25
+
+
+def test_cli_cache_stats_json(tmp_path: Path) -> None:
+    import json
+
+    from typer.testing import CliRunner
+
+    from routinenotifier.cli import app
+
+    cache = CachingSynthesizer(DummyTTS(), cache_dir=tmp_path)
+    cache.synthesize("a", audio_encoding="LINEAR16")
+    cache.synthesize("a", audio_encoding="LINEAR16")
+    assert cache.store.index is not None
+    cache.store.index.flush()
+
+    result = CliRunner().invoke(app, ["cache-stats", "--cache-dir", str(tmp_path), "--json"])
+    assert result.exit_code == 0, result.output
+    payload = json.loads(result.output)
+    assert payload["entries"] == 1
+    assert payload["hits"] == 1 and payload["misses"] == 1
+    assert payload["by_encoding"]["LINEAR16"]["entries"] == 1
+
+    result = CliRunner().invoke(app, ["cache-stats", "--cache-dir", str(tmp_path)])
+    assert "Hit ratio: 50.0%" in result.output
+
+
+def test_exit_flush_does_not_keep_indexes_alive(tmp_path: Path) -> None:
+    index = CacheIndex(tmp_path)
+    index.count(hits=2)  # buffered
+    cache_index._flush_open_indexes()
+    other = CacheIndex(tmp_path)
+    assert other.stats().hits == 2
+    other.close()
+    assert other not in cache_index._OPEN
+    ref = weakref.ref(index)
+    del index
+    gc.collect()
+    assert ref() is None
@@ -23,7 +23,7 @@ def test_cli_validate_ok(tmp_path: Path):
     cfg_path.write_text(json.dumps(cfg), encoding="utf-8")
 
     runner = CliRunner()
-    result = runner.invoke(app, ["validate", str(cfg_path)])
+    result = runner.invoke(app, ["validate", str(cfg_path), "--cache-dir", str(tmp_path)])
     assert result.exit_code == 0
     assert "Config is valid" in result.output
 
@@ -34,6 +34,6 @@ def test_cli_validate_fail(tmp_path: Path):
     cfg_path.write_text(json.dumps(cfg), encoding="utf-8")
 
     runner = CliRunner()
-    result = runner.invoke(app, ["validate", str(cfg_path)])
+    result = runner.invoke(app, ["validate", str(cfg_path), "--cache-dir", str(tmp_path)])
     assert result.exit_code != 0
     assert "validation" in result.output.lower()
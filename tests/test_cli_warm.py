@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from typer.testing import CliRunner
+
+from routinenotifier import tts
+from routinenotifier.cli import app
+from routinenotifier.tts import DummyTTS
+
+
+def test_cli_warm_fills_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cfg = {
+        "schedules": [
+            {"name": "A", "time": "06:00", "days": ["mon"], "message": "Wake up"},
+            {"name": "B", "time": "07:00", "days": ["tue"], "message": "Wake up"},
+            {"name": "C", "time": "08:00", "days": ["wed"], "message": "Go"},
+        ]
+    }
+    cfg_path = tmp_path / "cfg.json"
+    cfg_path.write_text(json.dumps(cfg), encoding="utf-8")
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(tts, "GoogleTTS", DummyTTS)
+
+    runner = CliRunner()
+    args = ["warm", "--config", str(cfg_path), "--cache-dir", str(cache_dir)]
+    result = runner.invoke(app, args)
+    assert result.exit_code == 0, result.output
+    assert "Warmed 2 messages: 0 cached, 2 synthesized, 0 failed." in result.output
+    assert len(list(cache_dir.glob("*.ogg"))) == 2
+
+    result = runner.invoke(app, args)
+    assert "Warmed 2 messages: 2 cached" in result.output
+
+
+def test_cli_speak_plays_cache_hit_from_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from routinenotifier import audio
+
+    played: list[object] = []
+    monkeypatch.setattr(tts, "GoogleTTS", DummyTTS)
+    monkeypatch.setattr(audio, "play_audio", lambda clip, encoding: played.append(clip))
+    runner = CliRunner()
+    args = ["speak", "hello", "--cache-dir", str(tmp_path), "--audio-encoding", "MP3"]
+    assert runner.invoke(app, args).exit_code == 0
+    assert runner.invoke(app, args).exit_code == 0
+    assert isinstance(played[0], bytes)
+    assert played[1] == next(tmp_path.glob("*.mp3"))
+
+
+def test_cli_speak_streams_and_caches_sentences(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from routinenotifier import audio
+
+    played: list[object] = []
+    monkeypatch.setattr(tts, "GoogleTTS", DummyTTS)
+    monkeypatch.setattr(audio, "play_audio", lambda clip, encoding: played.append(clip))
+    runner = CliRunner()
+    base = ["--cache-dir", str(tmp_path), "--audio-encoding", "MP3", "--stream-sentences"]
+    assert runner.invoke(app, ["speak", "One. Two.", *base]).exit_code == 0
+    assert len(played) == 2 and len(list(tmp_path.glob("*.mp3"))) == 2
+    # The shared sentence is reused from the cache
+    assert runner.invoke(app, ["speak", "Two. Three.", *base]).exit_code == 0
+    assert isinstance(played[2], Path) and len(list(tmp_path.glob("*.mp3"))) == 3
+
+
+def test_cli_speak_derives_variants(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("numpy")
+    from routinenotifier import audio, cache
+
+    made: list[cache.CachingSynthesizer] = []
+
+    class Recording(cache.CachingSynthesizer):
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            super().__init__(*args, **kwargs)
+            made.append(self)
+
+    monkeypatch.setattr(tts, "GoogleTTS", DummyTTS)
+    monkeypatch.setattr(cache, "CachingSynthesizer", Recording)
+    monkeypatch.setattr(audio, "play_audio", lambda clip, encoding: None)
+    runner = CliRunner()
+    args = ["speak", "hello", "--cache-dir", str(tmp_path), "--audio-encoding", "LINEAR16"]
+    assert runner.invoke(app, [*args, "--derive-variants"]).exit_code == 0
+    assert runner.invoke(app, args).exit_code == 0
+    assert [c.derive_variants for c in made] == [True, False]
+
+
+def test_cli_run_watches_only_when_asked(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from routinenotifier import scheduler
+
+    cfg_path = tmp_path / "cfg.json"
+    entry = {"name": "A", "time": "06:00", "days": ["mon"], "message": "Wake up"}
+    cfg_path.write_text(json.dumps({"schedules": [entry]}), encoding="utf-8")
+    watched: list[object] = []
+    monkeypatch.setattr(tts, "GoogleTTS", DummyTTS)
+    monkeypatch.setattr(scheduler, "run_forever", lambda *a, **kw: watched.append(kw["reloader"]))
+    runner = CliRunner()
+    args = ["run", "--config", str(cfg_path), "--cache-dir", str(tmp_path), "--event-driven"]
+    assert runner.invoke(app, args).exit_code == 0
+    assert runner.invoke(app, [*args, "--watch"]).exit_code == 0
+    assert watched[0] is None
+    assert getattr(watched[1], "path", None) == cfg_path
+
+
+def test_cli_run_reloads_edits_made_during_prewarm(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from routinenotifier import cli, scheduler
+
+    cfg_path = tmp_path / "cfg.json"
+    entry = {"name": "A", "time": "06:00", "days": ["mon"], "message": "Wake up"}
+    cfg_path.write_text(json.dumps({"schedules": [entry]}), encoding="utf-8")
+    edited = {**entry, "message": "Wake up now"}
+
+    def warm(*args: object, **kwargs: object) -> None:
+        cfg_path.write_text(json.dumps({"schedules": [edited]}), encoding="utf-8")
+
+    updates: list[object] = []
+    monkeypatch.setattr(tts, "GoogleTTS", DummyTTS)
+    monkeypatch.setattr(cli, "_warm", warm)
+    monkeypatch.setattr(
+        scheduler, "run_forever", lambda *a, **kw: updates.append(kw["reloader"].poll())
+    )
+    args = ["run", "--config", str(cfg_path), "--cache-dir", str(tmp_path / "cache")]
+    result = CliRunner().invoke(app, [*args, "--event-driven", "--prewarm", "--watch"])
+    assert result.exit_code == 0, result.output
+    assert updates[0] is not None
+
+
+def test_cli_warm_caches_sentences_for_streaming(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cfg_path = tmp_path / "cfg.json"
+    entry = {"name": "A", "time": "06:00", "days": ["mon"], "message": "Wake up. Go. Wake up."}
+    cfg_path.write_text(json.dumps({"schedules": [entry]}), encoding="utf-8")
+    monkeypatch.setattr(tts, "GoogleTTS", DummyTTS)
+    args = ["warm", "--config", str(cfg_path), "--cache-dir", str(tmp_path), "--stream-sentences"]
+    result = CliRunner().invoke(app, args)
+    assert result.exit_code == 0, result.output
+    assert "Warmed 2 messages: 0 cached, 2 synthesized" in result.output
+    assert len(list(tmp_path.glob("*.ogg"))) == 2
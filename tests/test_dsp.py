@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import io
+from pathlib import Path
+import wave
+
+import pytest
+
+from routinenotifier.cache import CacheKey, CachingSynthesizer
+from routinenotifier.dsp import render_variant
+from routinenotifier.tts import SynthesisRequest
+
+np = pytest.importorskip("numpy")
+
+RATE = 24000
+
+
+def _tone(freq: float = 200.0, seconds: float = 1.0) -> bytes:
+    t = np.arange(int(RATE * seconds)) / RATE
+    pcm = (8000 * np.sin(2 * np.pi * freq * t)).astype("<i2").tobytes()
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(RATE)
+        w.writeframes(pcm)
+    return buf.getvalue()
+
+
+def _analyze(wav: bytes) -> tuple[float, float]:
+    with wave.open(io.BytesIO(wav)) as r:
+        y = np.frombuffer(r.readframes(r.getnframes()), "<i2").astype(float)
+    peak = np.argmax(np.abs(np.fft.rfft(y))) * RATE / len(y)
+    return len(y) / RATE, float(peak)
+
+
+def test_render_variant_changes_rate_and_pitch_independently() -> None:
+    src = _tone()
+    seconds, freq = _analyze(render_variant(src, rate_factor=1.25, semitones=0))
+    assert seconds == pytest.approx(0.8, abs=0.01) and freq == pytest.approx(200, abs=3)
+    seconds, freq = _analyze(render_variant(src, rate_factor=1.0, semitones=12))
+    assert seconds == pytest.approx(1.0, abs=0.01) and freq == pytest.approx(400, abs=3)
+
+
+class ToneSynth:
+    def __init__(self) -> None:
+        self.requests: list[tuple[str, float, float, str]] = []
+
+    def synthesize(
+        self,
+        text: str,
+        *,
+        speaking_rate: float = 1.0,
+        pitch: float = 0.0,
+        audio_encoding: str = "LINEAR16",
+        **_: object,
+    ) -> bytes:
+        self.requests.append((text, speaking_rate, pitch, audio_encoding))
+        return _tone(seconds=0.5)
+
+    def synthesize_many(
+        self, items: list[SynthesisRequest], *, max_workers: int = 4
+    ) -> list[bytes]:
+        return [
+            self.synthesize(r.text, speaking_rate=r.speaking_rate, pitch=r.pitch) for r in items
+        ]
+
+
+def test_variants_derived_from_canonical_render(tmp_path: Path) -> None:
+    inner = ToneSynth()
+    cache = CachingSynthesizer(inner, cache_dir=tmp_path, derive_variants=True)  # type: ignore[arg-type]
+    a = cache.synthesize("hi", speaking_rate=1.2, pitch=-3.0, audio_encoding="LINEAR16")
+    b = cache.synthesize("hi", speaking_rate=1.25, pitch=-3.0, audio_encoding="LINEAR16")
+    assert inner.requests == [("hi", 1.0, 0.0, "LINEAR16")]
+    assert _analyze(a)[0] == pytest.approx(0.5 / 1.2, abs=0.01)
+    assert _analyze(b)[0] == pytest.approx(0.5 / 1.25, abs=0.01)
+    # Each variant is cached under its own key
+    assert cache.contains("hi", speaking_rate=1.25, pitch=-3.0, audio_encoding="LINEAR16")
+    # Too far from canonical, or not PCM: ask the API
+    cache.synthesize("hi", speaking_rate=2.0, pitch=0.0, audio_encoding="LINEAR16")
+    cache.synthesize("hi", speaking_rate=1.1, pitch=0.0, audio_encoding="MP3")
+    assert [r[1:] for r in inner.requests[1:]] == [(2.0, 0.0, "LINEAR16"), (1.1, 0.0, "MP3")]
+
+
+def test_synthesize_many_batches_canonical_renders(tmp_path: Path) -> None:
+    inner = ToneSynth()
+    cache = CachingSynthesizer(inner, cache_dir=tmp_path, derive_variants=True)  # type: ignore[arg-type]
+    items = [
+        SynthesisRequest(t, speaking_rate=1.1, pitch=1.0, audio_encoding="LINEAR16")
+        for t in ("a", "b", "a")
+    ]
+    out = cache.synthesize_many(items)
+    assert out[0] == out[2] and len(out) == 3
+    assert sorted(inner.requests) == [("a", 1.0, 0.0, "LINEAR16"), ("b", 1.0, 0.0, "LINEAR16")]
+    key = CacheKey("a", "ja-JP", "ja-JP-Wavenet-A", 1.1, 1.0, "LINEAR16")
+    assert cache.store.contains(key)
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+import json
+from pathlib import Path
+import threading
+import time
+import urllib.request
+
+from routinenotifier.metrics import (
+    PLAYBACK,
+    QUEUE_LAG,
+    SYNTHESIS,
+    Histogram,
+    Metrics,
+    serve_metrics,
+)
+from routinenotifier.scheduler import PlaybackJob, PlaybackQueue, Prefetcher
+
+
+def test_histogram_buckets_and_quantiles() -> None:
+    h = Histogram((0.1, 1.0))
+    for v in (0.05, 0.5, 0.5, 3.0):
+        h.observe(v)
+    assert h.cumulative()[-1][1] == 4
+    assert [n for _, n in h.cumulative()] == [1, 3, 4]
+    assert h.quantile(0.5) == 1.0
+    assert h.quantile(1.0) == 3.0  # past the last bound: the observed max
+    assert (h.count, h.sum, h.max) == (4, 4.05, 3.0)
+
+
+def test_metrics_export_formats(tmp_path: Path) -> None:
+    m = Metrics(buckets=(0.5,))
+    m.observe(SYNTHESIS, 0.2, source="hit")
+    m.observe(SYNTHESIS, 0.9, source="miss")
+    text = m.to_prometheus()
+    assert "# TYPE routinenotifier_synthesis_seconds histogram" in text
+    assert 'routinenotifier_synthesis_seconds_bucket{source="hit",le="0.5"} 1' in text
+    assert 'routinenotifier_synthesis_seconds_bucket{source="miss",le="+Inf"} 1' in text
+    assert 'routinenotifier_synthesis_seconds_count{source="miss"} 1' in text
+
+    m.write(tmp_path / "m.json")
+    data = json.loads((tmp_path / "m.json").read_text())
+    [hit, miss] = data[SYNTHESIS]
+    assert hit["labels"] == {"source": "hit"} and miss["max"] == 0.9
+    m.write(tmp_path / "m.prom")
+    assert (tmp_path / "m.prom").read_text() == text
+
+
+def test_serve_metrics_over_http() -> None:
+    m = Metrics()
+    m.observe(PLAYBACK, 1.5)
+    server = serve_metrics(m, 0)
+    try:
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        with urllib.request.urlopen(f"{base}/metrics") as r:
+            assert b"routinenotifier_playback_seconds_count 1" in r.read()
+        with urllib.request.urlopen(f"{base}/metrics.json") as r:
+            assert json.load(r)[PLAYBACK][0]["sum"] == 1.5
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_playback_queue_records_lag_and_duration() -> None:
+    m = Metrics()
+    q = PlaybackQueue(lambda clip: None, clock=lambda: 100.0, metrics=m)
+    try:
+        q.submit(PlaybackJob("a", due=98.0, clips=lambda: [b"x", b"y"]))
+        assert q.join(5)
+    finally:
+        q.close()
+    lag = m.get(QUEUE_LAG)
+    playback = m.get(PLAYBACK)
+    assert lag is not None and lag.sum == 2.0
+    assert playback is not None and playback.count == 2
+
+
+def test_prefetcher_labels_synthesis_by_cache_state() -> None:
+    m = Metrics()
+    gate = threading.Event()
+
+    def synth(texts: Sequence[str]) -> list[bytes | Path]:
+        if "slow" in texts:
+            gate.wait(5)
+        return [t.encode() for t in texts]
+
+    pf = Prefetcher(synth, metrics=m, cached=lambda texts: set(texts) <= {"stored"})
+    try:
+        pf.prefetch(["early"])
+        pf._pending["early"][0].result()  # let the background batch finish
+        assert pf.get_many(["early"]) == [b"early"]  # prefetch
+        assert pf.get_many(["stored"]) == [b"stored"]  # hit
+        assert pf.get_many(["new"]) == [b"new"]  # miss
+        # Claimed while its prefetch is still running: waiting on synthesis is a miss.
+        pf.prefetch(["slow"])
+        waiter = threading.Thread(target=pf.get_many, args=(["slow"],))
+        waiter.start()
+        for _ in range(500):
+            if "slow" not in pf._pending:
+                break
+            time.sleep(0.01)
+        gate.set()
+        waiter.join(5)
+    finally:
+        pf.shutdown()
+    counts = {}
+    for source in ("prefetch", "hit", "miss"):
+        h = m.get(SYNTHESIS, source=source)
+        counts[source] = h.count if h is not None else 0
+    assert counts == {"prefetch": 1, "hit": 1, "miss": 2}
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from pathlib import Path
+import shutil
+
+import pytest
+
+from routinenotifier.cache import CacheKey, CachingSynthesizer, FileStore, clear_cache
+from routinenotifier.pack_store import PACK_DIRNAME, PackStore
+from routinenotifier.tts import DummyTTS
+
+
+def _key(text: str) -> CacheKey:
+    return CacheKey(text, "ja-JP", "v", 1.0, 0.0, "MP3")
+
+
+def test_put_get_returns_views(tmp_path: Path) -> None:
+    store = PackStore(tmp_path)
+    store.put(_key("a"), b"alpha")
+    store.put(_key("b"), b"bravo!")
+    view = store.get(_key("a"))
+    assert isinstance(view, memoryview)
+    assert bytes(view) == b"alpha"
+    assert bytes(store.get(_key("b")) or b"") == b"bravo!"
+    assert store.get(_key("c")) is None
+    assert store.contains(_key("b")) and not store.contains(_key("c"))
+    # A single data file regardless of the number of clips
+    assert [p.name for p in (tmp_path / PACK_DIRNAME).glob("*.pack")] == ["audio.pack"]
+
+
+def test_evict_then_compact_reclaims_space(tmp_path: Path) -> None:
+    store = PackStore(tmp_path, max_size_bytes=250)
+    for t in "abcd":
+        store.put(_key(t), t.encode() * 100)
+    store.prune()  # evicts a and b from the index; dead space stays in the file
+    assert store.get(_key("a")) is None
+    before = store.path.stat().st_size
+    reclaimed = store.compact()
+    assert reclaimed > 0 and store.path.stat().st_size == before - reclaimed
+    assert bytes(store.get(_key("c")) or b"") == b"c" * 100
+    assert bytes(store.get(_key("d")) or b"") == b"d" * 100
+
+
+def test_append_indexes_record_while_holding_pack_lock(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    fcntl = pytest.importorskip("fcntl")
+    store = PackStore(tmp_path)
+    held: list[bool] = []
+    record = store.index.record
+
+    def checked(*args: object, **kwargs: object) -> None:
+        # A compaction in another process would block here until the row is written.
+        with open(store.path, "rb") as other:
+            try:
+                fcntl.flock(other.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                held.append(True)
+            else:
+                held.append(False)
+        record(*args, **kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(store.index, "record", checked)
+    store.put(_key("a"), b"alpha")
+    assert held == [True]
+    assert bytes(store.get(_key("a")) or b"") == b"alpha"
+
+
+def test_index_rebuilt_from_pack(tmp_path: Path) -> None:
+    store = PackStore(tmp_path)
+    store.put(_key("a"), b"old")
+    store.put(_key("a"), b"new")
+    store.index.close()
+    shutil.rmtree(tmp_path / PACK_DIRNAME / ".index")
+    again = PackStore(tmp_path)
+    assert len(again.index) == 1
+    assert bytes(again.get(_key("a")) or b"") == b"new"
+
+
+def test_import_from_file_layout_keeps_keys(tmp_path: Path) -> None:
+    files = FileStore(tmp_path)
+    files.put(_key("a"), b"alpha")
+    files.put(_key("b"), b"bravo")
+    store = PackStore(tmp_path)
+    assert store.import_files() == 2
+    assert not list(tmp_path.glob("*.mp3"))
+    assert bytes(store.get(_key("a")) or b"") == b"alpha"
+    assert store.index.stats().by_voice == {"v": {"entries": 2, "bytes": 10}}
+
+
+def test_caching_synth_pack_backend(tmp_path: Path) -> None:
+    cache = CachingSynthesizer(DummyTTS(), cache_dir=tmp_path, backend="pack", memory_max_entries=0)
+    b1 = cache.synthesize("a", audio_encoding="LINEAR16")
+    b2 = cache.synthesize("a", audio_encoding="LINEAR16")
+    assert b1 == b2 and isinstance(b2, bytes)
+    assert cache.stats().hits == 1
+    assert not list(tmp_path.glob("*.wav"))
+    clear_cache(tmp_path)
+    assert cache.store.get(_key("a")) is None
+    assert len(cache.store.index) == 0
@@ -1,9 +1,33 @@
 from __future__ import annotations
 
-from datetime import datetime
+from collections.abc import Callable
+from datetime import datetime, timedelta
+import json
+import os
+from pathlib import Path
+import threading
+import time
 
+import pytest
+
+from routinenotifier import scheduler
+from routinenotifier.cache import CachingSynthesizer, warm_cache
 from routinenotifier.config import AppConfig, Schedule, Weekday
-from routinenotifier.scheduler import due_indices
+from routinenotifier.scheduler import (
+    FireQueue,
+    PlaybackJob,
+    PlaybackQueue,
+    PlaybackStats,
+    Prefetcher,
+    announcement_texts,
+    due_indices,
+    next_occurrence,
+    run_forever,
+    upcoming_groups,
+    upcoming_indices,
+)
+from routinenotifier.table import ScheduleTable, load_table
+from routinenotifier.tts import Synthesizer, merge_ssml
 
 
 def _cfg_at(hh: int, mm: int, days):
@@ -30,3 +54,495 @@ def test_due_indices_skip_wrong_day():
     cfg = _cfg_at(7, 0, [Weekday.tue])
     now = datetime(2024, 1, 1, 7, 0)  # Monday
     assert due_indices(cfg, now=now) == []
+
+
+def test_due_indices_reuse_config_table_until_schedules_change(monkeypatch):
+    cfg = _cfg_at(7, 0, [Weekday.mon])
+    now = datetime(2024, 1, 1, 7, 0)
+    builds: list[AppConfig] = []
+    build = ScheduleTable.from_config
+    monkeypatch.setattr(ScheduleTable, "from_config", lambda c: builds.append(c) or build(c))
+    assert due_indices(cfg, now=now) == [0]
+    assert due_indices(cfg, now=now) == [0]
+    assert len(builds) == 1
+    cfg.schedules.append(Schedule(name="B", time="07:00", days=[Weekday.mon], message="b"))
+    assert due_indices(cfg, now=now) == [0, 1]
+    assert len(builds) == 2
+
+
+def test_next_occurrence_same_minute_and_next_week():
+    s = Schedule(name="A", time="07:00", days=[Weekday.mon], message="m")
+    # Monday 07:00:30 still counts as the 07:00 minute
+    assert next_occurrence(s, after=datetime(2024, 1, 1, 7, 0, 30)) == datetime(2024, 1, 1, 7, 0)
+    assert next_occurrence(s, after=datetime(2024, 1, 1, 7, 1)) == datetime(2024, 1, 8, 7, 0)
+
+
+def test_next_occurrence_no_days():
+    s = Schedule(name="A", time="07:00", days=[], message="m")
+    assert next_occurrence(s, after=datetime(2024, 1, 1, 7, 0)) is None
+
+
+def test_fire_queue_orders_and_reinserts():
+    cfg = AppConfig(
+        schedules=[
+            Schedule(name="A", time="08:00", days=[Weekday.mon, Weekday.tue], message="a"),
+            Schedule(name="B", time="07:30", days=[Weekday.mon], message="b"),
+        ]
+    )
+    q = FireQueue(cfg, now=datetime(2024, 1, 1, 6, 0))  # Monday
+    assert q.next_time() == datetime(2024, 1, 1, 7, 30)
+    assert q.pop_due(datetime(2024, 1, 1, 7, 0)) == []
+    assert q.pop_due(datetime(2024, 1, 1, 8, 0)) == [
+        (datetime(2024, 1, 1, 7, 30), 1),
+        (datetime(2024, 1, 1, 8, 0), 0),
+    ]
+    # A fires again Tuesday, B next Monday
+    assert q.next_time() == datetime(2024, 1, 2, 8, 0)
+    assert len(q) == 2
+
+
+def test_due_index_groups_same_slot_and_dedupes_days():
+    cfg = AppConfig(
+        schedules=[
+            Schedule(name="A", time="07:00", days=[Weekday.mon, Weekday.mon], message="a"),
+            Schedule(name="B", time="07:01", days=[Weekday.mon], message="b"),
+            Schedule(name="C", time="07:00", days=[Weekday.sun, Weekday.mon], message="c"),
+        ]
+    )
+    assert due_indices(cfg, now=datetime(2024, 1, 1, 7, 0)) == [0, 2]
+    assert due_indices(cfg, now=datetime(2024, 1, 7, 7, 0)) == [2]  # Sunday
+
+
+def test_upcoming_indices_window():
+    cfg = AppConfig(
+        schedules=[
+            Schedule(name="A", time="07:00", days=[Weekday.mon], message="a"),
+            Schedule(name="B", time="07:05", days=[Weekday.mon], message="b"),
+            Schedule(name="C", time="07:06", days=[Weekday.mon], message="c"),
+            Schedule(name="D", time="00:01", days=[Weekday.tue], message="d"),
+        ]
+    )
+    assert upcoming_indices(cfg, now=datetime(2024, 1, 1, 7, 0, 30), minutes=5) == [0, 1]
+    # Window crosses midnight into Tuesday
+    assert upcoming_indices(cfg, now=datetime(2024, 1, 1, 23, 58), minutes=3) == [3]
+    assert upcoming_groups(cfg, now=datetime(2024, 1, 1, 7, 0), minutes=5) == [[0], [1]]
+
+
+def test_prefetcher_reuses_background_result():
+    batches: list[list[str]] = []
+
+    def synth_many(texts):
+        batches.append(list(texts))
+        return [t.encode() for t in texts]
+
+    pf = Prefetcher(synth_many)
+    try:
+        pf.prefetch(["a", "b", "a"])
+        pf.prefetch(["b"])  # already pending: no new batch
+        assert pf.get("a") == b"a"
+        # "b" comes from the background batch, "c" is synthesized inline
+        assert pf.get_many(["b", "c", "b"]) == [b"b", b"c", b"b"]
+        assert batches == [["a", "b"], ["c"]]
+    finally:
+        pf.shutdown()
+
+
+def _job(name: str, *, due: float = 0.0, priority: int = 0, gate=None) -> PlaybackJob:
+    def clips():
+        if gate is not None:
+            gate.wait(5)
+        return [name.encode()]
+
+    return PlaybackJob(name=name, due=due, clips=clips, priority=priority)
+
+
+def _blocked_queue(played: list[bytes], **kwargs):
+    """A queue whose worker is stuck on a first job until the returned event is set."""
+    gate = threading.Event()
+    q = PlaybackQueue(played.append, **kwargs)
+    q.submit(_job("gate", due=q._clock(), gate=gate))
+    for _ in range(500):
+        if q.stats().depth == 0:
+            break
+        threading.Event().wait(0.01)
+    return q, gate
+
+
+def test_playback_queue_fifo_and_priority():
+    for policy, expected in (("queue", b"abc"), ("priority", b"bca")):
+        played: list[bytes] = []
+        q, gate = _blocked_queue(played, policy=policy)
+        try:
+            q.submit(_job("a", priority=0))
+            q.submit(_job("b", priority=5))
+            q.submit(_job("c", priority=1))
+            gate.set()
+            assert q.join(5)
+            assert b"".join(played[1:]) == expected
+        finally:
+            q.close()
+
+
+def test_playback_queue_drops_stale_and_overflow():
+    played: list[bytes] = []
+    now = [1000.0]
+    q, gate = _blocked_queue(
+        played, policy="drop-stale", stale_sec=30, max_size=2, clock=lambda: now[0]
+    )
+    try:
+        q.submit(_job("old", due=900.0))
+        q.submit(_job("fresh", due=990.0))
+        q.submit(_job("late", due=995.0))  # queue full: the newest is dropped
+        gate.set()
+        assert q.join(5)
+        assert played == [b"gate", b"fresh"]
+        stats = q.stats()
+        assert (stats.dropped_stale, stats.dropped_full, stats.max_depth) == (1, 1, 2)
+        assert stats.played == 2 and stats.max_lag_sec == 10.0
+    finally:
+        q.close()
+
+
+def test_playback_queue_survives_failures():
+    played: list[bytes] = []
+    q = PlaybackQueue(played.append)
+
+    def boom():
+        raise RuntimeError("no audio")
+
+    try:
+        q.submit(PlaybackJob(name="bad", due=0.0, clips=boom))
+        q.submit(_job("good"))
+        assert q.join(5)
+        assert played == [b"good"]
+        assert q.stats().failed == 1
+    finally:
+        q.close()
+
+
+def test_playback_queue_rejects_unknown_policy():
+    with pytest.raises(ValueError, match="Unknown playback policy"):
+        PlaybackQueue(print, policy="lifo")
+
+
+def test_fire_queue_follows_reload():
+    table = ScheduleTable()
+    table.append("A", 7 * 60, 0b1, "a")
+    table.append("B", 7 * 60, 0b1, "b")
+    now = datetime(2024, 1, 1, 7, 0, 10)  # Monday; both fired this minute
+    q = FireQueue(table, now=now)
+    q.pop_due(now)
+    new = ScheduleTable()
+    new.append("A", 7 * 60, 0b1, "a")
+    new.append("B", 7 * 60, 0b1, "edited")
+    new.append("C", 7 * 60, 0b1, "c")
+    update = table.update(new)
+    assert update.unchanged == {0}
+    q.update(update.remap, update.unchanged, now=now)
+    # Only the new entry is still due this minute; the edited one waits a week.
+    assert q.pop_due(now) == [(datetime(2024, 1, 1, 7, 0), 2)]
+    assert sorted(i for _, i in q._heap) == [0, 1, 2]
+    assert q.next_time() == datetime(2024, 1, 8, 7, 0)
+
+
+class _Stop(Exception):
+    pass
+
+
+class FakeClock:
+    """Wall clock for ``run_forever`` that only moves when the loop sleeps.
+
+    ``on_sleep`` runs with the current time at the start of every sleep. The sleep
+    that would pass ``until`` ends the run, after ``settle`` (e.g. waiting for
+    playback to catch up) with the clock still before ``until``.
+    """
+
+    def __init__(
+        self,
+        start: datetime,
+        until: datetime,
+        *,
+        on_sleep: Callable[[datetime], None] = lambda now: None,
+        settle: Callable[[], object] = lambda: None,
+    ) -> None:
+        self.now = start
+        self.until = until
+        self.sleeps: list[float] = []
+        self.on_sleep = on_sleep
+        self.settle = settle
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.on_sleep(self.now)
+        if self.now + timedelta(seconds=seconds) > self.until:
+            self.settle()
+            raise _Stop
+        self.now += timedelta(seconds=seconds)
+
+
+class Texts(Synthesizer):  # type: ignore[misc]
+    """Returns each text as its audio and records what was synthesized."""
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self._lock = threading.Lock()
+
+    def synthesize(self, text: str, **_: object) -> bytes:
+        with self._lock:
+            self.calls.append(text)
+        return text.encode()
+
+
+class Speaker:
+    """Player that records clips; the first one waits for ``gate`` if given."""
+
+    def __init__(self, gate: threading.Event | None = None) -> None:
+        self.played: list[bytes | Path] = []
+        self.gate = gate
+        self.started = threading.Event()
+        self._cond = threading.Condition()
+
+    def prepare(self, audio: bytes | Path, *, encoding: str) -> None:
+        pass
+
+    def play(self, audio: bytes | Path, *, encoding: str) -> None:
+        self.started.set()
+        if self.gate is not None and not self.played:
+            self.gate.wait(5)
+        with self._cond:
+            self.played.append(audio)
+            self._cond.notify_all()
+
+    def wait_for(self, n: int) -> None:
+        with self._cond:
+            self._cond.wait_for(lambda: len(self.played) >= n, 5)
+
+
+MONDAY = datetime(2024, 1, 1)
+
+
+def _at(hh: int, mm: int, ss: int = 0) -> datetime:
+    return MONDAY.replace(hour=hh, minute=mm, second=ss)
+
+
+def _table(*entries: tuple[str, int, int]) -> ScheduleTable:
+    """Monday-only schedules named and spoken by their text, at (text, hh, mm)."""
+    table = ScheduleTable()
+    for text, hh, mm in entries:
+        table.append(text, hh * 60 + mm, 0b1, text)
+    return table
+
+
+def _run(table: ScheduleTable | AppConfig, clock: FakeClock, **kwargs: object) -> PlaybackStats:
+    stats: list[PlaybackStats] = []
+    kwargs.setdefault("player", Speaker())
+    kwargs.setdefault("synthesizer", Texts())
+    with pytest.raises(_Stop):
+        run_forever(
+            table,
+            clock=clock,
+            sleep=clock.sleep,
+            on_stop=stats.append,
+            **kwargs,  # type: ignore[arg-type]
+        )
+    return stats[0]
+
+
+def test_run_forever_event_driven_sleeps_until_each_fire():
+    speaker = Speaker()
+    clock = FakeClock(_at(6, 0), _at(10, 0), settle=lambda: speaker.wait_for(3))
+    table = _table(("a", 7, 0), ("b", 7, 0), ("c", 9, 30))
+    stats = _run(table, clock, event_driven=True, player=speaker)
+    assert speaker.played == [b"a", b"b", b"c"]
+    # One wakeup per fire time; long gaps only add the hourly clock-adjustment check.
+    assert clock.sleeps == [3600, 3600, 3600, 1800, 3600]
+    assert stats.played == 3
+
+
+@pytest.mark.parametrize("cached", [False, True])
+def test_run_forever_accepts_synthesizer_without_synthesize_many(tmp_path: Path, cached: bool):
+    class Plain:  # structural: only ``synthesize``
+        def synthesize(self, text: str, **_: object) -> bytes:
+            return text.encode()
+
+    synthesizer = CachingSynthesizer(Plain(), cache_dir=tmp_path) if cached else Plain()
+    speaker = Speaker()
+    clock = FakeClock(_at(6, 0), _at(8, 0), settle=lambda: speaker.wait_for(2))
+    stats = _run(
+        _table(("a", 7, 0), ("b", 7, 0)),
+        clock,
+        event_driven=True,
+        synthesizer=synthesizer,
+        player=speaker,
+    )
+    assert speaker.played == [b"a", b"b"]
+    assert stats.failed == 0
+
+
+def test_run_forever_polling_fires_each_minute_once():
+    speaker = Speaker()
+    clock = FakeClock(_at(6, 59, 30), _at(7, 2), settle=lambda: speaker.wait_for(2))
+    _run(_table(("a", 7, 0), ("b", 7, 1)), clock, check_interval_sec=10.0, player=speaker)
+    assert speaker.played == [b"a", b"b"]
+    assert set(clock.sleeps) == {10.0} and len(clock.sleeps) == 16
+
+
+def _write_schedules(path: Path, *entries: tuple[str, str]) -> None:
+    schedules = [{"name": t, "time": hhmm, "days": ["mon"], "message": t} for t, hhmm in entries]
+    path.write_text(json.dumps({"schedules": schedules}), encoding="utf-8")
+    # Filesystems with coarse mtimes: make every write look like a change.
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.mark.parametrize("event_driven", [True, False])
+def test_run_forever_reloads_edited_schedule(tmp_path: Path, event_driven: bool):
+    path = tmp_path / "cfg.json"
+    _write_schedules(path, ("a", "07:00"))
+    speaker = Speaker()
+
+    def edit(now: datetime) -> None:
+        if now == _at(7, 0, 30):  # "a" is edited after firing, "b" added for 07:01
+            _write_schedules(path, ("a", "07:00"), ("b", "07:01"))
+
+    clock = FakeClock(_at(6, 59, 30), _at(7, 3), on_sleep=edit, settle=lambda: speaker.wait_for(2))
+    _run(load_table(path), clock, event_driven=event_driven, config_path=path, player=speaker)
+    assert speaker.played == [b"a", b"b"]  # "a" kept its fired-today state
+    # Watching costs a wakeup every reload interval, also when event-driven.
+    assert max(clock.sleeps) <= 2.0
+
+
+def test_run_forever_drops_stale_announcements():
+    gate = threading.Event()
+    speaker = Speaker(gate)
+
+    def release(now: datetime) -> None:
+        if now == _at(7, 0):  # "a" fired: let it start playing on time
+            speaker.started.wait(5)
+        if now == _at(7, 3):  # "a" played for three minutes: "b" is stale, "c" just fired
+            gate.set()
+
+    clock = FakeClock(_at(6, 59), _at(8, 0), on_sleep=release, settle=lambda: speaker.wait_for(2))
+    table = _table(("a", 7, 0), ("b", 7, 1), ("c", 7, 3))
+    stats = _run(
+        table, clock, event_driven=True, playback_policy="drop-stale", stale_sec=30, player=speaker
+    )
+    assert speaker.played == [b"a", b"c"]
+    assert (stats.played, stats.dropped_stale, stats.max_lag_sec) == (2, 1, 0.0)
+
+
+# The voice run_forever requests by default, spelled out for warm_cache.
+VOICE = {"language_code": "ja-JP", "voice_name": None, "speaking_rate": 1.0, "pitch": 0.0}
+
+
+def _warmed(inner: Texts, cache_dir: Path, texts: list[str]) -> CachingSynthesizer:
+    """A cache over ``inner`` holding ``texts``, as a later process (no memory tier) sees it."""
+    warm_cache(
+        CachingSynthesizer(inner, cache_dir=cache_dir),
+        texts,
+        audio_encoding="MP3",
+        **VOICE,  # type: ignore[arg-type]
+    )
+    inner.calls.clear()
+    return CachingSynthesizer(inner, cache_dir=cache_dir)
+
+
+@pytest.mark.parametrize("prefetch_minutes", [0, 5])
+def test_warmed_streaming_run_makes_no_tts_calls(tmp_path: Path, prefetch_minutes: int):
+    table = ScheduleTable()
+    table.append("wake", 7 * 60, 0b1, "Good morning. Take your pills.")
+    table.append("noon", 12 * 60, 0b1, "Lunch. Take your pills.")
+    texts = announcement_texts(table, stream_sentences=True)
+    assert texts == ["Good morning.", "Take your pills.", "Lunch."]
+    inner = Texts()
+    cache = _warmed(inner, tmp_path, texts)
+
+    speaker = Speaker()
+    clock = FakeClock(_at(6, 0), _at(13, 0), settle=lambda: speaker.wait_for(4))
+    _run(
+        table,
+        clock,
+        event_driven=True,
+        stream_sentences=True,
+        prefetch_minutes=prefetch_minutes,
+        synthesizer=cache,
+        player=speaker,
+    )
+    assert len(speaker.played) == 4
+    assert all(isinstance(clip, Path) for clip in speaker.played)  # played from the cache file
+    assert inner.calls == []
+
+
+@pytest.mark.parametrize("prefetch_minutes", [0, 5])
+def test_warmed_merging_run_makes_no_tts_calls(tmp_path: Path, prefetch_minutes: int):
+    table = ScheduleTable()
+    table.append("a", 7 * 60, 0b11, "a")  # with "b" on Monday, alone on Tuesday
+    table.append("b", 7 * 60, 0b1, "b")
+    table.append("c", 9 * 60, 0b1, "c")
+    texts = announcement_texts(table, merge_same_minute=True)
+    assert texts == [merge_ssml(["a", "b"]), "a", "c"]
+    inner = Texts()
+    cache = _warmed(inner, tmp_path, texts)
+
+    speaker = Speaker()
+    clock = FakeClock(_at(6, 0), _at(10, 0), settle=lambda: speaker.wait_for(2))
+    _run(
+        table,
+        clock,
+        event_driven=True,
+        merge_same_minute=True,
+        prefetch_minutes=prefetch_minutes,
+        synthesizer=cache,
+        player=speaker,
+    )
+    assert len(speaker.played) == 2
+    assert all(isinstance(clip, Path) for clip in speaker.played)  # played from the cache file
+    assert inner.calls == []
+
+
+def test_prefetched_file_evicted_before_spawn_is_fetched_again(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    table = _table(("a", 7, 0))
+    inner = Texts()
+    _warmed(inner, tmp_path, ["a"])
+    looked_up: list[Path] = []
+
+    class Evicting(CachingSynthesizer):
+        def cached_file(self, request):  # type: ignore[no-untyped-def]
+            path = super().cached_file(request)
+            if path is not None:
+                looked_up.append(path)
+            return path
+
+    def evict(now: datetime) -> None:
+        if now == _at(6, 55):  # the prefetch is in flight; its clip goes before 07:00
+            for _ in range(200):
+                if looked_up:
+                    break
+                time.sleep(0.01)
+            looked_up[0].unlink()
+
+    played: list[bytes | Path] = []
+    spawned = threading.Event()
+
+    def play_audio(clip: bytes | Path, *, encoding: str, **_: object) -> None:
+        played.append(clip)
+        spawned.set()
+
+    monkeypatch.setattr(scheduler, "play_audio", play_audio)
+    clock = FakeClock(_at(6, 0), _at(8, 0), on_sleep=evict, settle=lambda: spawned.wait(5))
+    stats = _run(
+        table,
+        clock,
+        event_driven=True,
+        prefetch_minutes=5,
+        synthesizer=Evicting(inner, cache_dir=tmp_path),
+        player=None,
+    )
+    assert played == [b"a"]
+    assert inner.calls == ["a"]
+    assert stats.played == 1
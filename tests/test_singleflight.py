@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+import os
+from pathlib import Path
+import threading
+import time
+
+import pytest
+
+from routinenotifier.cache import CacheKey, CachingSynthesizer, FileStore
+from routinenotifier.singleflight import LockFile, SingleFlight
+from routinenotifier.tts import SynthesisRequest
+
+
+class SlowSynth:
+    def __init__(self, delay: float = 0.1) -> None:
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def synthesize(self, text: str, **_: object) -> bytes:
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        return text.encode()
+
+    def synthesize_many(
+        self, items: list[SynthesisRequest], *, max_workers: int = 4
+    ) -> list[bytes]:
+        return [self.synthesize(r.text) for r in items]
+
+
+def test_single_flight_coalesces_and_shares_errors() -> None:
+    flights: SingleFlight[int] = SingleFlight()
+    calls = 0
+    gate = threading.Event()
+
+    def compute() -> int:
+        nonlocal calls
+        calls += 1
+        gate.wait(1)
+        return 42
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(flights.do, "k", compute) for _ in range(8)]
+        time.sleep(0.05)
+        gate.set()
+        assert [f.result() for f in futures] == [42] * 8
+    assert calls == 1 and len(flights) == 0
+
+    def fail() -> int:
+        time.sleep(0.05)
+        raise RuntimeError("boom")
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(flights.do, "k", fail) for _ in range(4)]
+        for f in futures:
+            with pytest.raises(RuntimeError, match="boom"):
+                f.result()
+
+
+def test_concurrent_misses_call_inner_once(tmp_path: Path) -> None:
+    inner = SlowSynth()
+    cache = CachingSynthesizer(inner, cache_dir=tmp_path)  # type: ignore[arg-type]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: cache.synthesize("hi", audio_encoding="MP3"), range(8)))
+    assert results == [b"hi"] * 8
+    assert inner.calls == 1
+    # A batch overlapping an in-flight single call waits for it
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        single = pool.submit(cache.synthesize, "yo", audio_encoding="MP3")
+        time.sleep(0.02)
+        batch = pool.submit(
+            cache.synthesize_many,
+            [
+                SynthesisRequest("yo", audio_encoding="MP3"),
+                SynthesisRequest("x", audio_encoding="MP3"),
+            ],
+        )
+        assert single.result() == b"yo" and batch.result() == [b"yo", b"x"]
+    assert inner.calls == 3
+    assert not list((tmp_path / ".locks").iterdir())
+
+
+def test_waits_for_lock_held_by_another_process(tmp_path: Path) -> None:
+    inner = SlowSynth(delay=0)
+    cache = CachingSynthesizer(inner, cache_dir=tmp_path, memory_max_entries=0)  # type: ignore[arg-type]
+    key = CacheKey("hi", "ja-JP", "ja-JP-Wavenet-A", 1.2, -3.0, "OGG_OPUS")
+    other = LockFile(cache.lock_dir / f"{key.digest()}.lock")
+    assert other.try_acquire()
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pending = pool.submit(cache.synthesize, "hi")
+        time.sleep(0.1)
+        assert not pending.done()
+        FileStore(tmp_path).put(key, b"from elsewhere")
+        assert pending.result(timeout=2) == b"from elsewhere"
+    other.release()
+    assert inner.calls == 0
+
+
+def test_stale_lock_is_broken(tmp_path: Path) -> None:
+    path = tmp_path / "x.lock"
+    path.write_bytes(b"dead")
+    assert not LockFile(path).try_acquire()
+    old = time.time() - 600
+    os.utime(path, (old, old))
+    lock = LockFile(path)
+    assert lock.try_acquire()
+    lock.release()
+    assert not path.exists()
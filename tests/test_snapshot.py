@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from routinenotifier.config import ConfigError
+from routinenotifier.snapshot import load_table_cached, snapshot_key, snapshot_path
+from routinenotifier.table import load_table
+
+
+def _write(p: Path, *messages: str) -> None:
+    entries = [
+        {"name": f"s{i}", "time": "07:00", "days": ["mon"], "message": m}
+        for i, m in enumerate(messages)
+    ]
+    p.write_text(json.dumps({"schedules": entries}), encoding="utf-8")
+
+
+def test_snapshot_round_trip_and_invalidation(tmp_path: Path, monkeypatch) -> None:
+    cfg, cache = tmp_path / "cfg.json", tmp_path / "cache"
+    _write(cfg, "a", "b", "a")
+    first = load_table_cached(cfg, cache)
+    snap = snapshot_path(cfg, cache)
+    assert snap.exists()
+
+    # An unchanged file is served from the snapshot without parsing it.
+    monkeypatch.setattr("routinenotifier.snapshot.parse_table", None)
+    again = load_table_cached(cfg, cache)
+    assert again.rows() == first.rows() and again.pool == ["a", "b"]
+    assert again.due_at(0, 7 * 60) == [0, 1, 2]
+    monkeypatch.undo()
+
+    _write(cfg, "a", "edited")
+    assert load_table_cached(cfg, cache).rows() == load_table(cfg).rows()
+    assert snap.read_bytes()[4:36] == snapshot_key(cfg.read_bytes())
+
+
+def test_bad_snapshot_falls_back_to_the_file(tmp_path: Path) -> None:
+    cfg, cache = tmp_path / "cfg.json", tmp_path / "cache"
+    _write(cfg, "a")
+    load_table_cached(cfg, cache)
+    snap = snapshot_path(cfg, cache)
+    data = snap.read_bytes()
+    snap.write_bytes(data[:-3])  # truncated
+    assert load_table_cached(cfg, cache).rows() == load_table(cfg).rows()
+    assert snap.read_bytes() == data
+
+
+def test_invalid_config_raises_and_writes_nothing(tmp_path: Path) -> None:
+    cfg, cache = tmp_path / "cfg.json", tmp_path / "cache"
+    cfg.write_text('{"schedules": [{"name": "a"}]}', encoding="utf-8")
+    with pytest.raises(ConfigError):
+        load_table_cached(cfg, cache)
+    assert not snapshot_path(cfg, cache).exists()
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+import subprocess
+import sys
+import time
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Modules no lightweight subcommand should import.
+HEAVY = ("pydantic", "google", "routinenotifier.scheduler", "routinenotifier.audio")
+# Wall clock may be at most this multiple of a bare `import typer`; eager imports were ~2.7x.
+MAX_RATIO = 2.0
+
+
+def _run(args: list[str], *, importtime: bool = False) -> tuple[float, set[str]]:
+    """Run ``python *args``; returns wall seconds and the modules it imported."""
+    flags = ["-X", "importtime"] if importtime else []
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join([str(ROOT), os.environ.get("PYTHONPATH", "")]),
+    }
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, *flags, *args], capture_output=True, text=True, env=env, timeout=60
+    )
+    elapsed = time.perf_counter() - start
+    assert proc.returncode == 0, proc.stdout + proc.stderr
+    modules = {
+        line.rsplit("|", 1)[1].strip()
+        for line in proc.stderr.splitlines()
+        if line.startswith("import time:")
+    }
+    return elapsed, modules
+
+
+def _best(args: list[str], runs: int = 3) -> float:
+    return min(_run(args)[0] for _ in range(runs))
+
+
+@pytest.fixture(scope="module")
+def typer_baseline() -> float:
+    return _best(["-c", "import typer"])
+
+
+@pytest.fixture
+def cfg(tmp_path: Path) -> Path:
+    p = tmp_path / "cfg.json"
+    entry = {"name": "a", "time": "07:00", "days": ["mon"], "message": "hi"}
+    p.write_text(json.dumps({"schedules": [entry]}), encoding="utf-8")
+    return p
+
+
+@pytest.mark.parametrize(
+    "command",
+    [
+        ["--help"],
+        ["validate", "{cfg}", "--cache-dir", "{cache}"],
+        ["cache-stats", "--cache-dir", "{cache}", "--json"],
+        ["cache-clear", "-y", "--cache-dir", "{cache}"],
+    ],
+    ids=lambda c: c[0],
+)
+def test_subcommand_startup(
+    command: list[str], cfg: Path, tmp_path: Path, typer_baseline: float
+) -> None:
+    args = ["-m", "routinenotifier.cli"]
+    args += [a.format(cfg=cfg, cache=tmp_path / "cache") for a in command]
+    _run(args)  # a validate run writes the snapshot the timed runs then read
+    _, modules = _run(args, importtime=True)
+    assert "typer" in modules
+    heavy = sorted(m for m in modules if m.split(".")[0] in HEAVY or m in HEAVY)
+    assert not heavy, f"{command[0]} imports {heavy}"
+    assert "routinenotifier.config" not in modules  # no pydantic models for these commands
+    elapsed = _best(args)
+    assert (
+        elapsed <= typer_baseline * MAX_RATIO
+    ), f"{command[0]} took {elapsed:.3f}s vs {typer_baseline:.3f}s for `import typer`"
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from routinenotifier.config import ConfigError, Weekday, load_config
+from routinenotifier.table import ScheduleTable, TableReloader, load_table
+
+
+def _columns(t: ScheduleTable) -> tuple[object, ...]:
+    return [t.row(i) for i in range(len(t))]
+
+
+def _write(tmp_path: Path, data: object) -> Path:
+    p = tmp_path / "cfg.json"
+    p.write_text(json.dumps(data), encoding="utf-8")
+    # Filesystems with coarse mtimes: make every write look like a change.
+    st = p.stat()
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    return p
+
+
+def _entry(name: str, hhmm: str, message: str = "m", days: tuple[str, ...] = ("mon",)) -> dict:
+    return {"name": name, "time": hhmm, "days": list(days), "message": message}
+
+
+def test_load_table_matches_pydantic_path(tmp_path: Path) -> None:
+    entries = [
+        {"name": "a", "time": "07:05", "days": ["mon", "WED", "mon"], "message": "x"},
+        {"name": "b", "time": "7:5", "days": [], "message": "y", "priority": 3},
+        {"name": "c", "time": " 23:59 ", "days": ["sun"], "message": "x", "extra": 1},
+    ]
+    p = _write(tmp_path, {"schedules": entries})
+    table = load_table(p)
+    assert _columns(table) == _columns(ScheduleTable.from_config(load_config(p)))
+    assert (list(table.minutes), list(table.masks)) == ([425, 425, 1439], [0b101, 0, 0b1000000])
+    assert table.days(0) == [Weekday.mon, Weekday.wed]
+    assert table.pool == ["x", "y"] and list(table.message_ids) == [0, 1, 0]
+    assert table.to_config().schedules[1].priority == 3
+
+
+def test_load_table_defers_unusual_input_to_pydantic(tmp_path: Path) -> None:
+    # Valid for the model, but not in the shapes the fast path accepts.
+    entries = [{"name": "a", "time": "07:00", "days": ["Weekday.tue"], "message": "x"}]
+    p = _write(tmp_path, {"schedules": entries})
+    assert list(load_table(p).masks) == [0b10]
+    # A nested object that looks like an entry must not become a row of its own.
+    nested = {"name": "n", "time": "08:00", "days": ["mon"], "message": "y"}
+    p = _write(tmp_path, {"schedules": [{**entries[0], "days": ["tue"], "meta": nested}]})
+    assert load_table(p).names == ["a"]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"schedules": [{"name": "a", "time": "24:00", "days": ["mon"], "message": "x"}]},
+        {"schedules": [{"name": "a", "time": "07:00", "days": ["mo"], "message": "x"}]},
+        {"schedules": [{"name": "a", "time": "07:00", "days": ["mon"]}]},
+        {"schedules": [{"name": 1, "time": "07:00", "days": ["mon"], "message": "x"}]},
+        # Priorities are stored as int64; pydantic must reject what the column cannot hold.
+        {"schedules": [{**_entry("a", "07:00"), "priority": 2**63}]},
+        {"schedules": [{**_entry("a", "07:00"), "priority": -(2**63) - 1}]},
+        {"schedules": "none"},
+        [],
+    ],
+)
+def test_load_table_errors_match_load_config(tmp_path: Path, data: object) -> None:
+    p = _write(tmp_path, data)
+    with pytest.raises(ConfigError) as fast:
+        load_table(p)
+    with pytest.raises(ConfigError) as slow:
+        load_config(p)
+    assert str(fast.value) == str(slow.value)
+
+
+def test_due_at_matches_linear_scan(tmp_path: Path) -> None:
+    days = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+    entries = [_entry(f"s{i}", f"07:0{i % 3}", days=tuple(days[i % 7 :: 2])) for i in range(40)]
+    p = _write(tmp_path, {"schedules": entries})
+    table, cfg = load_table(p), load_config(p)
+    for weekday in range(7):
+        for minute in (420, 421, 422, 423):
+            expected = [
+                i
+                for i, s in enumerate(cfg.schedules)
+                if list(Weekday)[weekday] in s.days and s.time.hour * 60 + s.time.minute == minute
+            ]
+            assert table.due_at(weekday, minute) == expected
+
+
+def test_update_patches_index_and_remaps() -> None:
+    def table(*rows: tuple[str, int, str]) -> ScheduleTable:
+        t = ScheduleTable()
+        for name, minute, message in rows:
+            t.append(name, minute, 0b1, message)
+        return t
+
+    rest = [(f"x{i}", 480, "x") for i in range(10)]
+    t = table(("a", 420, "a"), ("b", 420, "b"), ("c", 420, "c"), *rest)
+    assert t.due_at(0, 420) == [0, 1, 2]
+    update = t.update(table(("a", 420, "a"), ("b", 421, "b"), ("c", 420, "c"), *rest))
+    assert update.remap == {i: i for i in range(13) if i != 1}  # b moved to another minute
+    assert update.unchanged == set(range(13)) - {1}
+    assert (t.due_at(0, 420), t.due_at(0, 421)) == ([0, 2], [1])
+
+    update = t.update(table(("c", 420, "c"), ("a", 420, "a"), ("b", 421, "edited"), *rest))
+    assert (update.remap[0], update.remap[1], update.remap[2]) == (1, 2, 0)
+    assert update.unchanged == set(range(13)) - {2}  # b kept its name and time
+    assert t.due_at(0, 420) == [0, 1] and t.message(2) == "edited"
+
+
+def test_update_appends_and_deletes_patch_index_in_place() -> None:
+    def table(rows: list[tuple[str, int]]) -> ScheduleTable:
+        t = ScheduleTable()
+        for name, minute in rows:
+            t.append(name, minute, 0b1, name)
+        return t
+
+    rows = [(f"r{i}", 420 + i % 7) for i in range(50)]
+    t = table(rows)
+    t.due_at(0, 420)
+    index = t._index
+    edits = [
+        [*rows, ("new1", 421), ("new2", 999)],  # append
+        rows[:20] + rows[21:],  # delete in the middle
+        rows[:40],  # delete at the end
+        [("first", 423), *rows[:40]],  # insert at the front
+    ]
+    for edited in edits:
+        t.update(table(edited))
+        assert t._index is index  # patched, not dropped for a rebuild
+        fresh = table(edited)
+        for minute in (420, 421, 422, 423, 424, 425, 426, 999):
+            assert t.due_at(0, minute) == fresh.due_at(0, minute)
+
+
+def test_reloader_applies_edits(tmp_path: Path) -> None:
+    entries = [_entry("a", "07:00"), _entry("b", "07:30"), _entry("c", "08:00")]
+    p = _write(tmp_path, {"schedules": entries})
+    table = load_table(p)
+    reloader = TableReloader(p, table)
+    assert reloader.poll() is None
+
+    _write(
+        tmp_path,
+        {
+            "schedules": [
+                _entry("new", "06:00"),
+                *entries[:1],
+                _entry("b", "07:30", "edited"),
+                entries[2],
+            ]
+        },
+    )
+    update = reloader.poll()
+    assert update is not None
+    assert update.remap == {0: 1, 1: 2, 2: 3}
+    assert update.unchanged == {1, 3}
+    assert table.names == ["new", "a", "b", "c"] and table.message(2) == "edited"
+    assert table.due_at(0, 6 * 60) == [0]
+
+
+def test_reloader_keeps_table_on_invalid_file(tmp_path: Path) -> None:
+    p = _write(tmp_path, {"schedules": [_entry("a", "07:00")]})
+    table = load_table(p)
+    reloader = TableReloader(p, table)
+    _write(tmp_path, {"schedules": [_entry("a", "07:00"), _entry("bad", "25:00")]})
+    with pytest.raises(ConfigError) as reloaded:
+        reloader.poll()
+    with pytest.raises(ConfigError) as loaded:
+        load_config(p)
+    assert str(reloaded.value) == str(loaded.value)
+    assert table.names == ["a"]
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+from routinenotifier.tts import (
+    DummyTTS,
+    GoogleTTS,
+    SynthesisRequest,
+    merge_ssml,
+    split_merged,
+    split_sentences,
+    synthesize_stream,
+)
+
+pytest.importorskip("google.cloud.texttospeech")
+
+
+class FakeResponse:
+    def __init__(self, audio_content: bytes) -> None:
+        self.audio_content = audio_content
+
+
+class FakeClient:
+    def __init__(self) -> None:
+        self.requests: list[dict[str, Any]] = []
+
+    def synthesize_speech(self, **kwargs: Any) -> FakeResponse:
+        self.requests.append(kwargs)
+        return FakeResponse(kwargs["input"].text.encode())
+
+
+def test_google_tts_creates_client_once() -> None:
+    created: list[FakeClient] = []
+
+    def factory() -> FakeClient:
+        c = FakeClient()
+        created.append(c)
+        return c
+
+    tts = GoogleTTS(client_factory=factory)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        out = list(pool.map(lambda t: tts.synthesize(t, audio_encoding="MP3"), ["a", "b"] * 20))
+    assert out == [b"a", b"b"] * 20
+    assert len(created) == 1
+    assert len(created[0].requests) == 40
+
+
+def test_google_tts_reuses_request_params() -> None:
+    client = FakeClient()
+    tts = GoogleTTS(client=client)
+    tts.synthesize("a", voice_name="v", speaking_rate=1.0, pitch=0.0, audio_encoding="MP3")
+    tts.synthesize("b", voice_name="v", speaking_rate=1.0, pitch=0.0, audio_encoding="mp3")
+    tts.synthesize("c", voice_name="v", speaking_rate=1.1, pitch=0.0, audio_encoding="MP3")
+    r1, r2, r3 = client.requests
+    assert r1["voice"] is r2["voice"] is r3["voice"]
+    assert r1["audio_config"] is r2["audio_config"]
+    assert r3["audio_config"] is not r1["audio_config"]
+
+
+def test_google_tts_rejects_unknown_encoding() -> None:
+    tts = GoogleTTS(client=FakeClient())
+    with pytest.raises(ValueError):
+        tts.synthesize("a", audio_encoding="FLAC")
+
+
+def test_synthesize_many_preserves_order_and_dedupes() -> None:
+    client = FakeClient()
+    tts = GoogleTTS(client=client)
+    items = [SynthesisRequest(t, audio_encoding="MP3") for t in ["x", "y", "x", "z"]]
+    assert tts.synthesize_many(items, max_workers=2) == [b"x", b"y", b"x", b"z"]
+    assert sorted(r["input"].text for r in client.requests) == ["x", "y", "z"]
+
+
+def test_dummy_synthesize_many() -> None:
+    out = DummyTTS().synthesize_many([SynthesisRequest("a"), SynthesisRequest("b")])
+    assert len(out) == 2 and out[0] == out[1]
+
+
+def test_split_sentences_handles_japanese_and_decimals() -> None:
+    text = "おはようございます。今日は晴れ！気温は3.5度です? Take care.  Bye"
+    assert split_sentences(text) == [
+        "おはようございます。",
+        "今日は晴れ！",
+        "気温は3.5度です?",
+        "Take care.",
+        "Bye",
+    ]
+
+
+def test_synthesize_stream_yields_first_chunk_early() -> None:
+    import time
+
+    def fetch(chunk: str) -> bytes:
+        time.sleep(0.02 if chunk == "a" else 0.2)
+        return chunk.encode()
+
+    start = time.perf_counter()
+    stream = synthesize_stream(fetch, ["a", "b", "c"], max_workers=2)
+    assert next(stream) == b"a"
+    assert time.perf_counter() - start < 0.15
+    assert list(stream) == [b"b", b"c"]
+
+
+def test_merge_ssml_round_trips_and_is_sent_as_ssml() -> None:
+    ssml = merge_ssml(["a < b & c", "次です。"], break_ms=300)
+    assert ssml == '<speak>a &lt; b &amp; c<break time="300ms"/>次です。</speak>'
+    assert split_merged(ssml) == (["a < b & c", "次です。"], 300)
+    assert split_merged("plain text") is None
+    assert split_merged("<speak>a<emphasis>b</emphasis></speak>") is None
+
+    client = FakeClient()
+    tts = GoogleTTS(client=client)
+    tts.synthesize(ssml, audio_encoding="MP3")
+    tts.synthesize("plain", audio_encoding="MP3")
+    merged, plain = client.requests
+    assert merged["input"].ssml == ssml and not merged["input"].text
+    assert plain["input"].text == "plain"